@@ -0,0 +1,186 @@
+# File: access_patterns.py
+# Deskripsi: Generator urutan akses halaman yang dibaca secara lazy (streaming).
+# Setiap pola ditentukan oleh seed per proses sehingga simulasi panjang dapat
+# direproduksi tanpa menyimpan seluruh urutan akses di memori.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import random
+from functools import lru_cache
+from itertools import accumulate, islice
+
+
+class AccessPattern:
+    """
+    Kelas dasar pola akses halaman.
+
+    Objek pola berperilaku seperti urutan read-only: memiliki `len()` dan bisa
+    diiterasi berulang kali. Setiap iterasi dimulai ulang dari seed yang sama,
+    sehingga urutannya selalu identik. Halaman dibangkitkan per batch
+    (BATCH_SIZE akses per panggilan ke `random`) lalu dikonsumsi satu per satu.
+    """
+    BATCH_SIZE = 4096
+    # Satu objek pola per proses: tanpa __dict__ agar ratusan ribu proses tetap ringan
+    __slots__ = ('num_pages', 'length', 'seed')
+
+    def __init__(self, num_pages: int, length: int, seed: int | None = None):
+        """
+        Args:
+            num_pages (int): Jumlah halaman virtual proses.
+            length (int): Jumlah total akses (biasanya sama dengan burst time).
+            seed (int | None): Seed generator. Jika None, seed diambil acak.
+        """
+        if num_pages <= 0:
+            raise ValueError("Jumlah halaman harus lebih besar dari 0")
+        self.num_pages = num_pages
+        self.length = length
+        self.seed = seed if seed is not None else random.getrandbits(64)
+
+    def _batches(self, rng: random.Random):
+        """Generator tak hingga yang menghasilkan list halaman per batch."""
+        raise NotImplementedError
+
+    def __iter__(self):
+        remaining = self.length
+        if remaining <= 0:
+            return
+        for batch in self._batches(random.Random(self.seed)):
+            if len(batch) >= remaining:
+                yield from batch[:remaining]
+                return
+            yield from batch
+            remaining -= len(batch)
+
+    def iter_from(self, start: int):
+        """Iterator yang dimulai dari akses ke-`start` (dipakai saat melanjutkan proses)."""
+        return islice(iter(self), start, None)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(pages={self.num_pages}, "
+                f"length={self.length}, seed={self.seed})")
+
+
+class UniformPattern(AccessPattern):
+    """Akses acak seragam ke semua halaman (perilaku default lama, tanpa lokalitas)."""
+    __slots__ = ()
+
+    def _batches(self, rng: random.Random):
+        population = range(self.num_pages)
+        while True:
+            yield rng.choices(population, k=self.BATCH_SIZE)
+
+
+class SequentialPattern(AccessPattern):
+    """Akses berurutan 0, s, 2s, ... (mod jumlah halaman) dengan langkah `stride`."""
+    __slots__ = ('stride',)
+
+    def __init__(self, num_pages: int, length: int, seed: int | None = None, stride: int = 1):
+        super().__init__(num_pages, length, seed)
+        self.stride = stride
+
+    def _batches(self, rng: random.Random):
+        position = 0
+        while True:
+            end = position + self.BATCH_SIZE
+            yield [(i * self.stride) % self.num_pages for i in range(position, end)]
+            position = end
+
+
+class ZipfPattern(AccessPattern):
+    """
+    Akses dengan distribusi Zipf: halaman ke-k diakses dengan peluang
+    sebanding 1 / (k + 1)^alpha, sehingga halaman bernomor kecil "panas".
+    """
+    __slots__ = ('alpha',)
+
+    def __init__(self, num_pages: int, length: int, seed: int | None = None, alpha: float = 1.0):
+        super().__init__(num_pages, length, seed)
+        self.alpha = alpha
+
+    def _batches(self, rng: random.Random):
+        cum_weights = _zipf_cum_weights(self.num_pages, self.alpha)
+        population = range(self.num_pages)
+        while True:
+            yield rng.choices(population, cum_weights=cum_weights, k=self.BATCH_SIZE)
+
+
+@lru_cache(maxsize=64)
+def _zipf_cum_weights(num_pages: int, alpha: float) -> tuple:
+    """Bobot kumulatif Zipf, dihitung sekali dan dipakai bersama oleh semua proses berukuran sama."""
+    return tuple(accumulate(1.0 / (k + 1) ** alpha for k in range(num_pages)))
+
+
+class LoopPattern(AccessPattern):
+    """Mengulang-ulang sebuah loop berisi `loop_size` halaman berurutan mulai `start_page`."""
+    __slots__ = ('loop_size', 'start_page')
+
+    def __init__(self, num_pages: int, length: int, seed: int | None = None,
+                 loop_size: int | None = None, start_page: int = 0):
+        super().__init__(num_pages, length, seed)
+        self.loop_size = min(loop_size or num_pages, num_pages)
+        self.start_page = start_page
+
+    def _batches(self, rng: random.Random):
+        loop = [(self.start_page + i) % self.num_pages for i in range(self.loop_size)]
+        repeat = max(1, self.BATCH_SIZE // self.loop_size)
+        batch = loop * repeat
+        while True:
+            yield batch
+
+
+class PhasePattern(AccessPattern):
+    """
+    Model working set berfase: setiap fase sepanjang `phase_length` akses
+    memilih jendela `working_set_size` halaman berurutan secara acak,
+    lalu mengakses halaman di dalam jendela tersebut secara seragam.
+    """
+    __slots__ = ('working_set_size', 'phase_length')
+
+    def __init__(self, num_pages: int, length: int, seed: int | None = None,
+                 working_set_size: int | None = None, phase_length: int = 1000):
+        super().__init__(num_pages, length, seed)
+        if phase_length < 1:
+            raise ValueError("Panjang fase harus bilangan positif")
+        self.working_set_size = min(working_set_size or max(1, num_pages // 10), num_pages)
+        self.phase_length = phase_length
+
+    def _batches(self, rng: random.Random):
+        window = range(self.working_set_size)
+        max_offset = self.num_pages - self.working_set_size
+        while True:
+            offset = rng.randint(0, max_offset)
+            remaining = self.phase_length
+            while remaining > 0:
+                count = min(self.BATCH_SIZE, remaining)
+                yield [offset + page for page in rng.choices(window, k=count)]
+                remaining -= count
+
+
+# Registry pola akses berdasarkan nama
+ACCESS_PATTERNS = {
+    'UNIFORM': UniformPattern,
+    'SEQUENTIAL': SequentialPattern,
+    'ZIPF': ZipfPattern,
+    'LOOP': LoopPattern,
+    'PHASE': PhasePattern,
+}
+
+
+def create_access_pattern(name: str, num_pages: int, length: int,
+                          seed: int | None = None, **options) -> AccessPattern:
+    """
+    Membuat pola akses berdasarkan nama.
+
+    Args:
+        name (str): 'UNIFORM', 'SEQUENTIAL', 'ZIPF', 'LOOP', atau 'PHASE'.
+        num_pages (int): Jumlah halaman virtual proses.
+        length (int): Jumlah total akses.
+        seed (int | None): Seed generator per proses.
+        **options: Parameter khusus pola (mis. alpha, loop_size, phase_length).
+    """
+    pattern_class = ACCESS_PATTERNS.get(name.upper())
+    if pattern_class is None:
+        raise ValueError(f"Pola akses harus salah satu dari {list(ACCESS_PATTERNS)}")
+    return pattern_class(num_pages, length, seed, **options)
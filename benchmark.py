@@ -0,0 +1,597 @@
+# File: benchmark.py
+# Deskripsi: Script benchmark sederhana untuk jalur-jalur "panas" simulator.
+# Dipakai untuk memastikan throughput akses memori tetap stabil ketika
+# jumlah frame diperbesar.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from core_models import PhysicalMemory, Process
+from cpu_scheduler import CPUScheduler
+from scheduling_policies import SCHEDULING_POLICIES
+from event_sinks import RingBufferSink
+from memory_manager import MemoryManager
+from profiling import Profiler
+from simulation_engine import SimulationEngine
+from sweep import run_sweep
+from working_set import PFFController
+
+
+def bench_access_throughput(algorithm: str, total_frames: int, num_accesses: int = 200_000,
+                            working_set_ratio: float = 1.0, seed: int = 0) -> float:
+    """
+    Mengukur throughput `access_page` (akses per detik) untuk satu konfigurasi.
+
+    Memori dibuat penuh terlebih dahulu (fase warm-up tidak diukur). Dengan
+    working_set_ratio = 1.0 semua akses yang diukur adalah hit, sehingga yang
+    terukur murni biaya bookkeeping algoritma (mis. "touch" LRU). Nilai > 1.0
+    menambahkan page fault ke dalam campuran.
+
+    Returns:
+        float: Jumlah akses per detik.
+    """
+    rng = random.Random(seed)
+    num_pages = max(total_frames, int(total_frames * working_set_ratio))
+
+    Process.reset_id_counter()
+    process = Process(burst_time=1, process_size=num_pages * 4096)
+    mm = MemoryManager(total_frames=total_frames, replacement_algorithm=algorithm)
+    mm.register_process(process)
+
+    # Warm-up: isi semua frame
+    for page in range(total_frames):
+        mm.access_page(process, page)
+
+    pages = rng.choices(range(num_pages), k=num_accesses)
+    access_page = mm.access_page
+
+    start = time.perf_counter()
+    for page in pages:
+        access_page(process, page)
+    elapsed = time.perf_counter() - start
+    return num_accesses / elapsed
+
+
+def bench_batch_replay(algorithm: str = 'LRU', total_frames: int = 1_000,
+                       num_accesses: int = 1_000_000, seed: int = 0) -> tuple[float, float]:
+    """
+    Membandingkan replay trace lewat loop `access_page` vs satu panggilan `access_many`.
+
+    Returns:
+        tuple[float, float]: (detik untuk access_page, detik untuk access_many).
+    """
+    rng = random.Random(seed)
+    num_pages = total_frames * 2
+    pages = rng.choices(range(num_pages), k=num_accesses)
+
+    timings = []
+    for batched in (False, True):
+        Process.reset_id_counter()
+        process = Process(burst_time=1, process_size=num_pages * 4096)
+        mm = MemoryManager(total_frames=total_frames, replacement_algorithm=algorithm)
+        mm.register_process(process)
+        start = time.perf_counter()
+        if batched:
+            mm.access_many(process, pages)
+        else:
+            access_page = mm.access_page
+            for page in pages:
+                access_page(process, page)
+        timings.append(time.perf_counter() - start)
+    return timings[0], timings[1]
+
+
+def bench_result_modes(algorithm: str = 'LRU', total_frames: int = 1_000,
+                       num_accesses: int = 500_000, seed: int = 0) -> dict:
+    """
+    Membandingkan biaya per akses untuk setiap cara memakai MemoryManager:
+    dict hasil (`access_page`), mode cepat counter saja (`access`), batch
+    (`access_many`), dan mode cepat dengan RingBufferSink terpasang.
+
+    Returns:
+        dict: {mode: akses_per_detik}.
+    """
+    rng = random.Random(seed)
+    num_pages = total_frames * 2
+    pages = rng.choices(range(num_pages), k=num_accesses)
+
+    results = {}
+    for mode in ('access_page', 'access', 'access_many', 'access+ring_buffer'):
+        Process.reset_id_counter()
+        process = Process(burst_time=1, process_size=num_pages * 4096)
+        mm = MemoryManager(total_frames=total_frames, replacement_algorithm=algorithm)
+        mm.register_process(process)
+        if mode == 'access+ring_buffer':
+            mm.subscribe(RingBufferSink(4096))
+        start = time.perf_counter()
+        if mode == 'access_many':
+            mm.access_many(process, pages)
+        else:
+            access = mm.access_page if mode == 'access_page' else mm.access
+            for page in pages:
+                access(process, page)
+        results[mode] = num_accesses / (time.perf_counter() - start)
+    return results
+
+
+def compare_replacement_policies(algorithms=('FIFO', 'LRU', 'CLOCK', 'ENHANCED_CLOCK', 'AGING', 'NFU', 'OPT'),
+                                 total_frames: int = 256, num_pages: int = 1024,
+                                 num_accesses: int = 200_000, seed: int = 0) -> dict:
+    """
+    Menjalankan trace yang sama (pola Zipf, 20% akses tulis) pada setiap policy.
+
+    Returns:
+        dict: {algoritma: (hit_ratio, akses_per_detik)}.
+    """
+    Process.reset_id_counter()
+    template = Process(burst_time=num_accesses, process_size=num_pages * 4096,
+                       access_pattern='ZIPF', seed=seed)
+    pages = list(template.page_access_sequence)
+    writes = [random.Random(seed).random() < 0.2 for _ in pages]
+    reference_trace = [(template.process_id, page) for page in pages]
+
+    results = {}
+    for algorithm in algorithms:
+        Process.reset_id_counter()
+        process = Process(burst_time=num_accesses, process_size=num_pages * 4096, page_table_mode='SPARSE')
+        mm = MemoryManager(total_frames=total_frames, replacement_algorithm=algorithm,
+                           reference_trace=reference_trace)
+        mm.register_process(process)
+        access_page = mm.access_page
+        start = time.perf_counter()
+        for page, is_write in zip(pages, writes):
+            access_page(process, page, is_write)
+        elapsed = time.perf_counter() - start
+        results[algorithm] = (mm.statistics.get_hit_ratio(), num_accesses / elapsed)
+    return results
+
+
+def compare_load_control(num_processes: int = 6, loop_size: int = 8, total_frames: int = 24,
+                         burst_time: int = 2_000, fault_latency: int = 10, window: int = 50,
+                         check_interval: int = 50) -> dict:
+    """
+    Menjalankan campuran proses yang total working set-nya melebihi memori
+    (overcommit) di bawah RR, sekali tanpa dan sekali dengan load control PFF.
+
+    Returns:
+        dict: {"without": ringkasan, "with": ringkasan, "recovered_throughput": rasio}.
+            Ringkasan berisi total_time, throughput (burst per detik), hit_ratio,
+            jumlah episode thrashing, dan jumlah suspend.
+    """
+    summaries = {}
+    for label, load_control in (("without", False), ("with", True)):
+        Process.reset_id_counter()
+        processes = [Process(burst_time=burst_time, process_size=4096 * 64, access_pattern='LOOP', seed=i,
+                             pattern_options={"loop_size": loop_size})
+                     for i in range(num_processes)]
+        scheduler = CPUScheduler(algorithm='RR', process_list=processes)
+        mm = MemoryManager(total_frames=total_frames, replacement_algorithm='LRU')
+        controller = PFFController(scheduler, mm, window=window, check_interval=check_interval,
+                                   load_control=load_control)
+        results = SimulationEngine(scheduler, mm, fault_latency=fault_latency, load_controller=controller).run()
+        summaries[label] = {
+            "total_time": results["total_time"],
+            "throughput": num_processes * burst_time / results["total_time"],
+            "hit_ratio": results["statistics"].get_hit_ratio(),
+            "thrashing_episodes": len(results["load_control"]["thrashing_episodes"]),
+            "suspensions": results["load_control"]["suspensions"],
+        }
+    summaries["recovered_throughput"] = summaries["with"]["throughput"] / summaries["without"]["throughput"]
+    return summaries
+
+
+def profile_simulation(replacement_algorithms=('FIFO', 'LRU', 'CLOCK', 'AGING'),
+                       scheduling_algorithms=('RR', 'SJF', 'MLFQ'), num_processes: int = 8,
+                       burst_time: int = 2_000, total_frames: int = 64, fault_latency: int = 2) -> Profiler:
+    """
+    Menjalankan simulasi yang sama untuk setiap kombinasi algoritma dengan
+    Profiler terpasang, sehingga waktu per fase terkumpul per algoritma.
+
+    Returns:
+        Profiler: Profiler berisi timer untuk setiap algoritma (lihat Profiler.report()).
+    """
+    profiler = Profiler()
+    for replacement_algorithm in replacement_algorithms:
+        for scheduling_algorithm in scheduling_algorithms:
+            Process.reset_id_counter()
+            processes = [Process(burst_time=burst_time, process_size=4096 * 128, access_pattern='ZIPF', seed=i)
+                         for i in range(num_processes)]
+            scheduler = CPUScheduler(scheduling_algorithm, processes, time_quantum=4)
+            mm = MemoryManager(total_frames=total_frames, replacement_algorithm=replacement_algorithm)
+            profiler.attach_memory_manager(mm)
+            profiler.attach_scheduler(scheduler)
+            SimulationEngine(scheduler, mm, fault_latency=fault_latency).run()
+            profiler.detach()
+    return profiler
+
+
+def bench_sweep_scaling(worker_counts=None, seeds: int = 8) -> dict:
+    """
+    Menjalankan grid sweep yang sama dengan jumlah worker berbeda.
+
+    Returns:
+        dict: {jumlah_worker: detik}.
+    """
+    grid = {"replacement_algorithm": ['FIFO', 'LRU', 'CLOCK'], "total_frames": [16, 64],
+            "scheduling_algorithm": ['RR', 'SJF'], "seed": range(seeds)}
+    cpu_count = os.cpu_count() or 1
+    worker_counts = worker_counts or sorted({1, 2, cpu_count} | {count for count in (4, 8) if count <= cpu_count})
+    timings = {}
+    for workers in worker_counts:
+        start = time.perf_counter()
+        run_sweep(grid, workers=workers)
+        timings[workers] = time.perf_counter() - start
+    return timings
+
+
+def measure_frame_table_bytes_per_frame(total_frames: int, compact: bool) -> float:
+    """
+    Mengukur memori (byte per frame) dari PhysicalMemory yang terisi penuh,
+    untuk membandingkan tabel frame dict vs CompactFrameTable.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    memory = PhysicalMemory(total_frames, compact=compact)
+    for frame in range(total_frames):
+        memory.frames.load(frame, "P0", frame)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / total_frames
+
+
+def run_scaling_benchmark(frame_counts=(100, 1_000, 10_000, 20_000), num_accesses: int = 200_000):
+    """Mencetak tabel throughput FIFO vs LRU untuk berbagai jumlah frame."""
+    print(f"{'Frames':>10} | {'FIFO (akses/detik)':>20} | {'LRU (akses/detik)':>20}")
+    print("-" * 57)
+    for total_frames in frame_counts:
+        fifo = bench_access_throughput('FIFO', total_frames, num_accesses)
+        lru = bench_access_throughput('LRU', total_frames, num_accesses)
+        print(f"{total_frames:>10} | {fifo:>20,.0f} | {lru:>20,.0f}")
+
+
+def run_frame_table_memory_benchmark(total_frames: int = 100_000):
+    """Mencetak perbandingan memori per frame antara tabel dict dan tabel compact."""
+    dict_bytes = measure_frame_table_bytes_per_frame(total_frames, compact=False)
+    compact_bytes = measure_frame_table_bytes_per_frame(total_frames, compact=True)
+    print(f"Memori per frame ({total_frames} frame): dict={dict_bytes:.1f} B, "
+          f"compact={compact_bytes:.1f} B ({dict_bytes / compact_bytes:.1f}x lebih hemat)")
+
+
+def run_batch_benchmark(num_accesses: int = 1_000_000):
+    """Mencetak perbandingan waktu replay per-akses vs batch."""
+    for algorithm in ('FIFO', 'LRU'):
+        single, batched = bench_batch_replay(algorithm, num_accesses=num_accesses)
+        print(f"Replay {num_accesses} akses ({algorithm}): access_page={single:.2f} s, "
+              f"access_many={batched:.2f} s ({single / batched:.1f}x lebih cepat)")
+
+
+def run_result_mode_benchmark():
+    """Mencetak throughput access_page vs mode cepat vs batch vs mode cepat + event sink."""
+    for mode, throughput in bench_result_modes().items():
+        print(f"{mode:>20}: {throughput:>12,.0f} akses/detik")
+
+
+def run_policy_comparison():
+    """Mencetak hit ratio dan throughput setiap policy replacement pada trace yang sama."""
+    print(f"{'Algoritma':>15} | {'Hit ratio':>9} | {'akses/detik':>12}")
+    print("-" * 43)
+    for algorithm, (hit_ratio, throughput) in compare_replacement_policies().items():
+        print(f"{algorithm:>15} | {hit_ratio:>9.2%} | {throughput:>12,.0f}")
+
+
+def run_sweep_scaling_benchmark():
+    """Mencetak waktu sweep dan speedup terhadap jumlah worker terkecil."""
+    timings = bench_sweep_scaling()
+    baseline = timings[min(timings)]
+    for workers, elapsed in timings.items():
+        print(f"Sweep dengan {workers:>2} worker: {elapsed:.2f} s ({baseline / elapsed:.2f}x)")
+
+
+def run_load_control_comparison():
+    """Mencetak throughput campuran proses yang thrashing, tanpa dan dengan load control."""
+    comparison = compare_load_control()
+    for label in ("without", "with"):
+        summary = comparison[label]
+        print(f"Load control {label:>7}: total={summary['total_time']}, throughput={summary['throughput']:.2f}, "
+              f"hit ratio={summary['hit_ratio']:.2%}, episode thrashing={summary['thrashing_episodes']}, "
+              f"suspend={summary['suspensions']}")
+    print(f"Throughput yang dipulihkan: {comparison['recovered_throughput']:.2f}x")
+
+
+def bench_snapshot_branching(num_processes: int = 20, burst_time: int = 3_000, prefix_time: int = 20_000,
+                             variants=('FIFO', 'CLOCK', 'AGING')) -> dict:
+    """
+    Membandingkan dua cara menyiapkan kelanjutan dengan algoritma replacement
+    berbeda dari state hangat di tick `prefix_time`: mensimulasikan ulang
+    prefix untuk setiap cabang, atau restore dari satu snapshot.
+
+    Returns:
+        dict: {"rerun_prefix": detik, "snapshot": detik (termasuk capture), "speedup": rasio,
+               "snapshot_bytes": ukuran bentuk serial}.
+    """
+    def build(algorithm: str) -> SimulationEngine:
+        Process.reset_id_counter()
+        processes = [Process(burst_time=burst_time, process_size=4096 * 512, access_pattern='ZIPF', seed=i)
+                     for i in range(num_processes)]
+        return SimulationEngine(CPUScheduler('RR', processes), MemoryManager(128, algorithm), fault_latency=2)
+
+    start = time.perf_counter()
+    for algorithm in variants:
+        build(algorithm).run(max_time=prefix_time)
+    rerun = time.perf_counter() - start
+
+    engine = build('LRU')
+    engine.run(max_time=prefix_time)
+    start = time.perf_counter()
+    snapshot = engine.snapshot()
+    for algorithm in variants:
+        snapshot.restore(replacement_algorithm=algorithm)
+    branched = time.perf_counter() - start
+    return {"rerun_prefix": rerun, "snapshot": branched, "speedup": rerun / branched,
+            "snapshot_bytes": len(snapshot.to_bytes())}
+
+
+def run_snapshot_benchmark():
+    """Mencetak biaya menyiapkan cabang what-if: ulang prefix vs restore snapshot."""
+    result = bench_snapshot_branching()
+    print(f"Cabang dari state hangat: ulang prefix={result['rerun_prefix']:.3f} s, "
+          f"snapshot={result['snapshot']:.3f} s ({result['speedup']:.1f}x), "
+          f"snapshot serial={result['snapshot_bytes']:,} B")
+
+def run_profile_breakdown():
+    """Mencetak porsi waktu simulator per fase untuk setiap algoritma."""
+    print(profile_simulation().format_report())
+
+
+# --- Suite benchmark dengan output JSON dan mode pembanding baseline ---
+
+SUITE_VERSION = 1
+
+# Konfigurasi suite: ukuran "full" untuk pengukuran sungguhan, "quick" untuk smoke test
+SUITE_SIZES = {
+    "full": {"frame_counts": (64, 1_024, 16_384), "num_accesses": 200_000,
+             "queue_sizes": (10, 1_000, 100_000), "num_selections": 100_000,
+             "process_pages": (16, 1_024, 65_536), "num_processes": 200, "memory_frames": 100_000,
+             "memory_processes": 100_000},
+    "quick": {"frame_counts": (16, 256), "num_accesses": 5_000,
+              "queue_sizes": (10, 1_000), "num_selections": 2_000,
+              "process_pages": (16, 1_024), "num_processes": 20, "memory_frames": 1_000,
+              "memory_processes": 5_000},
+}
+
+
+def bench_scheduler_selections(algorithm: str, queue_size: int, num_selections: int = 100_000) -> float:
+    """
+    Mengukur keputusan penjadwalan per detik (select_next_process + tick)
+    dengan `queue_size` proses siap yang tidak pernah selesai. Kuantum 1
+    membuat RR/MLFQ merotasi antrian pada setiap keputusan.
+
+    Returns:
+        float: Jumlah keputusan per detik.
+    """
+    Process.reset_id_counter()
+    rng = random.Random(queue_size)
+    processes = [Process(burst_time=10 ** 9, process_size=4096, priority=rng.randrange(32), page_table_mode='SPARSE',
+                         access_pattern='UNIFORM', seed=i)
+                 for i in range(queue_size)]
+    scheduler = CPUScheduler(algorithm, processes, time_quantum=1)
+    select_next_process = scheduler.select_next_process
+    tick = scheduler.tick
+    start = time.perf_counter()
+    for _ in range(num_selections):
+        select_next_process().burst_time_remaining -= 1
+        tick()
+    return num_selections / (time.perf_counter() - start)
+
+
+def bench_process_creation(num_pages: int, page_table_mode: str = 'DENSE', num_processes: int = 200) -> float:
+    """
+    Mengukur biaya membuat satu Process (mikrodetik) untuk ukuran proses tertentu.
+    """
+    Process.reset_id_counter()
+    start = time.perf_counter()
+    for i in range(num_processes):
+        Process(burst_time=100, process_size=num_pages * 4096, page_table_mode=page_table_mode,
+                access_pattern='UNIFORM', seed=i)
+    return (time.perf_counter() - start) / num_processes * 1e6
+
+
+def measure_process_bytes(num_processes: int = 100_000, page_table_mode: str = 'SPARSE',
+                          dict_baseline: bool = False) -> float:
+    """
+    Memori (byte) per Process untuk workload besar: proses dengan pola akses
+    lazy dan page table `page_table_mode`, ditambah CPUScheduler yang memegangnya.
+    Dengan `dict_baseline`, atribut setiap proses disalin ke dict biasa sebagai
+    pembanding (tanpa scheduler, yang tidak bisa memegang dict).
+    """
+    Process.reset_id_counter()
+    tracemalloc.start()
+    processes = [Process(burst_time=100, process_size=64 * 4096, page_table_mode=page_table_mode,
+                         access_pattern='UNIFORM', seed=i)
+                 for i in range(num_processes)]
+    if dict_baseline:
+        processes = [{name: getattr(process, name) for name in Process.__slots__} for process in processes]
+        scheduler = None
+    else:
+        # Scheduler tetap dirujuk sampai memori dibaca agar struktur antriannya ikut terhitung
+        scheduler = CPUScheduler('FCFS', processes)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del scheduler
+    return current / num_processes
+
+
+def measure_simulation_peak_memory(total_frames: int = 100_000, compact: bool = False) -> int:
+    """
+    Memori puncak (byte) untuk membangun MemoryManager berisi `total_frames`
+    frame dan menjalankan simulasi kecil yang mengisi semua frame.
+    """
+    tracemalloc.start()
+    Process.reset_id_counter()
+    process = Process(burst_time=total_frames, process_size=total_frames * 4096, page_table_mode='SPARSE',
+                      access_pattern='SEQUENTIAL')
+    mm = MemoryManager(total_frames=total_frames, replacement_algorithm='LRU', compact_frames=compact)
+    mm.register_process(process)
+    mm.access_many(process, process.page_access_sequence)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_suite(size: str = 'full') -> dict:
+    """
+    Menjalankan seluruh suite benchmark.
+
+    Returns:
+        dict: {"meta": {...}, "results": {nama: {"value", "unit", "higher_is_better"}}}.
+            Nama hasil berbentuk "grup/parameter=nilai", stabil antar versi agar
+            dapat dibandingkan dengan baseline.
+    """
+    if size not in SUITE_SIZES:
+        raise ValueError(f"Ukuran suite harus salah satu dari {list(SUITE_SIZES)}")
+    config = SUITE_SIZES[size]
+    results = {}
+
+    def record(name: str, value: float, unit: str, higher_is_better: bool):
+        results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+    # 1. Throughput akses per algoritma replacement vs jumlah frame (campuran hit/fault)
+    for algorithm in ('FIFO', 'LRU', 'CLOCK', 'ENHANCED_CLOCK', 'AGING', 'NFU'):
+        for total_frames in config["frame_counts"]:
+            record(f"access_page/{algorithm}/frames={total_frames}",
+                   bench_access_throughput(algorithm, total_frames, config["num_accesses"], working_set_ratio=1.5),
+                   "akses/detik", True)
+
+    # 2. Keputusan penjadwalan per detik vs ukuran antrian siap
+    for algorithm in SCHEDULING_POLICIES:
+        for queue_size in config["queue_sizes"]:
+            record(f"select_next_process/{algorithm}/queue={queue_size}",
+                   bench_scheduler_selections(algorithm, queue_size, config["num_selections"]),
+                   "keputusan/detik", True)
+
+    # 3. Biaya pembuatan Process vs ukuran proses
+    for page_table_mode in ('DENSE', 'SPARSE'):
+        for num_pages in config["process_pages"]:
+            record(f"process_creation/{page_table_mode}/pages={num_pages}",
+                   bench_process_creation(num_pages, page_table_mode, config["num_processes"]),
+                   "mikrodetik", False)
+
+    # 4. Memori puncak
+    for compact in (False, True):
+        record(f"peak_memory/{'compact' if compact else 'dict'}/frames={config['memory_frames']}",
+               measure_simulation_peak_memory(config["memory_frames"], compact), "byte", False)
+    record(f"peak_memory/per_process/processes={config['memory_processes']}",
+           measure_process_bytes(config["memory_processes"]), "byte", False)
+
+    return {
+        "meta": {"suite_version": SUITE_VERSION, "size": size, "python": platform.python_version(),
+                 "platform": platform.platform(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = 0.10) -> list[dict]:
+    """
+    Membandingkan hasil suite dengan baseline tersimpan.
+
+    Sebuah hasil dianggap regresi jika lebih buruk dari baseline melebihi
+    `threshold` (relatif), sesuai arah "higher_is_better" masing-masing.
+
+    Returns:
+        list[dict]: Satu baris per hasil: {"name", "baseline", "current", "change", "status"}
+            dengan status 'OK', 'REGRESI', 'LEBIH BAIK', 'BARU', atau 'HILANG'.
+    """
+    if threshold < 0:
+        raise ValueError("Ambang regresi tidak boleh negatif")
+    current_results = current["results"]
+    baseline_results = baseline["results"]
+    rows = []
+    for name in list(baseline_results) + [name for name in current_results if name not in baseline_results]:
+        old = baseline_results.get(name)
+        new = current_results.get(name)
+        if old is None or new is None:
+            rows.append({"name": name, "baseline": old and old["value"], "current": new and new["value"],
+                         "change": None, "status": 'BARU' if old is None else 'HILANG'})
+            continue
+        change = (new["value"] - old["value"]) / old["value"] if old["value"] else 0.0
+        # Perubahan positif selalu berarti "lebih baik" setelah arah metrik diperhitungkan
+        improvement = change if new["higher_is_better"] else -change
+        status = 'REGRESI' if improvement < -threshold else 'LEBIH BAIK' if improvement > threshold else 'OK'
+        rows.append({"name": name, "baseline": old["value"], "current": new["value"], "change": change,
+                     "status": status})
+    return rows
+
+
+def print_comparison(rows: list[dict]):
+    """Mencetak tabel perbandingan baseline vs hasil sekarang."""
+    print(f"{'Benchmark':<48} | {'Baseline':>14} | {'Sekarang':>14} | {'Perubahan':>9} | Status")
+    print("-" * 104)
+    for row in rows:
+        baseline = f"{row['baseline']:,.1f}" if row['baseline'] is not None else "-"
+        current = f"{row['current']:,.1f}" if row['current'] is not None else "-"
+        change = f"{row['change']:+.1%}" if row['change'] is not None else "-"
+        print(f"{row['name']:<48} | {baseline:>14} | {current:>14} | {change:>9} | {row['status']}")
+
+
+def main(argv=None) -> int:
+    """
+    CLI benchmark:
+        python benchmark.py                       # tabel-tabel benchmark lama
+        python benchmark.py --suite --json hasil.json
+        python benchmark.py --suite --compare baseline.json [--threshold 0.1]
+
+    Returns:
+        int: Kode keluar (1 jika mode pembanding menemukan regresi).
+    """
+    parser = argparse.ArgumentParser(description="Benchmark jalur panas simulator MicroOS")
+    parser.add_argument("--suite", action="store_true", help="Jalankan suite benchmark terstruktur")
+    parser.add_argument("--quick", action="store_true", help="Ukuran suite kecil (smoke test)")
+    parser.add_argument("--json", metavar="PATH", help="Simpan hasil suite sebagai JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="Bandingkan hasil suite dengan baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Ambang regresi relatif (default 0.10)")
+    args = parser.parse_args(argv)
+
+    if not args.suite:
+        run_legacy_benchmarks()
+        return 0
+
+    suite = run_suite('quick' if args.quick else 'full')
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(suite, file, indent=2)
+    if not args.compare:
+        for name, result in suite["results"].items():
+            print(f"{name:<48} {result['value']:>16,.1f} {result['unit']}")
+        return 0
+
+    with open(args.compare, encoding='utf-8') as file:
+        baseline = json.load(file)
+    rows = compare_results(suite, baseline, args.threshold)
+    print_comparison(rows)
+    regressions = [row for row in rows if row["status"] == 'REGRESI']
+    print(f"\n{len(regressions)} regresi dari {len(rows)} benchmark (ambang {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def run_legacy_benchmarks():
+    """Tabel-tabel benchmark yang dicetak sebelum suite JSON ada."""
+    run_scaling_benchmark()
+    run_policy_comparison()
+    run_batch_benchmark()
+    run_result_mode_benchmark()
+    run_frame_table_memory_benchmark()
+    run_load_control_comparison()
+    run_sweep_scaling_benchmark()
+    run_profile_breakdown()
+    run_snapshot_benchmark()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
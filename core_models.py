@@ -5,39 +5,256 @@
 
 import math
 import random
+from array import array
+from collections.abc import Mapping
+
+from access_patterns import AccessPattern, create_access_pattern
+from page_table import create_page_table
 
 # Konstanta sistem yang disepakati bersama.
 # Ukuran setiap halaman/frame dalam byte. 4KB adalah nilai yang umum.
 PAGE_SIZE = 4096
 
+class FrameTable:
+    """
+    Tabel frame berperilaku seperti list (`frames[i]`, `len`, iterasi) yang
+    sekaligus memelihara indeks frame kosong.
+
+    Setiap penulisan `frames[i] = ...` memperbarui jumlah frame terisi dan
+    free-list (stack), sehingga pengecekan penuh, pencarian frame kosong, dan
+    penghitungan frame terisi bernilai O(1) (amortized) tanpa scan linear.
+    Setiap frame terisi disimpan sebagai dict {"process_id", "page_number"}.
+    """
+    def __init__(self, total_frames: int):
+        self._entries = [None] * total_frames
+        self._init_free_pool(total_frames)
+
+    # --- Pool frame kosong (dipakai bersama oleh CompactFrameTable) ---
+
+    def _init_free_pool(self, total_frames: int):
+        # Stack frame kosong. Diisi terbalik agar frame dengan indeks terkecil
+        # dipakai lebih dulu (sama seperti perilaku frames.index(None) sebelumnya).
+        self._free_stack = array('i', range(total_frames - 1, -1, -1))
+        # Penanda apakah sebuah frame sedang berada di dalam stack (mencegah duplikat)
+        self._in_free_stack = bytearray(b"\x01") * total_frames
+        self.filled_count = 0
+
+    def _on_frame_freed(self, index: int):
+        """Mencatat sebuah frame yang berubah dari terisi menjadi kosong."""
+        self.filled_count -= 1
+        if not self._in_free_stack[index]:
+            self._in_free_stack[index] = 1
+            self._free_stack.append(index)
+
+    def _is_free(self, index: int) -> bool:
+        return self._entries[index] is None
+
+    def first_free(self) -> int:
+        """
+        Mengembalikan indeks frame kosong dari free-list, atau -1 jika penuh.
+        Entri basi (frame yang sudah terisi lagi) dibuang secara lazy.
+        """
+        free_stack = self._free_stack
+        while free_stack:
+            index = free_stack[-1]
+            if self._is_free(index):
+                return index
+            free_stack.pop()
+            self._in_free_stack[index] = 0
+        return -1
+
+    # --- Akses gaya list ---
+
+    def __getitem__(self, index: int):
+        return self._entries[index]
+
+    def __setitem__(self, index: int, value):
+        if value is None:
+            self.clear(index)
+        else:
+            self.load(index, value["process_id"], value["page_number"])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def count(self, value) -> int:
+        """Sama seperti list.count, tetapi O(1) untuk menghitung frame kosong (None)."""
+        if value is None:
+            return len(self) - self.filled_count
+        return list(self).count(value)
+
+    def index(self, value) -> int:
+        """Sama seperti list.index (scan linear)."""
+        return list(self).index(value)
+
+    # --- Operasi langsung (dipakai MemoryManager) ---
+
+    def load(self, index: int, process_id: str, page_number: int):
+        """Mengisi frame dengan halaman milik sebuah proses."""
+        if self._entries[index] is None:
+            self.filled_count += 1
+        self._entries[index] = {"process_id": process_id, "page_number": page_number}
+
+    def clear(self, index: int):
+        """Mengosongkan frame dan mengembalikannya ke pool frame kosong."""
+        if self._entries[index] is not None:
+            self._entries[index] = None
+            self._on_frame_freed(index)
+
+    def owner_of(self, index: int) -> tuple[str, int] | None:
+        """Mengembalikan (process_id, page_number) pemilik frame, atau None jika kosong."""
+        entry = self._entries[index]
+        if entry is None:
+            return None
+        return entry["process_id"], entry["page_number"]
+
+    def __repr__(self) -> str:
+        return repr(self._entries)
+
+
+class FrameView(Mapping):
+    """
+    Tampilan read-only satu frame pada CompactFrameTable dengan bentuk yang sama
+    seperti dict {"process_id": ..., "page_number": ...}.
+    """
+    __slots__ = ("_table", "_index")
+    _KEYS = ("process_id", "page_number")
+
+    def __init__(self, table: "CompactFrameTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str):
+        owner = self._table.owner_of(self._index)
+        if owner is None or key not in self._KEYS:
+            raise KeyError(key)
+        return owner[0] if key == "process_id" else owner[1]
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def copy(self) -> dict:
+        """Mengembalikan salinan berupa dict biasa."""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CompactFrameTable(FrameTable):
+    """
+    Varian FrameTable yang disimpan sebagai dua array bertipe paralel
+    (indeks proses pemilik dan nomor halaman), bukan satu dict per frame.
+
+    Mengurangi memori per frame dari ratusan byte menjadi 8 byte, dan
+    tidak mengalokasikan objek baru saat halaman dimuat. `frames[i]`
+    mengembalikan FrameView sehingga pemanggil tetap melihat bentuk dict.
+    """
+    def __init__(self, total_frames: int):
+        # -1 menandakan frame kosong
+        self._owners = array('i', [-1]) * total_frames
+        self._pages = array('i', [-1]) * total_frames
+        # Pemetaan process_id (string) <-> indeks pemilik (int)
+        self._owner_ids: list[str] = []
+        self._owner_index: dict[str, int] = {}
+        self._init_free_pool(total_frames)
+
+    def _is_free(self, index: int) -> bool:
+        return self._owners[index] < 0
+
+    def _owner_to_index(self, process_id: str) -> int:
+        owner = self._owner_index.get(process_id)
+        if owner is None:
+            owner = len(self._owner_ids)
+            self._owner_ids.append(process_id)
+            self._owner_index[process_id] = owner
+        return owner
+
+    def __getitem__(self, index: int):
+        if self._owners[index] < 0:
+            return None
+        return FrameView(self, index)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self._owners)))
+
+    def load(self, index: int, process_id: str, page_number: int):
+        """Mengisi frame dengan halaman milik sebuah proses (tanpa alokasi dict)."""
+        if self._owners[index] < 0:
+            self.filled_count += 1
+        self._owners[index] = self._owner_to_index(process_id)
+        self._pages[index] = page_number
+
+    def clear(self, index: int):
+        """Mengosongkan frame dan mengembalikannya ke pool frame kosong."""
+        if self._owners[index] >= 0:
+            self._owners[index] = -1
+            self._pages[index] = -1
+            self._on_frame_freed(index)
+
+    def owner_of(self, index: int) -> tuple[str, int] | None:
+        """Mengembalikan (process_id, page_number) pemilik frame, atau None jika kosong."""
+        owner = self._owners[index]
+        if owner < 0:
+            return None
+        return self._owner_ids[owner], self._pages[index]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class PhysicalMemory:
     """
     Merepresentasikan memori fisik (RAM) dalam simulasi.
     Terdiri dari kumpulan frame berukuran tetap.
     """
-    def __init__(self, total_frames: int):
+    def __init__(self, total_frames: int, compact: bool = False):
+        """
+        Args:
+            total_frames (int): Jumlah frame di memori fisik.
+            compact (bool): Jika True, tabel frame disimpan dalam array bertipe
+                (CompactFrameTable) alih-alih satu dict per frame.
+        """
         self.size = total_frames
-        self.frames = [None] * self.size
+        self.frames = CompactFrameTable(self.size) if compact else FrameTable(self.size)
+
+    @property
+    def filled_count(self) -> int:
+        """Jumlah frame yang sedang terisi (O(1))."""
+        return self.frames.filled_count
 
     def is_full(self) -> bool:
         """Mengecek apakah semua frame di memori sudah terisi."""
-        return None not in self.frames
+        return self.frames.filled_count >= self.size
 
     def get_empty_frame_index(self) -> int:
         """
-        Mencari dan mengembalikan indeks dari frame kosong pertama.
+        Mencari dan mengembalikan indeks dari frame kosong.
+        Frame yang baru dibebaskan akan dipakai ulang lebih dulu.
         Returns:
             int: Indeks frame kosong, atau -1 jika tidak ada.
         """
-        try:
-            return self.frames.index(None)
-        except ValueError:
-            return -1
+        return self.frames.first_free()
+
+    def free_frame(self, frame_number: int):
+        """Mengosongkan sebuah frame dan mengembalikannya ke pool frame kosong."""
+        self.frames.clear(frame_number)
 
     def __repr__(self) -> str:
         """Representasi string untuk debugging."""
-        filled_count = self.size - self.frames.count(None)
-        return f"PhysicalMemory(size={self.size}, filled_frames={filled_count})"
+        return f"PhysicalMemory(size={self.size}, filled_frames={self.filled_count})"
 
 # ---
 
@@ -46,40 +263,87 @@ class Process:
     Merepresentasikan sebuah proses (Revisi V2).
     Dibuat dengan ukuran (size) dan dikonversi menjadi jumlah halaman.
     Memiliki urutan akses halaman yang dibuat secara acak.
+
+    Memakai __slots__ (tanpa __dict__ per objek) agar workload dengan ratusan
+    ribu proses tetap hemat memori. `pid` adalah ID numerik yang dipakai untuk
+    pengurutan; `process_id` ("P{pid}") tetap menjadi kunci di luar proses.
     """
+    __slots__ = ('pid', 'process_id', 'burst_time_total', 'burst_time_remaining', 'arrival_time', 'priority',
+                 'num_pages', 'page_access_sequence', 'access_step', '_access_iter', 'status', 'page_table',
+                 '_page_table_image')
     _id_counter = 0
 
-    def __init__(self, burst_time: int, process_size: int):
+    def __init__(self, burst_time: int, process_size: int, page_table_mode: str = 'DENSE',
+                 access_pattern: str | AccessPattern | None = None, seed: int | None = None,
+                 pattern_options: dict | None = None, arrival_time: int = 0, priority: int = 0,
+                 pid: int | None = None):
         """
         Args:
             burst_time (int): Total waktu yang dibutuhkan proses untuk selesai.
             process_size (int): Ukuran total proses dalam byte.
+            page_table_mode (str): 'DENSE' (default), 'SPARSE', atau 'RADIX'.
+                Mode 'SPARSE'/'RADIX' membuat entri page table saat halaman
+                pertama kali disentuh, sehingga pembuatan proses besar O(1).
+            access_pattern (str | AccessPattern | None): Pola akses halaman yang
+                dibaca secara lazy ('UNIFORM', 'SEQUENTIAL', 'ZIPF', 'LOOP', 'PHASE'
+                atau objek AccessPattern). Jika None, urutan akses acak seragam
+                dibuat di awal seperti sebelumnya.
+            seed (int | None): Seed pola akses agar urutan akses dapat direproduksi.
+            pattern_options (dict | None): Parameter tambahan untuk pola akses.
+            arrival_time (int): Detik simulasi saat proses tiba di antrian siap.
+            priority (int): Prioritas proses (angka lebih kecil = prioritas lebih tinggi).
+            pid (int | None): ID numerik eksplisit (mis. workload yang dibangun ulang
+                dari seed). None = ambil dari counter global.
         """
-        self.process_id = f"P{Process._id_counter}"
-        Process._id_counter += 1
+        if pid is None:
+            pid = Process._id_counter
+            Process._id_counter += 1
+        self.pid = pid
+        self.process_id = f"P{pid}"
         
         self.burst_time_total = burst_time
         self.burst_time_remaining = burst_time
+        if arrival_time < 0:
+            raise ValueError("Waktu kedatangan tidak boleh negatif")
+        self.arrival_time = arrival_time
+        self.priority = priority
         
         # Logika konversi dari ukuran proses ke jumlah halaman
         if process_size <= 0:
             raise ValueError("Ukuran proses harus lebih besar dari 0")
         self.num_pages = math.ceil(process_size / PAGE_SIZE)
         
-        # Membuat urutan akses halaman secara acak
+        # Membuat urutan akses halaman
         # Proses akan meminta 'burst_time' halaman selama masa hidupnya.
-        self.page_access_sequence = random.choices(range(self.num_pages), k=self.burst_time_total)
+        if access_pattern is None:
+            self.page_access_sequence = random.choices(range(self.num_pages), k=self.burst_time_total)
+        elif isinstance(access_pattern, AccessPattern):
+            self.page_access_sequence = access_pattern
+        else:
+            self.page_access_sequence = create_access_pattern(
+                access_pattern, self.num_pages, self.burst_time_total, seed, **(pattern_options or {}))
         self.access_step = 0
+        # Iterator untuk pola akses lazy (dibuat saat akses pertama)
+        self._access_iter = None
         
         self.status = 'ready' # Status awal: 'ready', 'running', 'terminated'
         
         # Page Table: {nomor_halaman_virtual: [nomor_frame_fisik, valid_bit]}
-        self.page_table = {i: [None, 0] for i in range(self.num_pages)}
+        self.page_table = create_page_table(self.num_pages, page_table_mode)
+        # Hanya dipakai RestoredProcess (page table yang belum dimaterialisasi dari snapshot)
+        self._page_table_image = None
 
     def get_next_page_to_access(self) -> int | None:
         """Mengambil halaman berikutnya yang perlu diakses dari urutan."""
-        if self.access_step < len(self.page_access_sequence):
-            page = self.page_access_sequence[self.access_step]
+        sequence = self.page_access_sequence
+        if self.access_step < len(sequence):
+            if isinstance(sequence, list):
+                page = sequence[self.access_step]
+            else:
+                # Pola lazy: halaman dibangkitkan per batch, tidak disimpan seluruhnya
+                if self._access_iter is None:
+                    self._access_iter = sequence.iter_from(self.access_step)
+                page = next(self._access_iter)
             self.access_step += 1
             return page
         return None
@@ -94,24 +358,301 @@ class Process:
         return (f"Process(id={self.process_id}, status='{self.status}', "
                 f"burst_rem={self.burst_time_remaining}, pages={self.num_pages})")
 
+class RestoredProcess(Process):
+    """
+    Proses hasil restore snapshot yang page table-nya belum dimaterialisasi.
+
+    Page table dibangun dari `_page_table_image` (dipakai bersama dengan
+    snapshot asalnya) saat pertama kali disentuh, lalu kelas objek diganti
+    menjadi Process biasa sehingga akses berikutnya tidak lagi melewati
+    property ini. Tata letak slot sama dengan Process, jadi penggantian
+    kelas aman.
+    """
+    __slots__ = ()
+
+    @property
+    def page_table(self):
+        page_table = self._page_table_image.materialize()
+        self.page_table = page_table
+        return page_table
+
+    @page_table.setter
+    def page_table(self, page_table):
+        self.__class__ = Process
+        Process.page_table.__set__(self, page_table)
+        self._page_table_image = None
+
 # ---
 
+class Histogram:
+    """
+    Histogram dengan bucket tetap (gaya HDR) untuk bilangan bulat non-negatif.
+
+    Nilai 0..15 punya bucket sendiri; di atasnya setiap rentang pangkat dua
+    dibagi menjadi 8 sub-bucket, sehingga galat relatif percentile <= 12.5%.
+    Semua bucket dialokasikan di awal (array), jadi `record` bernilai O(1)
+    tanpa membuat objek baru per event.
+    """
+    SUB_BUCKET_BITS = 3
+    LINEAR_LIMIT = 16  # 2 * 2**SUB_BUCKET_BITS
+
+    def __init__(self, max_value_bits: int = 40):
+        """
+        Args:
+            max_value_bits (int): Nilai di atas 2**max_value_bits masuk ke bucket terakhir.
+        """
+        num_buckets = self._bucket_index((1 << max_value_bits) - 1) + 1
+        self._counts = array('q', bytes(8 * num_buckets))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def _bucket_index(cls, value: int) -> int:
+        if value < cls.LINEAR_LIMIT:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return cls.LINEAR_LIMIT + (shift - 1) * 8 + ((value >> shift) - 8)
+
+    @classmethod
+    def _bucket_upper_bound(cls, index: int) -> int:
+        if index < cls.LINEAR_LIMIT:
+            return index
+        shift, sub_bucket = divmod(index - cls.LINEAR_LIMIT, 8)
+        return ((8 + sub_bucket + 1) << (shift + 1)) - 1
+
+    def record(self, value: int):
+        """Mencatat satu nilai (dibulatkan ke bilangan bulat non-negatif)."""
+        value = max(0, int(value))
+        counts = self._counts
+        index = self._bucket_index(value)
+        counts[min(index, len(counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> int | None:
+        """Nilai percentile ke-p (0-100), dengan presisi sebatas lebar bucket."""
+        if not self.count:
+            return None
+        target = max(1, math.ceil(self.count * p / 100))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Ringkasan histogram: count, min, max, mean, p50, p90, p99."""
+        return {"count": self.count, "min": self.min, "max": self.max, "mean": self.mean(),
+                "p50": self.percentile(50), "p90": self.percentile(90), "p99": self.percentile(99)}
+
+    def reset(self):
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+
 class Statistics:
-    """Kelas terpisah untuk melacak dan mengelola statistik performa."""
-    def __init__(self):
+    """
+    Kelas terpisah untuk melacak dan mengelola statistik performa.
+
+    Selain tiga counter global, Statistics mencatat:
+    - hit/fault dan jumlah halaman yang diusir per proses (kolom array per slot proses),
+    - fault rate atas jendela geser beberapa ukuran (`window_sizes`); riwayat
+      akses disimpan di satu ring buffer bytearray (1 = fault) dan rate dihitung
+      saat dibaca, sehingga pencatatan per akses cukup satu penulisan byte,
+    - metrik penjadwal (waiting, turnaround, response time, context switch, utilisasi CPU)
+      beserta histogram percentile berbucket tetap.
+    Semua pembaruan bernilai O(1); `snapshot()` menyalinnya ke dict biasa untuk UI.
+    """
+    # Waktu akses default (nanodetik) untuk perhitungan effective access time
+    TLB_ACCESS_TIME_NS = 1
+    MEMORY_ACCESS_TIME_NS = 100
+
+    def __init__(self, window_sizes: tuple = (100, 1000)):
+        """
+        Args:
+            window_sizes (tuple): Ukuran jendela geser (jumlah akses) untuk fault rate.
+        """
+        if any(size <= 0 for size in window_sizes):
+            raise ValueError("Ukuran jendela harus lebih besar dari 0")
+        self.window_sizes = tuple(window_sizes)
         self.total_accesses = 0
         self.page_faults = 0
         self.hits = 0
+        self.tlb_hits = 0
+        self.tlb_misses = 0
+
+        # Ring buffer riwayat akses sepanjang jendela terbesar (None = tanpa jendela)
+        self._history_size = max(self.window_sizes, default=0)
+        self._history = bytearray(self._history_size) if self._history_size else None
+        self._history_position = 0
+
+        # Per proses: {process_id: slot} + kolom array yang diindeks slot
+        self._process_slots = {}
+        self._process_hits = array('q')
+        self._process_faults = array('q')
+        self._process_evictions = array('q')  # Halaman proses ini yang diusir
+
+        # Metrik penjadwal
+        self.context_switches = 0
+        self.busy_time = 0
+        self.idle_time = 0
+        self.completed_processes = {}  # {process_id: {"waiting_time", "turnaround_time", "response_time"}}
+        self.waiting_time_histogram = Histogram()
+        self.turnaround_time_histogram = Histogram()
+        self.response_time_histogram = Histogram()
+
+    def _slot(self, process_id: str) -> int:
+        slot = self._process_slots.get(process_id)
+        if slot is None:
+            slot = self._process_slots[process_id] = len(self._process_slots)
+            self._process_hits.append(0)
+            self._process_faults.append(0)
+            self._process_evictions.append(0)
+        return slot
+
+    # --- Akses memori ---
 
-    def increment_faults(self):
+    def increment_faults(self, process_id: str | None = None):
         """Mencatat terjadinya sebuah page fault."""
         self.total_accesses += 1
         self.page_faults += 1
-        
-    def increment_hits(self):
+        if process_id is not None:
+            try:
+                self._process_faults[self._process_slots[process_id]] += 1
+            except KeyError:
+                self._process_faults[self._slot(process_id)] += 1
+        history = self._history
+        if history is not None:
+            position = self._history_position
+            history[position] = 1
+            self._history_position = position + 1 if position + 1 < self._history_size else 0
+
+    def increment_hits(self, process_id: str | None = None):
         """Mencatat terjadinya sebuah page hit."""
         self.total_accesses += 1
         self.hits += 1
+        if process_id is not None:
+            try:
+                self._process_hits[self._process_slots[process_id]] += 1
+            except KeyError:
+                self._process_hits[self._slot(process_id)] += 1
+        history = self._history
+        if history is not None:
+            position = self._history_position
+            history[position] = 0
+            self._history_position = position + 1 if position + 1 < self._history_size else 0
+
+    def record_batch(self, hits: int, faults: int, process_id: str | None = None, status=None,
+                     history: bool = True):
+        """
+        Mencatat sekumpulan hit dan fault sekaligus (dipakai oleh akses batch).
+
+        Args:
+            status (bytearray | None): Status per akses (1 = HIT, 0 = FAULT) untuk
+                jendela geser. Tanpa status, hit dianggap terjadi sebelum fault.
+            history (bool): False jika jendela geser sudah diisi lewat `record_history_run`.
+        """
+        self.total_accesses += hits + faults
+        self.hits += hits
+        self.page_faults += faults
+        if process_id is not None:
+            slot = self._slot(process_id)
+            self._process_hits[slot] += hits
+            self._process_faults[slot] += faults
+        if history and self._history is not None:
+            if status is not None:
+                self._append_history(status.translate(self._STATUS_TO_FAULT))
+            else:
+                self._append_history(bytes(hits) + b'\x01' * faults)
+
+    # Tabel translasi status batch (1 = HIT, 0 = FAULT) menjadi bit fault
+    _STATUS_TO_FAULT = bytes([1, 0]) + bytes(254)
+
+    def _append_history(self, fault_bits: bytes):
+        """Menyalin sekumpulan bit fault ke ring buffer riwayat (dengan slicing)."""
+        history, size = self._history, self._history_size
+        fault_bits = fault_bits[-size:]
+        position = self._history_position
+        head = min(len(fault_bits), size - position)
+        history[position:position + head] = fault_bits[:head]
+        tail = len(fault_bits) - head
+        history[:tail] = fault_bits[head:]
+        self._history_position = (position + len(fault_bits)) % size
+
+    def record_history_run(self, hits: int, faults: int = 1):
+        """
+        Mencatat `hits` hit berturut-turut lalu `faults` fault ke jendela geser saja
+        (counter tidak berubah). Akses batch memanggilnya sekali per fault sehingga
+        tidak perlu membangun status per akses.
+        """
+        history, size = self._history, self._history_size
+        if history is None:
+            return
+        position = self._history_position
+        for bit, count in ((0, hits), (1, faults)):
+            if count == 1:
+                history[position] = bit
+            elif count >= size:
+                history[:] = bytes([bit]) * size
+            elif count:
+                head = min(count, size - position)
+                history[position:position + head] = bytes([bit]) * head
+                history[:count - head] = bytes([bit]) * (count - head)
+            position = (position + count) % size
+        self._history_position = position
+
+    def record_eviction(self, victim_process_id: str):
+        """Mencatat bahwa sebuah halaman milik `victim_process_id` diusir dari memori."""
+        self._process_evictions[self._slot(victim_process_id)] += 1
+
+    def increment_tlb_hits(self):
+        """Mencatat translasi yang ditemukan di TLB."""
+        self.tlb_hits += 1
+
+    def increment_tlb_misses(self):
+        """Mencatat translasi yang tidak ditemukan di TLB."""
+        self.tlb_misses += 1
+
+    # --- Penjadwal ---
+
+    def record_context_switch(self):
+        """Mencatat pergantian proses yang berjalan di CPU."""
+        self.context_switches += 1
+
+    def record_cpu_time(self, busy: int = 0, idle: int = 0):
+        """Menambahkan waktu CPU sibuk dan idle."""
+        self.busy_time += busy
+        self.idle_time += idle
+
+    def record_process_completion(self, process_id: str, arrival_time: int, burst_time: int,
+                                  first_run_time: int, completion_time: int):
+        """Mencatat metrik penjadwalan proses yang selesai."""
+        turnaround = completion_time - arrival_time
+        metrics = {
+            "waiting_time": turnaround - burst_time,
+            "turnaround_time": turnaround,
+            "response_time": first_run_time - arrival_time,
+        }
+        self.completed_processes[process_id] = metrics
+        self.waiting_time_histogram.record(metrics["waiting_time"])
+        self.turnaround_time_histogram.record(metrics["turnaround_time"])
+        self.response_time_histogram.record(metrics["response_time"])
+
+    # --- Pembacaan ---
 
     def get_hit_ratio(self) -> float:
         """Menghitung hit ratio saat ini (0.0 hingga 1.0)."""
@@ -119,14 +660,109 @@ class Statistics:
             return 0.0
         return self.hits / self.total_accesses
 
+    def get_tlb_hit_ratio(self) -> float:
+        """Menghitung TLB hit ratio saat ini (0.0 hingga 1.0)."""
+        tlb_lookups = self.tlb_hits + self.tlb_misses
+        if tlb_lookups == 0:
+            return 0.0
+        return self.tlb_hits / tlb_lookups
+
+    def get_windowed_fault_rate(self, window_size: int) -> float:
+        """Fault rate atas `window_size` akses terakhir (maksimal jendela terbesar)."""
+        window_size = min(window_size, self._history_size, self.total_accesses)
+        if window_size <= 0:
+            return 0.0
+        history, position = self._history, self._history_position
+        if window_size <= position:
+            faults = history.count(1, position - window_size, position)
+        else:
+            faults = history.count(1, 0, position) + history.count(1, self._history_size - (window_size - position))
+        return faults / window_size
+
+    def get_windowed_fault_rates(self) -> dict:
+        """Fault rate pada setiap jendela geser: {ukuran_jendela: rate}."""
+        return {size: self.get_windowed_fault_rate(size) for size in self.window_sizes}
+
+    def get_process_stats(self, process_id: str) -> dict:
+        """Hit, fault, dan jumlah halaman yang diusir untuk satu proses."""
+        slot = self._process_slots.get(process_id)
+        if slot is None:
+            return {"hits": 0, "faults": 0, "evictions": 0}
+        return {"hits": self._process_hits[slot], "faults": self._process_faults[slot],
+                "evictions": self._process_evictions[slot]}
+
+    def get_cpu_utilization(self) -> float:
+        """Utilisasi CPU (waktu sibuk / total waktu yang tercatat)."""
+        total = self.busy_time + self.idle_time
+        return self.busy_time / total if total else 0.0
+
+    def get_effective_access_time(self, tlb_access_time: float = TLB_ACCESS_TIME_NS,
+                                  memory_access_time: float = MEMORY_ACCESS_TIME_NS) -> float:
+        """
+        Menghitung effective access time (EAT) dalam nanodetik:
+        EAT = h * (t + m) + (1 - h) * (t + 2m), dengan h = TLB hit ratio,
+        t = waktu akses TLB, dan m = waktu akses memori (TLB miss butuh satu
+        akses memori tambahan untuk membaca page table).
+        """
+        tlb_hit_ratio = self.get_tlb_hit_ratio()
+        return (tlb_hit_ratio * (tlb_access_time + memory_access_time)
+                + (1 - tlb_hit_ratio) * (tlb_access_time + 2 * memory_access_time))
+
+    def snapshot(self) -> dict:
+        """
+        Salinan seluruh statistik dalam bentuk dict/list biasa. Aman disimpan
+        atau dikirim ke UI: tidak berbagi objek dengan Statistics, sehingga
+        simulasi bisa terus berjalan setelah snapshot diambil.
+        """
+        return {
+            "total_accesses": self.total_accesses,
+            "page_faults": self.page_faults,
+            "hits": self.hits,
+            "hit_ratio": self.get_hit_ratio(),
+            "tlb_hits": self.tlb_hits,
+            "tlb_misses": self.tlb_misses,
+            "tlb_hit_ratio": self.get_tlb_hit_ratio(),
+            "windowed_fault_rates": self.get_windowed_fault_rates(),
+            "per_process": {process_id: self.get_process_stats(process_id) for process_id in self._process_slots},
+            "scheduler": {
+                "context_switches": self.context_switches,
+                "busy_time": self.busy_time,
+                "idle_time": self.idle_time,
+                "cpu_utilization": self.get_cpu_utilization(),
+                "completed_processes": {pid: dict(m) for pid, m in self.completed_processes.items()},
+                "waiting_time": self.waiting_time_histogram.summary(),
+                "turnaround_time": self.turnaround_time_histogram.summary(),
+                "response_time": self.response_time_histogram.summary(),
+            },
+        }
+
     def reset(self):
         """Mengembalikan semua statistik ke nilai awal."""
         self.total_accesses = 0
         self.page_faults = 0
         self.hits = 0
+        self.tlb_hits = 0
+        self.tlb_misses = 0
+        if self._history is not None:
+            self._history[:] = bytes(self._history_size)
+        self._history_position = 0
+        self._process_slots.clear()
+        del self._process_hits[:]
+        del self._process_faults[:]
+        del self._process_evictions[:]
+        self.context_switches = 0
+        self.busy_time = 0
+        self.idle_time = 0
+        self.completed_processes.clear()
+        self.waiting_time_histogram.reset()
+        self.turnaround_time_histogram.reset()
+        self.response_time_histogram.reset()
 
     def __repr__(self) -> str:
         """Representasi string untuk debugging."""
         hit_ratio_percent = self.get_hit_ratio() * 100
+        tlb_info = ""
+        if self.tlb_hits + self.tlb_misses > 0:
+            tlb_info = f", TLBHitRatio={self.get_tlb_hit_ratio() * 100:.2f}%"
         return (f"Statistics(Accesses={self.total_accesses}, Faults={self.page_faults}, "
-                f"Hits={self.hits}, HitRatio={hit_ratio_percent:.2f}%)")
\ No newline at end of file
+                f"Hits={self.hits}, HitRatio={hit_ratio_percent:.2f}%{tlb_info})")
@@ -1,100 +1,283 @@
 # File: cpu_scheduler.py
 # Deskripsi: Mengimplementasikan mesin penjadwalan CPU.
-# Bertanggung jawab atas pengelolaan antrian proses dan pemilihan proses berikutnya
-# berdasarkan algoritma FCFS atau Round Robin.
+# Bertanggung jawab atas pengelolaan antrian proses, kedatangan proses, dan
+# pemilihan proses berikutnya. Algoritmanya (FCFS, RR, MLFQ, SJF, SRTF, PRIORITY)
+# berada di scheduling_policies.py sebagai kelas policy yang bisa dipasang.
 # Dikerjakan oleh: Tim Struktur Data (Backend)
 
-from collections import deque
+import heapq
+
 from core_models import Process
+from scheduling_policies import SCHEDULING_POLICIES
 
 class CPUScheduler:
     """
     Kelas yang mengelola antrian proses dan memutuskan proses mana
     yang akan dieksekusi selanjutnya.
     """
-    def __init__(self, algorithm: str, process_list: list[Process]):
+    def __init__(self, algorithm: str, process_list: list[Process], policy_options: dict | None = None,
+                 time_quantum: int = 3):
         """
         Inisialisasi Penjadwal CPU.
-        
+
         Args:
-            algorithm (str): Algoritma yang digunakan ('FCFS' atau 'RR').
+            algorithm (str): Algoritma yang digunakan (salah satu dari SCHEDULING_POLICIES).
             process_list (list[Process]): Daftar semua proses yang akan dijadwalkan.
+            policy_options (dict | None): Parameter tambahan untuk policy
+                (mis. {'aging_rate': 0.5, 'preemptive': True} untuk PRIORITY atau
+                {'quanta': (2, 4, 8), 'boost_interval': 100} untuk MLFQ).
+            time_quantum (int): Kuantum waktu Round Robin (default 3).
         """
-        if algorithm.upper() not in ['FCFS', 'RR']:
-            raise ValueError("Algoritma harus 'FCFS' atau 'RR'")
-        
+        if algorithm.upper() not in SCHEDULING_POLICIES:
+            raise ValueError(f"Algoritma harus salah satu dari {list(SCHEDULING_POLICIES)}")
+
         self.algorithm = algorithm.upper()
-        
-        # Urutkan proses berdasarkan ID untuk memastikan FCFS bekerja dengan benar
-        # jika beberapa proses "datang" bersamaan.
-        sorted_processes = sorted(process_list, key=lambda p: p.process_id)
-        self.ready_queue = deque(sorted_processes)
-        
+        self.policy = SCHEDULING_POLICIES[self.algorithm](**(policy_options or {}))
+        # Antrian siap dikelola oleh policy (deque, antrian bertingkat, atau heap)
+        self.ready_queue = self.policy
+
+        # Urutkan proses berdasarkan ID numerik untuk memastikan FCFS bekerja dengan benar
+        # jika beberapa proses "datang" bersamaan (P2 sebelum P10).
+        sorted_processes = sorted(process_list, key=lambda p: p.pid)
+        # Daftar semua proses yang dikelola (termasuk yang nanti terblokir/selesai)
+        self.processes = list(sorted_processes)
+
+        # Proses yang disuspend (load control): {proses: status sebelum disuspend}.
+        # Proses yang keluar dari antrian siap selama disuspend "diparkir" di _parked.
+        self.suspended = {}
+        self._parked = {}
+
+        # Jam penjadwal dan proses yang belum tiba: heap (waktu_tiba, urutan, proses)
+        self.current_time = 0
+        self._arrivals = [(p.arrival_time, order, p) for order, p in enumerate(sorted_processes)]
+        heapq.heapify(self._arrivals)
+        self._release_arrivals()
+
         # State untuk melacak proses yang sedang berjalan
         self.current_process: Process | None = None
-        
-        # State khusus untuk Round Robin
-        self.time_quantum = 3  # Hardcoded sesuai kesepakatan
+
+        # State kuantum untuk Round Robin / MLFQ
+        if time_quantum <= 0:
+            raise ValueError("Kuantum waktu harus bilangan positif")
+        self.time_quantum = time_quantum
         self.quantum_counter = 0
 
+    def _release_arrivals(self):
+        """Memindahkan proses yang waktu kedatangannya sudah tiba ke antrian siap."""
+        arrivals = self._arrivals
+        while arrivals and arrivals[0][0] <= self.current_time:
+            self.add_process(heapq.heappop(arrivals)[2])
+
+    def next_arrival_time(self) -> int | None:
+        """Waktu kedatangan proses berikutnya yang belum tiba (None jika tidak ada)."""
+        return self._arrivals[0][0] if self._arrivals else None
+
     def select_next_process(self) -> Process | None:
         """
         Fungsi utama yang memilih proses berikutnya untuk dijalankan.
         Ini adalah "pintu depan" ke modul ini.
-        
+
         Returns:
             Process | None: Objek proses yang akan berjalan, atau None jika tidak ada.
         """
-        if self.algorithm == 'FCFS':
-            return self._select_fcfs()
-        elif self.algorithm == 'RR':
-            return self._select_rr()
-        return None
+        self._release_arrivals()
+        process = self.policy.select(self)
+        # Penghapusan malas: proses yang disuspend saat masih di antrian siap
+        # baru dikeluarkan ketika policy memilihnya.
+        while process is not None and process in self.suspended:
+            self._parked[process] = True
+            self.current_process = None
+            self.quantum_counter = 0
+            process = self.policy.select(self)
+        return process
 
-    def tick(self):
+    def tick(self, elapsed: int = 1):
         """
         Fungsi pembantu yang dipanggil setiap "detik" simulasi.
-        Hanya relevan untuk Round Robin untuk mengurangi sisa kuantum.
+        Memajukan jam penjadwal (untuk kedatangan proses) dan, pada Round Robin
+        dan MLFQ, mengurangi sisa kuantum.
+
+        Args:
+            elapsed (int): Jumlah detik yang berlalu sekaligus (default 1).
+        """
+        self.current_time += elapsed
+        self.policy.tick(self, elapsed)
+
+    def next_event_time(self) -> int | None:
+        """Titik keputusan berikutnya milik policy (mis. priority boost MLFQ), None jika tidak ada."""
+        return self.policy.next_event_time()
+
+    def max_run_length(self) -> int | None:
+        """
+        Berapa detik proses saat ini boleh terus berjalan sebelum penjadwal
+        perlu dipanggil lagi (None = sampai proses selesai). Dipakai oleh
+        SimulationEngine untuk melompati detik-detik tanpa keputusan penjadwalan.
+        Kedatangan proses baru juga merupakan titik keputusan.
+        """
+        run_limit = self.policy.max_run_length(self)
+        if self._arrivals:
+            until_arrival = self._arrivals[0][0] - self.current_time
+            run_limit = until_arrival if run_limit is None else min(run_limit, until_arrival)
+        return run_limit
+
+    def block_current(self):
+        """Mengeluarkan proses yang sedang berjalan dari CPU (mis. menunggu I/O page fault)."""
+        if self.current_process is not None:
+            self.policy.on_block(self, self.current_process)
+            self.current_process.status = 'blocked'
+        self.current_process = None
+        self.quantum_counter = 0
+
+    def add_process(self, process: Process):
+        """Memasukkan proses (baru atau yang selesai menunggu I/O) ke antrian siap."""
+        if process in self.suspended:
+            # Proses yang disuspend tidak boleh masuk antrian siap sampai di-resume
+            self.suspended[process] = 'ready'
+            self._parked[process] = True
+            return
+        process.status = 'ready'
+        self.policy.push(process, self.current_time)
+
+    def suspend(self, process: Process):
+        """
+        Menyuspend proses (load control): proses tidak akan dipilih sampai
+        `resume` dipanggil. Proses yang sedang berjalan langsung dikeluarkan dari CPU.
+        """
+        if process in self.suspended or process.burst_time_remaining <= 0:
+            return
+        self.suspended[process] = process.status
+        process.status = 'suspended'
+        if process is self.current_process:
+            self.suspended[process] = 'ready'
+            self._parked[process] = True
+            self.current_process = None
+            self.quantum_counter = 0
+
+    def resume(self, process: Process):
+        """Mengaktifkan kembali proses yang disuspend."""
+        if process not in self.suspended:
+            return
+        previous_status = self.suspended.pop(process)
+        if self._parked.pop(process, None):
+            self.add_process(process)
+        else:
+            # Masih di antrian siap atau masih menunggu I/O
+            process.status = previous_status
+
+    def compute_schedule(self) -> dict:
         """
-        if self.algorithm == 'RR':
-            if self.quantum_counter > 0:
-                self.quantum_counter -= 1
-
-    def _select_fcfs(self) -> Process | None:
-        """Logika pemilihan untuk FCFS."""
-        # Jika tidak ada proses yang berjalan atau proses saat ini sudah selesai
-        if self.current_process is None or self.current_process.burst_time_remaining <= 0:
-            if not self.ready_queue:
-                self.current_process = None
-                return None # Tidak ada lagi proses di antrian
-            
-            # Ambil proses berikutnya dari depan antrian
-            self.current_process = self.ready_queue.popleft()
-        
-        # Kembalikan proses yang sama sampai selesai
-        return self.current_process
-
-    def _select_rr(self) -> Process | None:
-        """Logika pemilihan untuk Round Robin."""
-        quantum_expired = self.quantum_counter <= 0
-        process_finished = self.current_process is not None and self.current_process.burst_time_remaining <= 0
-
-        # Kapan kita perlu memilih proses baru?
-        # 1. Jika belum ada proses yang berjalan.
-        # 2. Jika kuantum waktu proses saat ini sudah habis.
-        # 3. Jika proses saat ini sudah selesai (burst time = 0).
-        if self.current_process is None or quantum_expired or process_finished:
-            
-            # Jika ada proses yang sedang berjalan sebelumnya dan belum selesai,
-            # kembalikan ia ke akhir antrian.
-            if self.current_process and not process_finished:
-                self.ready_queue.append(self.current_process)
-
-            # Jika masih ada proses di antrian, ambil yang berikutnya.
-            if self.ready_queue:
-                self.current_process = self.ready_queue.popleft()
-                self.quantum_counter = self.time_quantum # Reset kuantum untuk proses baru
+        Menghitung jadwal lengkap untuk workload murni CPU (tanpa I/O) tanpa
+        memanggil select_next_process() + tick() setiap detik.
+
+        Penjadwal hanya dipanggil pada titik keputusan (kuantum habis, proses
+        selesai, atau proses baru tiba), lalu proses langsung dijalankan selama
+        `max_run_length()` detik sekaligus. Proses yang sendirian di CPU (RR atau
+        level terendah MLFQ) berjalan melewati batas kuantum sampai kedatangan
+        berikutnya. Untuk FCFS dan RR biayanya O(jumlah context switch), bukan
+        O(total burst). Seperti jalur per detik,
+        fungsi ini menghabiskan burst_time_remaining setiap proses.
+
+        Returns:
+            dict: {"segments" (list (process_id, mulai, durasi)), "completion_times",
+                   "metrics" ({process_id: {"waiting_time", "turnaround_time", "response_time"}}),
+                   "average_waiting_time", "average_turnaround_time", "average_response_time",
+                   "total_time", "idle_time", "context_switches"}.
+        """
+        segments = []          # [process_id, mulai, durasi]
+        first_run = {}         # {process_id: detik pertama kali berjalan}
+        completion_times = {}
+        idle_time = 0
+
+        while True:
+            process = self.select_next_process()
+            if process is None:
+                next_arrival = self.next_arrival_time()
+                if next_arrival is None:
+                    break
+                # CPU idle sampai proses berikutnya tiba (atau titik keputusan policy)
+                next_event = self.next_event_time()
+                if next_event is not None:
+                    next_arrival = min(next_arrival, next_event)
+                idle_time += next_arrival - self.current_time
+                self.tick(next_arrival - self.current_time)
+                continue
+
+            run_length = process.burst_time_remaining
+            run_limit = self.max_run_length()
+            lone = False
+            if run_limit is not None and run_limit < run_length and not self.policy:
+                # Tidak ada proses lain yang siap: lompati batas kuantum sampai
+                # kedatangan berikutnya atau proses selesai
+                next_arrival = self.next_arrival_time()
+                horizon = run_length if next_arrival is None else min(run_length, next_arrival - self.current_time)
+                lone_limit = self.policy.lone_run_length(self, horizon)
+                if lone_limit is not None and lone_limit > run_limit:
+                    run_limit, lone = lone_limit, True
+            if run_limit is not None:
+                run_length = min(run_length, run_limit)
+            run_length = max(1, run_length)
+
+            start = self.current_time
+            process.status = 'running'
+            process.burst_time_remaining -= run_length
+            if lone:
+                self.policy.skip_quanta(self, run_length)
+                self.current_time += run_length
+            else:
+                self.tick(run_length)
+            first_run.setdefault(process.process_id, start)
+            if segments and segments[-1][0] == process.process_id and sum(segments[-1][1:]) == start:
+                segments[-1][2] += run_length
             else:
-                self.current_process = None # Tidak ada proses sama sekali
-        
-        return self.current_process
\ No newline at end of file
+                segments.append([process.process_id, start, run_length])
+            if process.burst_time_remaining <= 0:
+                process.status = 'terminated'
+                completion_times[process.process_id] = self.current_time
+
+        metrics = {}
+        for process in self.processes:
+            if process.process_id not in completion_times:
+                continue
+            turnaround = completion_times[process.process_id] - process.arrival_time
+            metrics[process.process_id] = {
+                "waiting_time": turnaround - process.burst_time_total,
+                "turnaround_time": turnaround,
+                "response_time": first_run[process.process_id] - process.arrival_time,
+            }
+
+        def average(key: str) -> float:
+            return sum(m[key] for m in metrics.values()) / len(metrics) if metrics else 0.0
+
+        return {
+            "segments": [tuple(segment) for segment in segments],
+            "completion_times": completion_times,
+            "metrics": metrics,
+            "average_waiting_time": average("waiting_time"),
+            "average_turnaround_time": average("turnaround_time"),
+            "average_response_time": average("response_time"),
+            "total_time": self.current_time,
+            "idle_time": idle_time,
+            "context_switches": sum(1 for before, after in zip(segments, segments[1:])
+                                    if before[0] != after[0]),
+        }
+
+
+def format_gantt(segments: list[tuple[str, int, int]]) -> str:
+    """
+    Membuat Gantt chart teks dari segmen (process_id, mulai, durasi).
+    Celah di antara segmen ditampilkan sebagai IDLE.
+
+    Contoh: "| P0 | P1 | IDLE | P0 |" di atas "0    3    6      8    10".
+    """
+    cells = []
+    clock = 0
+    for process_id, start, duration in segments:
+        if start > clock:
+            cells.append(("IDLE", clock))
+        cells.append((process_id, start))
+        clock = start + duration
+    bar, axis = "|", ""
+    for label, start in cells:
+        bar += f" {label} |"
+        axis += str(start).ljust(len(label) + 3)
+    return f"{bar}\n{axis}{clock}"
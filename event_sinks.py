@@ -0,0 +1,87 @@
+# File: event_sinks.py
+# Deskripsi: Event sink untuk MemoryManager. Sink hanya menerima event jika
+# didaftarkan lewat `MemoryManager.subscribe`, sehingga simulasi massal tanpa
+# sink tidak membayar biaya pembuatan event sama sekali.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+from trace_io import TraceWriter
+
+# Urutan elemen tuple event yang dikirim MemoryManager ke setiap sink
+EVENT_FIELDS = ('sequence', 'process_id', 'page_number', 'frame_number', 'hit', 'evicted_owner')
+
+
+class EventSink:
+    """
+    Antarmuka dasar event sink. MemoryManager memanggil `emit(event)` untuk
+    setiap akses, dengan event berupa tuple sesuai EVENT_FIELDS.
+    """
+    def emit(self, event: tuple):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RingBufferSink(EventSink):
+    """
+    Menyimpan `capacity` event terakhir di list berukuran tetap (mis. untuk
+    animasi UI). Event lama ditimpa; jumlah event yang terbuang dicatat.
+    """
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError("Kapasitas ring buffer harus lebih besar dari 0")
+        self.capacity = capacity
+        self._events = [None] * capacity
+        self._position = 0
+        self.total_events = 0
+
+    def emit(self, event: tuple):
+        self._events[self._position] = event
+        self._position = self._position + 1 if self._position + 1 < self.capacity else 0
+        self.total_events += 1
+
+    @property
+    def dropped(self) -> int:
+        """Jumlah event yang sudah tertimpa."""
+        return max(0, self.total_events - self.capacity)
+
+    def events(self) -> list[tuple]:
+        """Event yang tersimpan, urut dari yang paling lama."""
+        if self.total_events < self.capacity:
+            return self._events[:self._position]
+        return self._events[self._position:] + self._events[:self._position]
+
+    def clear(self):
+        self._events = [None] * self.capacity
+        self._position = 0
+        self.total_events = 0
+
+
+class FileSink(EventSink):
+    """
+    Menulis event ke trace biner (format trace_io.py) dengan nomor urut akses
+    sebagai tick, sehingga rekaman dapat di-replay lewat TraceReader.
+    """
+    def __init__(self, path: str, buffer_records: int = 65536):
+        self.writer = TraceWriter(path, buffer_records=buffer_records)
+
+    def emit(self, event: tuple):
+        sequence, process_id, page_number, _, hit, _ = event
+        self.writer.write(process_id, page_number, sequence, hit=hit)
+
+    def close(self):
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class CallbackSink(EventSink):
+    """Meneruskan setiap event ke fungsi callback (mis. handler UI)."""
+    def __init__(self, callback):
+        self.callback = callback
+        # Dipasang langsung agar tidak ada lapisan fungsi tambahan per event
+        self.emit = callback
@@ -4,155 +4,632 @@
 # Dikerjakan oleh: Tim Struktur Data (Backend)
 
 from collections import deque
-from core_models import PhysicalMemory, Process
+from core_models import CompactFrameTable, PhysicalMemory, Process, Statistics
+from replacement_policies import REPLACEMENT_POLICIES
+from tlb import TLB
 
 class MemoryManager:
     """
     Kelas utama untuk mengelola memori.
     Ini adalah "otak" di balik semua operasi memori.
     """
-    def __init__(self, total_frames: int, replacement_algorithm: str):
+    REPLACEMENT_SCOPES = ['GLOBAL', 'LOCAL']
+    FRAME_ALLOCATIONS = ['EQUAL', 'PROPORTIONAL']
+
+    def __init__(self, total_frames: int, replacement_algorithm: str, compact_frames: bool = False,
+                 reference_trace=None, policy_options: dict | None = None, tlb: TLB | None = None,
+                 replacement_scope: str = 'GLOBAL', frame_allocation: str = 'EQUAL'):
         """
         Inisialisasi Memory Manager.
         
         Args:
             total_frames (int): Jumlah total frame di memori fisik.
-            replacement_algorithm (str): Algoritma yang digunakan ('FIFO' atau 'LRU').
+            replacement_algorithm (str): Algoritma yang digunakan (nama policy terdaftar,
+                mis. 'FIFO', 'LRU', 'OPT', 'CLOCK', 'ENHANCED_CLOCK', 'AGING', 'NFU').
+            compact_frames (bool): Gunakan tabel frame berbasis array (hemat memori).
+            reference_trace (Iterable[tuple[str, int]] | None): Urutan akses global
+                (process_id, page_number) yang akan dijalankan. Wajib untuk 'OPT'.
+            policy_options (dict | None): Parameter tambahan untuk policy
+                (mis. {"aging_interval": 8} untuk 'AGING').
+            tlb (TLB | None): TLB opsional di depan lookup page table.
+            replacement_scope (str): 'GLOBAL' (korban dari semua frame) atau 'LOCAL'
+                (proses yang sudah memakai seluruh kuotanya mengganti halamannya sendiri).
+            frame_allocation (str): Pembagian kuota frame mode 'LOCAL' di antara proses
+                terdaftar yang sedang memakai memori: 'EQUAL' (rata) atau
+                'PROPORTIONAL' (sebanding jumlah halaman).
         """
-        if replacement_algorithm.upper() not in ['FIFO', 'LRU']:
-            raise ValueError("Algoritma harus 'FIFO' atau 'LRU'")
+        policy_class = REPLACEMENT_POLICIES.get(replacement_algorithm.upper())
+        if policy_class is None:
+            raise ValueError(f"Algoritma harus salah satu dari {list(REPLACEMENT_POLICIES)}")
+        if replacement_scope.upper() not in self.REPLACEMENT_SCOPES:
+            raise ValueError(f"Cakupan replacement harus salah satu dari {self.REPLACEMENT_SCOPES}")
+        if frame_allocation.upper() not in self.FRAME_ALLOCATIONS:
+            raise ValueError(f"Alokasi frame harus salah satu dari {self.FRAME_ALLOCATIONS}")
             
-        self.physical_memory = PhysicalMemory(total_frames)
+        self.physical_memory = PhysicalMemory(total_frames, compact=compact_frames)
         self.algorithm = replacement_algorithm.upper()
         
         # Struktur data untuk membantu algoritma page replacement
         # self.processes akan dibutuhkan untuk men-set valid bit jadi 0 saat eviksi
         self.processes = {} 
+
+        # Indeks resident set: frame milik setiap proses, sehingga frame proses yang
+        # selesai dapat dibebaskan sekaligus tanpa memindai tabel frame
+        self.resident_frames = {}  # {process_id: set(frame)}
+        # Pemilik setiap frame sebagai objek (tanpa lookup process_id saat eviksi)
+        self._frame_process = [None] * total_frames
+        self._frame_resident = [None] * total_frames  # resident set pemilik setiap frame
+
+        # Replacement lokal: kuota frame per proses, dihitung ulang secara lazy
+        # setiap kali proses mulai memakai memori atau dibebaskan
+        self.replacement_scope = replacement_scope.upper()
+        self.frame_allocation = frame_allocation.upper()
+        self.frame_quotas = {}  # {process_id: jumlah frame}
+        self._quota_overrides = {}  # {process_id: jumlah frame} yang ditetapkan dari luar (PFF)
+        self._quotas_dirty = True
+        # Proses yang memakai frame melebihi kuotanya, diperbarui setiap fault lokal
+        self._over_quota = set()
+
+        # Statistik hit/fault yang diperbarui oleh access_page dan access_many
+        self.statistics = Statistics()
         
-        # Antrian untuk melacak urutan kedatangan frame (untuk FIFO)
-        self.fifo_queue = deque()
-        # List untuk melacak urutan penggunaan frame (untuk LRU)
-        # Indeks 0 = paling lama tidak digunakan, Indeks terakhir = paling baru digunakan
-        self.lru_tracker = []
+        # Algoritma page replacement dipasang sebagai objek policy (lihat replacement_policies.py)
+        options = dict(policy_options or {})
+        if policy_class.needs_reference_trace:
+            options['reference_trace'] = reference_trace
+        self.policy = policy_class(total_frames, **options)
+        if self.replacement_scope == 'LOCAL':
+            self.policy.enable_local(self._frame_owner_id)
+
+        # TLB opsional. Pergantian proses pada access_page dianggap context switch.
+        self.tlb = tlb
+        # Mode multi-core: satu TLB per core, `tlb` menunjuk TLB core yang sedang aktif
+        self.cpu_tlbs = None
+
+        # Event sink opsional (lihat subscribe) dan detail akses terakhir untuk access_page
+        self._sinks = []
+        self._emitters = []
+        self._last_frame = None
+        self._last_evicted = None
+
+    def attach_cpu_tlbs(self, tlbs: list[TLB]):
+        """
+        Memasang satu TLB per core untuk simulasi multi-core. Halaman yang diusir
+        di-invalidate di semua TLB (TLB shootdown).
+        """
+        if not tlbs:
+            raise ValueError("Daftar TLB per core tidak boleh kosong")
+        self.cpu_tlbs = list(tlbs)
+        self.tlb = self.cpu_tlbs[0]
+
+    def select_cpu(self, core_id: int):
+        """Mengaktifkan TLB milik core `core_id` untuk akses berikutnya."""
+        if self.cpu_tlbs is not None:
+            self.tlb = self.cpu_tlbs[core_id]
+
+    @property
+    def fifo_queue(self) -> deque:
+        """Antrian frame FIFO (Kiri=Terlama). Hanya tersedia untuk algoritma FIFO."""
+        self.policy.compact()
+        return self.policy.queue
+
+    @property
+    def lru_tracker(self) -> list[int]:
+        """
+        Urutan frame LRU sebagai list (Indeks 0 = terlama, indeks terakhir = terbaru).
+        Hanya untuk tampilan/debugging; membangun list baru setiap dipanggil.
+        """
+        return list(self.policy.order)
 
     def register_process(self, process: Process):
         """Menambahkan proses ke dalam daftar yang dikelola oleh MMU."""
         self.processes[process.process_id] = process
+        self._quotas_dirty = True
+
+    def resident_set(self, process_id: str) -> set[int]:
+        """Salinan himpunan frame yang sedang ditempati proses."""
+        return set(self.resident_frames.get(process_id, ()))
+
+    def release_process(self, process: Process) -> int:
+        """
+        Membebaskan semua frame milik proses (mis. saat proses selesai) dalam satu
+        operasi: policy diberi tahu sekali lewat on_free_many, page table dan TLB
+        di-invalidate, frame kembali ke pool frame kosong, dan proses dikeluarkan
+        dari pembagian kuota.
+
+        Returns:
+            int: Jumlah frame yang dibebaskan.
+        """
+        process_id = process.process_id
+        if self.processes.pop(process_id, None) is not None:
+            self._quotas_dirty = True
+        frames = self.resident_frames.pop(process_id, None)
+        self._over_quota.discard(process_id)
+        if not frames:
+            return 0
+
+        self.policy.on_free_many(frames)
+        physical_memory = self.physical_memory
+        owner_of = physical_memory.frames.owner_of
+        tlbs = self.cpu_tlbs if self.cpu_tlbs is not None else [self.tlb] if self.tlb is not None else []
+        page_table = process.page_table
+        # Urutan menurun: frame berindeks terkecil dipakai ulang lebih dulu dari free-list
+        for frame_number in sorted(frames, reverse=True):
+            page_number = owner_of(frame_number)[1]
+            page_table_entry = page_table[page_number]
+            page_table_entry[0] = None
+            page_table_entry[1] = 0
+            for tlb in tlbs:
+                tlb.invalidate(process_id, page_number)
+            self._frame_process[frame_number] = None
+            self._frame_resident[frame_number] = None
+            physical_memory.free_frame(frame_number)
+        return len(frames)
+
+    def reconfigure(self, total_frames: int | None = None, replacement_algorithm: str | None = None,
+                    policy_options: dict | None = None, reference_trace=None):
+        """
+        Mengganti jumlah frame dan/atau algoritma replacement di tengah simulasi
+        (dipakai saat mencabangkan snapshot), dengan mempertahankan halaman resident.
+
+        Halaman tetap di frame yang sama selama nomor frame-nya masih ada, sehingga
+        page table-nya tidak disentuh. Jika frame berkurang, halaman di frame yang
+        hilang dipindahkan ke frame kosong atau, jika tidak muat, dikeluarkan tanpa
+        dicatat sebagai eviksi. Jika algoritma tidak berganti dan `policy_options`
+        maupun `reference_trace` tidak diisi, policy lama (beserta riwayat
+        recency/reference bit-nya) dipertahankan dan hanya diubah ukurannya.
+        Selain itu policy baru dibangun dengan memuat ulang frame resident dalam
+        urutan nomor frame. `reference_trace` hanya dipakai untuk policy seperti
+        OPT bila `policy_options` tidak memuat 'reference_trace'.
+        """
+        total_frames = total_frames if total_frames is not None else self.physical_memory.size
+        algorithm = (replacement_algorithm or self.algorithm).upper()
+        policy_class = REPLACEMENT_POLICIES.get(algorithm)
+        if policy_class is None:
+            raise ValueError(f"Algoritma harus salah satu dari {list(REPLACEMENT_POLICIES)}")
+        if total_frames <= 0:
+            raise ValueError("Jumlah frame harus lebih besar dari 0")
+
+        old_frames = self.physical_memory.frames
+        residents = [(frame_number, old_frames.owner_of(frame_number)[1], self._frame_process[frame_number])
+                     for frame_number in range(self.physical_memory.size) if old_frames.owner_of(frame_number)]
+
+        keep_policy = algorithm == self.algorithm and policy_options is None and reference_trace is None
+        if keep_policy:
+            self.policy.on_free_many({frame_number for frame_number, _, _ in residents
+                                      if frame_number >= total_frames})
+            self.policy.resize(total_frames)
+        else:
+            options = dict(policy_options or {})
+            if policy_class.needs_reference_trace:
+                options.setdefault('reference_trace', reference_trace)
+            self.policy = policy_class(total_frames, **options)
+            if self.replacement_scope == 'LOCAL':
+                self.policy.enable_local(self._frame_owner_id)
+        self.algorithm = algorithm
+        self.physical_memory = PhysicalMemory(total_frames, compact=isinstance(old_frames, CompactFrameTable))
+        self._frame_process = [None] * total_frames
+        self._frame_resident = [None] * total_frames
+        self.resident_frames = {}
+        self._quotas_dirty = True
 
-    def access_page(self, process: Process, page_number: int) -> dict:
+        tlbs = self.cpu_tlbs if self.cpu_tlbs is not None else [self.tlb] if self.tlb is not None else []
+        frames = self.physical_memory.frames
+        displaced = []
+        for frame_number, page_number, process in residents:
+            if frame_number >= total_frames:
+                displaced.append((process, page_number))
+                continue
+            # Halaman tetap di frame yang sama: page table tidak perlu diubah
+            frames.load(frame_number, process.process_id, page_number)
+            resident = self._resident_set_of(process)
+            resident.add(frame_number)
+            self._frame_process[frame_number] = process
+            self._frame_resident[frame_number] = resident
+            if not keep_policy:
+                self.policy.on_load(frame_number)
+        for process, page_number in displaced:
+            for tlb in tlbs:
+                tlb.invalidate(process.process_id, page_number)
+            if self.physical_memory.is_full():
+                page_table_entry = process.page_table[page_number]
+                page_table_entry[0] = None
+                page_table_entry[1] = 0
+            else:
+                self._load_page_to_frame(process, page_number, self.physical_memory.get_empty_frame_index())
+
+    def _rebalance_quotas(self):
+        """
+        Membagi frame fisik di antara proses terdaftar yang sudah memakai memori
+        (metode largest remainder). Proses yang belum tiba tidak ikut dibagi.
+        """
+        self._quotas_dirty = False
+        resident_frames = self.resident_frames
+        processes = [process for process_id, process in self.processes.items() if process_id in resident_frames]
+        if not processes:
+            self.frame_quotas = {}
+            return
+        total_frames = self.physical_memory.size
+        if self.frame_allocation == 'EQUAL':
+            weights = [1] * len(processes)
+        else:
+            weights = [process.num_pages for process in processes]
+        total_weight = sum(weights)
+        quotas = [total_frames * weight // total_weight for weight in weights]
+        # Sisa frame diberikan ke proses dengan pecahan terbesar (seri: urutan registrasi)
+        remainders = sorted(range(len(processes)),
+                            key=lambda i: (-(total_frames * weights[i] % total_weight), i))
+        for i in remainders[:total_frames - sum(quotas)]:
+            quotas[i] += 1
+        # Kuota eksplisit (set_frame_quotas) menggantikan bagian hasil pembagian;
+        # setiap proses minimal mendapat satu frame
+        overrides = self._quota_overrides
+        self.frame_quotas = {process.process_id: max(1, overrides.get(process.process_id, quota))
+                             for process, quota in zip(processes, quotas)}
+        self._refresh_over_quota()
+
+    def _refresh_over_quota(self):
+        frame_quotas = self.frame_quotas
+        self._over_quota = {process_id for process_id, frames in self.resident_frames.items()
+                            if len(frames) > frame_quotas.get(process_id, 0)}
+
+    def _update_over_quota(self, process_id: str):
+        frames = self.resident_frames.get(process_id)
+        if frames is not None and len(frames) > self.frame_quotas.get(process_id, 0):
+            self._over_quota.add(process_id)
+        else:
+            self._over_quota.discard(process_id)
+
+    def _frame_owner_id(self, frame_number: int) -> str:
+        """Pemilik frame untuk struktur per pemilik di policy (replacement lokal)."""
+        return self._frame_process[frame_number].process_id
+
+    def set_frame_quotas(self, quotas: dict):
+        """
+        Menetapkan kuota frame mode 'LOCAL' per proses secara eksplisit (mis. alokasi
+        PFFController). Proses tanpa entri tetap dibagi menurut `frame_allocation`.
+        """
+        self._quota_overrides = dict(quotas)
+        self._quotas_dirty = True
+
+    def _local_victim_candidates(self, process: Process):
+        """
+        Pemilik kandidat korban replacement lokal untuk proses yang mengalami fault.
+
+        Returns:
+            list | None: process_id pemilik frame kandidat, atau None jika frame
+            kosong atau korban global boleh dipakai.
+        """
+        resident = self._resident_set_of(process)
+        if self._quotas_dirty:
+            self._rebalance_quotas()
+        quota = self.frame_quotas.get(process.process_id)
+        if quota is None:
+            return None  # Proses tidak terdaftar: diperlakukan secara global
+        if resident and len(resident) >= quota:
+            return [process.process_id]  # Kuota penuh: ganti halaman milik sendiri
+        if not self.physical_memory.is_full():
+            return None
+        # Di bawah kuota tetapi memori penuh: ambil frame dari proses yang melebihi kuotanya
+        return sorted(self._over_quota) or None
+
+    def subscribe(self, sink):
+        """
+        Mendaftarkan event sink (objek dengan method `emit(event)`, lihat event_sinks.py).
+        Selama ada sink terdaftar, setiap akses menghasilkan tuple ringkas
+        (urutan_akses, process_id, page_number, frame_number, hit, evicted_owner).
+        """
+        self._sinks.append(sink)
+        self._emitters = [s.emit for s in self._sinks]
+
+    def unsubscribe(self, sink):
+        """Melepas event sink yang sebelumnya didaftarkan."""
+        self._sinks.remove(sink)
+        self._emitters = [s.emit for s in self._sinks]
+
+    def access(self, process: Process, page_number: int, is_write: bool = False) -> bool:
+        """
+        Mode cepat dari `access_page`: logika yang sama persis, tetapi hanya
+        memperbarui Statistics (dan event sink jika ada) tanpa membangun dict hasil.
+
+        Returns:
+            bool: True jika HIT, False jika FAULT.
+        """
+        policy = self.policy
+        if policy.observes_accesses:
+            policy.on_access(process, page_number)
+
+        # --- Langkah 0: Cek TLB (jika ada) ---
+        frame_number = None
+        tlb = self.tlb
+        if tlb is not None:
+            if tlb.current_asid != process.process_id:
+                tlb.switch_context(process.process_id)
+            frame_number = tlb.lookup(process.process_id, page_number)
+            if frame_number is not None:
+                self.statistics.increment_tlb_hits()
+            else:
+                self.statistics.increment_tlb_misses()
+
+        # --- Langkah 1: Cek Page Table untuk Page Hit atau Page Fault ---
+        if frame_number is None:
+            page_table_entry = process.page_table.get(page_number)
+            if page_table_entry and page_table_entry[1] == 1:  # valid_bit == 1
+                frame_number = page_table_entry[0]
+                if tlb is not None:
+                    tlb.insert(process.process_id, page_number, frame_number)
+
+        if frame_number is not None:
+            # --- PAGE HIT ---
+            if policy.tracks_hits:
+                policy.on_hit(frame_number)
+            if is_write:
+                policy.on_write(frame_number)
+            self.statistics.increment_hits(process.process_id)
+            hit = True
+            evicted_owner = None
+        else:
+            # --- PAGE FAULT ---
+            self.statistics.increment_faults(process.process_id)
+            frame_number, evicted_owner = self._handle_page_fault(process, page_number)
+            if tlb is not None:
+                tlb.insert(process.process_id, page_number, frame_number)
+            if is_write:
+                policy.on_write(frame_number)
+            hit = False
+
+        # Detail akses terakhir, dibaca access_page untuk membangun dict hasil
+        self._last_frame = frame_number
+        self._last_evicted = evicted_owner
+        if self._emitters:
+            event = (self.statistics.total_accesses, process.process_id, page_number, frame_number,
+                     hit, evicted_owner)
+            for emit in self._emitters:
+                emit(event)
+        return hit
+
+    def access_page(self, process: Process, page_number: int, is_write: bool = False) -> dict:
         """
         Fungsi utama yang menjadi "pintu depan" untuk semua akses memori.
         Mencoba mengakses halaman untuk sebuah proses.
+
+        Untuk simulasi massal yang hanya membutuhkan statistik, gunakan `access`
+        (tanpa dict hasil) atau `access_many`.
+
+        Args:
+            process (Process): Proses yang melakukan akses.
+            page_number (int): Nomor halaman virtual yang diakses.
+            is_write (bool): True jika akses berupa penulisan (menyalakan dirty bit).
         
         Returns:
             dict: Sebuah dictionary yang berisi hasil dari operasi akses.
         """
-        # --- Langkah 1: Cek Page Table untuk Page Hit atau Page Fault ---
-        page_table_entry = process.page_table.get(page_number)
-        
-        if page_table_entry and page_table_entry[1] == 1:  # valid_bit == 1
-            # --- PAGE HIT ---
-            frame_number = page_table_entry[0]
-            if self.algorithm == 'LRU':
-                self._update_lru_tracker(frame_number)
-                
+        if self.access(process, page_number, is_write):
             return {
                 "status": "HIT",
                 "process_id": process.process_id,
                 "page_number": page_number,
-                "frame_number": frame_number
+                "frame_number": self._last_frame
             }
-        
-        else:
-            # --- PAGE FAULT ---
-            # Cek apakah ada frame kosong
-            if not self.physical_memory.is_full():
-                target_frame = self.physical_memory.get_empty_frame_index()
-                self._load_page_to_frame(process, page_number, target_frame)
-                return {
-                    "status": "FAULT",
-                    "process_id": process.process_id,
-                    "page_number": page_number,
-                    "loaded_into_frame": target_frame,
-                    "evicted_page_info": None # Tidak ada yang diusir
-                }
-            else:
-                # Memori penuh, perlu page replacement
-                if self.algorithm == 'FIFO':
-                    victim_frame = self._run_fifo_replacement()
-                else: # LRU
-                    victim_frame = self._run_lru_replacement()
-                
-                # Dapatkan info halaman lama sebelum ditimpa
-                evicted_info = self.physical_memory.frames[victim_frame].copy()
-                
-                # Usir halaman lama
-                self._evict_page_from_frame(victim_frame)
-                
-                # Muat halaman baru ke frame korban
-                self._load_page_to_frame(process, page_number, victim_frame)
-                
-                return {
-                    "status": "FAULT",
-                    "process_id": process.process_id,
-                    "page_number": page_number,
-                    "loaded_into_frame": victim_frame,
-                    "evicted_page_info": evicted_info
-                }
+        evicted_info = None # Tidak ada yang diusir
+        if self._last_evicted is not None:
+            evicted_info = {"process_id": self._last_evicted[0], "page_number": self._last_evicted[1]}
+        return {
+            "status": "FAULT",
+            "process_id": process.process_id,
+            "page_number": page_number,
+            "loaded_into_frame": self._last_frame,
+            "evicted_page_info": evicted_info
+        }
+
+    def access_many(self, process: Process, page_numbers, record_status: bool = False) -> dict:
+        """
+        Versi batch dari `access_page` untuk satu proses dan banyak halaman.
+
+        Menjalankan logika yang sama persis (page table, algoritma replacement,
+        Statistics), tetapi tanpa membangun dict hasil untuk setiap akses.
+
+        Args:
+            process (Process): Proses yang melakukan akses.
+            page_numbers (Iterable[int]): Urutan halaman yang diakses.
+            record_status (bool): Jika True, sertakan status per akses
+                (bytearray, 1 = HIT, 0 = FAULT).
+
+        Returns:
+            dict: {"hits", "faults", "evictions" (list tuple (process_id, page_number)),
+                   "status" (bytearray atau None)}.
+        """
+        policy = self.policy
+        if policy.observes_accesses or self.tlb is not None or self._emitters:
+            # Policy seperti OPT, TLB, dan event sink harus melihat setiap akses, pakai jalur per akses
+            return self._access_many_generic(process, page_numbers, record_status)
+
+        page_table = process.page_table
+        page_table_get = page_table.get
+        process_id = process.process_id
+        handle_page_fault = self._handle_page_fault
+        physical_memory = self.physical_memory
+        frames = physical_memory.frames
+        owner_of = frames.owner_of
+        load_frame = frames.load
+        frame_process = self._frame_process
+        frame_resident = self._frame_resident
+        resident = self._resident_set_of(process)
+        # Replacement lokal selalu memakai jalur _handle_page_fault
+        local = self.replacement_scope == 'LOCAL'
+        on_hit = policy.on_hit if policy.tracks_hits else None
+        select_victim = policy.select_victim
+        on_load = policy.on_load
+        statistics = self.statistics
+        status = bytearray() if record_status else None
+        # Jendela geser diisi per fault dari jumlah hit sejak fault sebelumnya
+        record_history_run = statistics.record_history_run if statistics.window_sizes else None
+        record_eviction = statistics.record_eviction
+        evictions = []
+        hits = faults = hits_before_fault = 0
+
+        for page_number in page_numbers:
+            page_table_entry = page_table_get(page_number)
+            if page_table_entry and page_table_entry[1] == 1:
+                hits += 1
+                if on_hit is not None:
+                    on_hit(page_table_entry[0])
+                if status is not None:
+                    status.append(1)
+                continue
+
+            faults += 1
+            if status is not None:
+                status.append(0)
+            if record_history_run is not None:
+                record_history_run(hits - hits_before_fault)
+                hits_before_fault = hits
+            if local or frames.filled_count < physical_memory.size:
+                # Masih ada frame kosong (fase warm-up) atau replacement lokal: pakai jalur biasa
+                handle_page_fault(process, page_number)
+                continue
+
+            # Replacement versi inline dari _handle_page_fault: frame korban
+            # langsung ditimpa tanpa dikosongkan lalu diisi ulang.
+            victim_frame = select_victim()
+            evicted_owner = owner_of(victim_frame)
+            old_process = frame_process[victim_frame]
+            if old_process is not None:
+                old_entry = old_process.page_table[evicted_owner[1]]
+                old_entry[0] = None
+                old_entry[1] = 0
+                frame_resident[victim_frame].discard(victim_frame)
+            frame_process[victim_frame] = process
+            frame_resident[victim_frame] = resident
+            resident.add(victim_frame)
+            load_frame(victim_frame, process_id, page_number)
+            page_table_entry = page_table[page_number]
+            page_table_entry[0] = victim_frame
+            page_table_entry[1] = 1 # Set valid bit
+            on_load(victim_frame)
+            evictions.append(evicted_owner)
+            record_eviction(evicted_owner[0])
+
+        if record_history_run is not None and hits > hits_before_fault:
+            record_history_run(hits - hits_before_fault, 0)
+        statistics.record_batch(hits, faults, process_id, history=False)
+        return {"hits": hits, "faults": faults, "evictions": evictions, "status": status}
 
     # --- Fungsi Helper Internal (Private Methods) ---
 
+    def _access_many_generic(self, process: Process, page_numbers, record_status: bool) -> dict:
+        """Implementasi access_many berbasis access untuk algoritma tanpa jalur inline."""
+        access = self.access
+        status = bytearray() if record_status else None
+        evictions = []
+        hits = faults = 0
+        for page_number in page_numbers:
+            hit = access(process, page_number)
+            if hit:
+                hits += 1
+            else:
+                faults += 1
+                if self._last_evicted is not None:
+                    evictions.append(self._last_evicted)
+            if status is not None:
+                status.append(hit)
+        return {"hits": hits, "faults": faults, "evictions": evictions, "status": status}
+
+    def _handle_page_fault(self, process: Process, page_number: int) -> tuple[int, tuple | None]:
+        """
+        Menangani page fault: memilih frame (kosong atau korban) dan memuat halaman.
+
+        Returns:
+            tuple: (frame tujuan, (process_id, page_number) halaman yang diusir atau None).
+        """
+        local = self.replacement_scope == 'LOCAL'
+        owners = self._local_victim_candidates(process) if local else None
+
+        # Cek apakah ada frame kosong
+        if owners is None and not self.physical_memory.is_full():
+            target_frame = self.physical_memory.get_empty_frame_index()
+            self._load_page_to_frame(process, page_number, target_frame)
+            if local:
+                self._update_over_quota(process.process_id)
+            return target_frame, None
+
+        # Memori penuh (atau kuota lokal habis), perlu page replacement
+        if owners is None:
+            victim_frame = self.policy.select_victim()
+        else:
+            resident_frames = self.resident_frames
+            victim_frame = self.policy.select_victim_local(
+                owners, [resident_frames[process_id] for process_id in owners])
+
+        # Usir halaman lama. Frame korban langsung ditimpa, jadi tidak perlu
+        # dikembalikan ke pool frame kosong lebih dulu.
+        evicted_owner = self._evict_page_from_frame(victim_frame, free_frame=False)
+
+        # Muat halaman baru ke frame korban
+        self._load_page_to_frame(process, page_number, victim_frame)
+        if local:
+            # Hanya dua resident set yang berubah ukuran
+            self._update_over_quota(process.process_id)
+            if evicted_owner is not None:
+                self._update_over_quota(evicted_owner[0])
+        return victim_frame, evicted_owner
+
     def _load_page_to_frame(self, process: Process, page_number: int, frame_number: int):
         """Memuat halaman ke frame fisik dan mengupdate semua struktur data."""
         # 1. Update memori fisik
-        self.physical_memory.frames[frame_number] = {
-            "process_id": process.process_id,
-            "page_number": page_number
-        }
+        self.physical_memory.frames.load(frame_number, process.process_id, page_number)
         
         # 2. Update page table proses
         process.page_table[page_number][0] = frame_number
         process.page_table[page_number][1] = 1 # Set valid bit
+
+        # 3. Update indeks resident set
+        resident = self._resident_set_of(process)
+        resident.add(frame_number)
+        self._frame_process[frame_number] = process
+        self._frame_resident[frame_number] = resident
         
-        # 3. Update struktur data algoritma
-        if self.algorithm == 'FIFO' and frame_number not in self.fifo_queue:
-            self.fifo_queue.append(frame_number)
-        
-        if self.algorithm == 'LRU':
-            self._update_lru_tracker(frame_number)
+        # 4. Update struktur data algoritma
+        self.policy.on_load(frame_number)
 
-    def _evict_page_from_frame(self, frame_number: int):
-        """Membersihkan frame dan men-set page table lama menjadi tidak valid."""
-        page_info = self.physical_memory.frames[frame_number]
-        if not page_info: return
+    def _resident_set_of(self, process: Process) -> set:
+        resident = self.resident_frames.get(process.process_id)
+        if resident is None:
+            resident = self.resident_frames[process.process_id] = set()
+            self._quotas_dirty = True
+        return resident
+
+    def _evict_page_from_frame(self, frame_number: int, free_frame: bool = True) -> tuple | None:
+        """
+        Membersihkan frame dan men-set page table lama menjadi tidak valid.
+
+        Returns:
+            tuple | None: (process_id, page_number) halaman yang diusir, atau None jika frame kosong.
+        """
+        page_info = self.physical_memory.frames.owner_of(frame_number)
+        if not page_info: return None
         
-        process_id = page_info['process_id']
-        page_number = page_info['page_number']
+        process_id, page_number = page_info
+        self.statistics.record_eviction(process_id)
         
-        # Dapatkan objek proses lama dari daftar terdaftar
-        old_process = self.processes.get(process_id)
-        if old_process:
+        # Pemilik frame langsung dari indeks per frame
+        old_process = self._frame_process[frame_number]
+        if old_process is not None:
             # Set page table-nya menjadi tidak valid
             old_process.page_table[page_number][0] = None
             old_process.page_table[page_number][1] = 0
+            self._frame_resident[frame_number].discard(frame_number)
+            self._frame_process[frame_number] = None
+            self._frame_resident[frame_number] = None
+
+        # Translasi halaman yang diusir tidak boleh tertinggal di TLB (di semua core)
+        if self.cpu_tlbs is not None:
+            for tlb in self.cpu_tlbs:
+                tlb.invalidate(process_id, page_number)
+        elif self.tlb is not None:
+            self.tlb.invalidate(process_id, page_number)
             
-        # Kosongkan frame di memori fisik
-        self.physical_memory.frames[frame_number] = None
-
-    def _update_lru_tracker(self, accessed_frame: int):
-        """Memindahkan frame yang diakses ke akhir list (paling baru)."""
-        if accessed_frame in self.lru_tracker:
-            self.lru_tracker.remove(accessed_frame)
-        self.lru_tracker.append(accessed_frame)
-
-    def _run_fifo_replacement(self) -> int:
-        """Menentukan frame korban berdasarkan FIFO."""
-        # Frame korban adalah yang paling depan di antrian
-        victim_frame = self.fifo_queue.popleft()
-        return victim_frame
-
-    def _run_lru_replacement(self) -> int:
-        """Menentukan frame korban berdasarkan LRU."""
-        # Frame korban adalah yang paling awal di list (paling lama tidak digunakan)
-        victim_frame = self.lru_tracker.pop(0)
-        return victim_frame
\ No newline at end of file
+        # Kosongkan frame di memori fisik dan kembalikan ke pool frame kosong
+        if free_frame:
+            self.physical_memory.free_frame(frame_number)
+        return page_info
\ No newline at end of file
@@ -0,0 +1,206 @@
+# File: page_table.py
+# Deskripsi: Implementasi page table alternatif untuk proses berukuran besar.
+# Page table "dense" (dict berisi semua halaman) tetap menjadi default di Process;
+# modul ini menambahkan mode "sparse" dan "radix" yang entrinya baru dibuat
+# saat halaman pertama kali disentuh, serta salinan beku page table untuk
+# snapshot simulasi (lihat snapshot.py).
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+from array import array
+
+PAGE_TABLE_MODES = ['DENSE', 'SPARSE', 'RADIX']
+
+# Dict kosong bersama untuk page table sparse yang belum pernah disentuh
+# (hanya dibaca; entri pertama membuat dict milik page table itu sendiri)
+_NO_ENTRIES = {}
+
+
+class SparsePageTable:
+    """
+    Page table lazy: entri [nomor_frame_fisik, valid_bit] baru dibuat saat
+    halaman pertama kali disentuh lewat `page_table[halaman]`.
+
+    Antarmukanya sama dengan dict page table lama, sehingga MemoryManager
+    tidak perlu diubah. `get()` untuk halaman yang belum pernah disentuh
+    mengembalikan None (diperlakukan sebagai page fault).
+    """
+    __slots__ = ('num_pages', '_entries')
+
+    def __init__(self, num_pages: int):
+        self.num_pages = num_pages
+        self._entries = _NO_ENTRIES
+
+    def _check_range(self, page_number: int):
+        if not 0 <= page_number < self.num_pages:
+            raise KeyError(page_number)
+
+    def __getitem__(self, page_number: int) -> list:
+        entry = self._entries.get(page_number)
+        if entry is None:
+            self._check_range(page_number)
+            if self._entries is _NO_ENTRIES:
+                self._entries = {}
+            entry = self._entries[page_number] = [None, 0]
+        return entry
+
+    def get(self, page_number: int, default=None):
+        """Mengambil entri tanpa membuatnya (tidak ada alokasi untuk halaman baru)."""
+        return self._entries.get(page_number, default)
+
+    def __contains__(self, page_number) -> bool:
+        return isinstance(page_number, int) and 0 <= page_number < self.num_pages
+
+    def __len__(self) -> int:
+        # Ukuran page table secara virtual tetap sama dengan jumlah halaman proses
+        return self.num_pages
+
+    def __iter__(self):
+        return iter(range(self.num_pages))
+
+    def items(self):
+        """Mengembalikan pasangan (halaman, entri) yang sudah dimaterialisasi saja."""
+        return self._entries.items()
+
+    @property
+    def materialized_count(self) -> int:
+        """Jumlah entri yang benar-benar dialokasikan."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"SparsePageTable(pages={self.num_pages}, materialized={self.materialized_count})"
+
+
+class RadixPageTable(SparsePageTable):
+    """
+    Page table dua tingkat seperti pada hardware x86 (32-bit):
+    nomor halaman dibagi menjadi indeks direktori dan indeks tabel daun.
+
+    Tabel daun (berisi LEAF_SIZE slot) hanya dialokasikan ketika ada halaman
+    di rentangnya yang disentuh, dan entri di dalamnya juga dibuat secara lazy.
+    """
+    LEAF_BITS = 10
+    LEAF_SIZE = 1 << LEAF_BITS
+    LEAF_MASK = LEAF_SIZE - 1
+    __slots__ = ('_directory', '_materialized')
+
+    def __init__(self, num_pages: int):
+        self.num_pages = num_pages
+        # Direktori: {indeks_direktori: tabel_daun}
+        self._directory = {}
+        self._materialized = 0
+
+    def __getitem__(self, page_number: int) -> list:
+        leaf = self._directory.get(page_number >> self.LEAF_BITS)
+        if leaf is None:
+            self._check_range(page_number)
+            leaf = self._directory[page_number >> self.LEAF_BITS] = [None] * self.LEAF_SIZE
+        entry = leaf[page_number & self.LEAF_MASK]
+        if entry is None:
+            self._check_range(page_number)
+            entry = leaf[page_number & self.LEAF_MASK] = [None, 0]
+            self._materialized += 1
+        return entry
+
+    def get(self, page_number: int, default=None):
+        """Mengambil entri tanpa membuatnya (tidak ada alokasi untuk halaman baru)."""
+        leaf = self._directory.get(page_number >> self.LEAF_BITS)
+        if leaf is None:
+            return default
+        entry = leaf[page_number & self.LEAF_MASK]
+        return default if entry is None else entry
+
+    def items(self):
+        """Mengembalikan pasangan (halaman, entri) yang sudah dimaterialisasi saja."""
+        for directory_index, leaf in sorted(self._directory.items()):
+            base = directory_index << self.LEAF_BITS
+            for offset, entry in enumerate(leaf):
+                if entry is not None:
+                    yield base + offset, entry
+
+    @property
+    def materialized_count(self) -> int:
+        """Jumlah entri yang benar-benar dialokasikan."""
+        return self._materialized
+
+    @property
+    def leaf_count(self) -> int:
+        """Jumlah tabel daun yang sudah dialokasikan."""
+        return len(self._directory)
+
+    def __repr__(self) -> str:
+        return (f"RadixPageTable(pages={self.num_pages}, leaves={self.leaf_count}, "
+                f"materialized={self.materialized_count})")
+
+
+def create_page_table(num_pages: int, mode: str = 'DENSE'):
+    """
+    Membuat page table sesuai mode.
+
+    Args:
+        num_pages (int): Jumlah halaman virtual proses.
+        mode (str): 'DENSE' (dict penuh, perilaku lama), 'SPARSE', atau 'RADIX'.
+    """
+    mode = mode.upper()
+    if mode not in PAGE_TABLE_MODES:
+        raise ValueError("Mode page table harus 'DENSE', 'SPARSE', atau 'RADIX'")
+    if mode == 'DENSE':
+        # Page Table: {nomor_halaman_virtual: [nomor_frame_fisik, valid_bit]}
+        return {i: [None, 0] for i in range(num_pages)}
+    if mode == 'SPARSE':
+        return SparsePageTable(num_pages)
+    return RadixPageTable(num_pages)
+
+
+class PageTableImage:
+    """
+    Salinan beku (immutable) sebuah page table dalam dua array bertipe paralel:
+    nomor halaman dan nomor frame (-1 = entri tidak valid).
+
+    Mode 'DENSE' hanya menyimpan entri valid (entri lain selalu ada sebagai
+    [None, 0]); mode 'SPARSE'/'RADIX' menyimpan semua entri yang sudah
+    dimaterialisasi agar `materialized_count` ikut pulih. Satu image dapat
+    dipakai bersama oleh banyak snapshot dan cabang simulasi.
+    """
+    __slots__ = ('mode', 'num_pages', 'pages', 'frames')
+
+    def __init__(self, mode: str, num_pages: int, pages: array, frames: array):
+        self.mode = mode
+        self.num_pages = num_pages
+        self.pages = pages
+        self.frames = frames
+
+    @classmethod
+    def freeze(cls, page_table, num_pages: int) -> "PageTableImage":
+        """Membekukan page table (dict, SparsePageTable, atau RadixPageTable)."""
+        if isinstance(page_table, RadixPageTable):
+            mode = 'RADIX'
+        elif isinstance(page_table, SparsePageTable):
+            mode = 'SPARSE'
+        else:
+            mode = 'DENSE'
+        pages, frames = array('i'), array('i')
+        for page_number, entry in page_table.items():
+            if entry[1] == 1:
+                pages.append(page_number)
+                frames.append(entry[0])
+            elif mode != 'DENSE':
+                pages.append(page_number)
+                frames.append(-1)
+        return cls(mode, num_pages, pages, frames)
+
+    def materialize(self):
+        """Membangun page table baru yang bisa diubah dari image ini."""
+        page_table = create_page_table(self.num_pages, self.mode)
+        for page_number, frame_number in zip(self.pages, self.frames):
+            entry = page_table[page_number]
+            if frame_number >= 0:
+                entry[0] = frame_number
+                entry[1] = 1
+        return page_table
+
+    def __reduce__(self):
+        return PageTableImage, (self.mode, self.num_pages, self.pages, self.frames)
+
+    def __repr__(self) -> str:
+        return f"PageTableImage(mode={self.mode}, pages={self.num_pages}, entries={len(self.pages)})"
+
@@ -0,0 +1,208 @@
+# File: profiling.py
+# Deskripsi: Instrumentasi opsional untuk jalur panas simulator. Profiler
+# memasang pembungkus pengukur waktu (perf_counter_ns) sebagai atribut instance
+# pada MemoryManager, policy replacement, PhysicalMemory, dan CPUScheduler.
+# Selama profiler tidak dipasang, method aslinya dipanggil langsung sehingga
+# tidak ada pengecekan flag maupun biaya tambahan per panggilan.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+from array import array
+from time import perf_counter_ns
+
+# Penanda atribut yang sebelumnya tidak ada di __dict__ instance
+_MISSING = object()
+
+# Fase yang diukur: (nama fase, pemilik method ('self' = objek yang diinstrumentasi
+# atau nama atributnya), nama method).
+# Fase bersarang: waktu 'access' sudah termasuk 'page_fault', dan seterusnya.
+MEMORY_PHASES = (
+    ('access', 'self', 'access'),
+    ('access_many', 'self', 'access_many'),
+    ('page_fault', 'self', '_handle_page_fault'),
+    ('free_frame_search', 'physical_memory', 'get_empty_frame_index'),
+    ('victim_selection', 'policy', 'select_victim'),
+    ('victim_selection', 'policy', 'select_victim_from'),
+    ('victim_selection', 'policy', 'select_victim_local'),
+    ('eviction', 'self', '_evict_page_from_frame'),
+    ('page_load', 'self', '_load_page_to_frame'),
+    ('policy_hit_update', 'policy', 'on_hit'),
+)
+SCHEDULER_PHASES = (
+    ('select_next_process', 'self', 'select_next_process'),
+    ('release_arrivals', 'self', '_release_arrivals'),
+    ('policy_select', 'policy', 'select'),
+    ('tick', 'self', 'tick'),
+)
+
+
+class PhaseTimer:
+    """
+    Akumulator waktu satu fase. Durasi per panggilan disimpan di buffer
+    array('q') berukuran tetap yang dialokasikan sekali di awal (ring buffer,
+    sampel lama ditimpa) untuk menghitung persentil; jumlah panggilan dan total
+    waktu selalu dihitung untuk semua panggilan.
+    """
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.samples = array('q', bytes(8 * capacity))
+        self.calls = 0
+        self.total_ns = 0
+
+    def record(self, elapsed_ns: int):
+        self.samples[self.calls % self.capacity] = elapsed_ns
+        self.calls += 1
+        self.total_ns += elapsed_ns
+
+    def percentile(self, fraction: float) -> int:
+        """Persentil durasi (ns) dari sampel yang tersimpan."""
+        count = min(self.calls, self.capacity)
+        if count == 0:
+            return 0
+        ordered = sorted(self.samples[:count])
+        return ordered[min(count - 1, int(fraction * count))]
+
+
+class Profiler:
+    """
+    Profiler per fase untuk MemoryManager dan CPUScheduler.
+
+    Pemakaian:
+        profiler = Profiler()
+        profiler.attach_memory_manager(memory_manager)
+        profiler.attach_scheduler(scheduler)
+        ... jalankan simulasi ...
+        profiler.detach()
+        print(profiler.format_report())
+
+    Pasang profiler sebelum simulasi dimulai: SimulationEngine dan access_many
+    menyimpan referensi method ke variabel lokal saat mulai berjalan. Waktu fase
+    induk termasuk biaya pembungkus fase anaknya.
+    """
+    def __init__(self, sample_capacity: int = 65536):
+        if sample_capacity <= 0:
+            raise ValueError("Kapasitas sampel harus lebih besar dari 0")
+        self.sample_capacity = sample_capacity
+        # {(komponen, algoritma): {fase: PhaseTimer}}
+        self.timers = {}
+        # Method yang sudah dibungkus: [(objek, nama method, atribut instance sebelumnya)]
+        self._installed = []
+        self._wrapped = set()  # {(id(objek), nama method)} yang dibungkus profiler ini
+
+    def attach_memory_manager(self, memory_manager):
+        """Memasang instrumentasi pada MemoryManager (dan policy serta memori fisiknya)."""
+        self._attach('memory', memory_manager.algorithm, memory_manager, MEMORY_PHASES)
+
+    def attach_scheduler(self, scheduler):
+        """
+        Memasang instrumentasi pada CPUScheduler. Untuk MultiCoreScheduler,
+        setiap core diinstrumentasi dan diakumulasikan ke timer yang sama.
+        """
+        for core in getattr(scheduler, 'cores', None) or [scheduler]:
+            self._attach('scheduler', core.algorithm, core, SCHEDULER_PHASES)
+
+    def detach(self):
+        """Melepas semua pembungkus; method asli kembali dipanggil langsung."""
+        for owner, method_name, original in reversed(self._installed):
+            # Pembungkus disimpan di __dict__ instance, method kelas tidak tersentuh.
+            # Hook yang memang diikat per instance (mis. on_hit LRU) dipasang kembali.
+            if original is _MISSING:
+                vars(owner).pop(method_name, None)
+            else:
+                setattr(owner, method_name, original)
+        self._installed = []
+        self._wrapped = set()
+
+    def reset(self):
+        """Mengosongkan semua timer tanpa melepas instrumentasi."""
+        for phases in self.timers.values():
+            for timer in phases.values():
+                # Sampel lama cukup diabaikan: percentile hanya membaca `calls` sampel pertama
+                timer.calls = timer.total_ns = 0
+
+    def _attach(self, component: str, algorithm: str, target, phases):
+        timers = self.timers.setdefault((component, algorithm), {})
+        for phase, owner_name, method_name in phases:
+            owner = target if owner_name == 'self' else getattr(target, owner_name)
+            key = (id(owner), method_name)
+            if key in self._wrapped:
+                continue  # Sudah dibungkus oleh profiler ini
+            timer = timers.get(phase)
+            if timer is None:
+                timer = timers[phase] = PhaseTimer(self.sample_capacity)
+            original = vars(owner).get(method_name, _MISSING)
+            setattr(owner, method_name, self._timed(getattr(owner, method_name), timer))
+            self._installed.append((owner, method_name, original))
+            self._wrapped.add(key)
+
+    @staticmethod
+    def _timed(method, timer: PhaseTimer):
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timer.record(perf_counter_ns() - start)
+        return timed
+
+    def report(self) -> dict:
+        """
+        Ringkasan waktu per komponen/algoritma/fase.
+
+        Returns:
+            dict: {"komponen/algoritma": {fase: {"calls", "total_ns", "mean_ns",
+                   "p50_ns", "p99_ns", "share"}}}. `share` adalah porsi terhadap
+                   fase akar ('access' + 'access_many' untuk memori,
+                   'select_next_process' + 'tick' untuk penjadwal). Fase turunan
+                   'page_table_lookup' ('access' tanpa penanganan fault) dan
+                   'scheduler_bookkeeping' (seleksi tanpa kedatangan dan policy)
+                   ditambahkan bila fase induknya pernah dipanggil. 'access_many'
+                   mengganti halaman secara inline tanpa '_handle_page_fault', jadi
+                   waktunya tidak bisa dipecah; bila ada batch yang terukur,
+                   'page_table_lookup' tidak dihitung karena 'page_fault' juga
+                   memuat fault dari batch.
+        """
+        report = {}
+        for (component, algorithm), phases in self.timers.items():
+            if component == 'memory':
+                roots = ('access', 'access_many')
+                derived = ('page_table_lookup', ('access',), ('page_fault',))
+                if 'access_many' in phases and phases['access_many'].calls:
+                    derived = None
+            else:
+                roots = ('select_next_process', 'tick')
+                derived = ('scheduler_bookkeeping', ('select_next_process',), ('release_arrivals', 'policy_select'))
+            root_ns = sum(phases[name].total_ns for name in roots if name in phases)
+
+            rows = {}
+            for phase, timer in phases.items():
+                if timer.calls == 0:
+                    continue
+                rows[phase] = {"calls": timer.calls, "total_ns": timer.total_ns,
+                               "mean_ns": timer.total_ns / timer.calls,
+                               "p50_ns": timer.percentile(0.50), "p99_ns": timer.percentile(0.99),
+                               "share": timer.total_ns / root_ns if root_ns else 0.0}
+
+            derived_name, parents, children = derived or (None, (), ())
+            calls = sum(rows[name]["calls"] for name in parents if name in rows)
+            if calls:
+                total_ns = max(0, sum(rows[name]["total_ns"] for name in parents if name in rows)
+                               - sum(rows[name]["total_ns"] for name in children if name in rows))
+                rows[derived_name] = {"calls": calls, "total_ns": total_ns, "mean_ns": total_ns / calls,
+                                      "p50_ns": None, "p99_ns": None,
+                                      "share": total_ns / root_ns if root_ns else 0.0}
+            if rows:
+                report[f"{component}/{algorithm}"] = rows
+        return report
+
+    def format_report(self) -> str:
+        """Tabel teks dari `report()`, fase diurutkan dari total waktu terbesar."""
+        lines = []
+        for group, rows in self.report().items():
+            lines.append(f"[{group}]")
+            lines.append(f"  {'Fase':<24} {'Panggilan':>10} {'Total (ms)':>11} {'Rata2 (ns)':>11} "
+                         f"{'p99 (ns)':>9} {'Porsi':>7}")
+            for phase, row in sorted(rows.items(), key=lambda item: -item[1]["total_ns"]):
+                p99 = f"{row['p99_ns']:,}" if row["p99_ns"] is not None else "-"
+                lines.append(f"  {phase:<24} {row['calls']:>10,} {row['total_ns'] / 1e6:>11.2f} "
+                             f"{row['mean_ns']:>11,.0f} {p99:>9} {row['share']:>7.1%}")
+        return "\n".join(lines)
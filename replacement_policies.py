@@ -0,0 +1,873 @@
+# File: replacement_policies.py
+# Deskripsi: Algoritma page replacement dalam bentuk kelas-kelas "policy" yang
+# bisa dipasang ke MemoryManager. Setiap policy didaftarkan lewat registry
+# sehingga algoritma baru tidak perlu menambah cabang `if` di MemoryManager.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import heapq
+from array import array
+from collections import OrderedDict, deque
+
+from trace_analysis import build_next_use_index
+
+# Registry: {nama_algoritma: kelas_policy}
+REPLACEMENT_POLICIES = {}
+
+
+def register_policy(name: str):
+    """Decorator untuk mendaftarkan kelas policy dengan nama algoritma tertentu."""
+    def decorator(policy_class):
+        policy_class.name = name.upper()
+        REPLACEMENT_POLICIES[name.upper()] = policy_class
+        return policy_class
+    return decorator
+
+
+def create_policy(name: str, total_frames: int, **options) -> "ReplacementPolicy":
+    """Membuat objek policy berdasarkan nama algoritma."""
+    policy_class = REPLACEMENT_POLICIES.get(name.upper())
+    if policy_class is None:
+        raise ValueError(f"Algoritma harus salah satu dari {list(REPLACEMENT_POLICIES)}")
+    return policy_class(total_frames, **options)
+
+
+class ReplacementPolicy:
+    """
+    Antarmuka dasar algoritma page replacement.
+
+    MemoryManager memanggil hook berikut:
+        - on_access(process, page_number): sebelum setiap akses (hanya jika
+          `observes_accesses` bernilai True).
+        - on_hit(frame): saat page hit (hanya jika `tracks_hits` bernilai True).
+        - on_load(frame): setelah halaman dimuat ke sebuah frame.
+        - on_write(frame): saat akses bersifat tulis (menandai dirty bit).
+        - select_victim(): memilih frame korban ketika memori penuh.
+        - select_victim_from(frames): memilih korban hanya di antara `frames`
+          (replacement lokal, korban harus milik proses yang mengalami fault).
+        - enable_local(owner_of): replacement lokal dipakai; policy boleh menyimpan
+          urutannya per pemilik frame (`owner_of(frame)` dibaca saat on_load).
+        - select_victim_local(owners, frame_sets): korban di antara frame milik
+          `owners`; `frame_sets` adalah resident set masing-masing pemilik.
+        - on_free(frame): frame dikosongkan di luar proses replacement.
+        - on_free_many(frames): banyak frame dikosongkan sekaligus (proses selesai).
+        - resize(total_frames): jumlah frame berubah (MemoryManager.reconfigure);
+          frame di luar ukuran baru sudah dilepas lewat on_free_many.
+    """
+    name = None
+    tracks_hits = True
+    observes_accesses = False
+    needs_reference_trace = False
+    # Replacement lokal: {pemilik: struktur urutan frame miliknya}, diisi oleh enable_local
+    _owned = None
+
+    def __init__(self, total_frames: int):
+        self.total_frames = total_frames
+
+    def on_access(self, process, page_number: int):
+        pass
+
+    def on_hit(self, frame: int):
+        pass
+
+    def on_load(self, frame: int):
+        pass
+
+    def on_write(self, frame: int):
+        pass
+
+    def select_victim(self) -> int:
+        raise NotImplementedError
+
+    def select_victim_from(self, frames) -> int:
+        raise NotImplementedError
+
+    def enable_local(self, owner_of):
+        pass
+
+    def select_victim_local(self, owners, frame_sets) -> int:
+        # Policy tanpa struktur per pemilik: pilih dari gabungan resident set
+        if len(frame_sets) == 1:
+            return self.select_victim_from(frame_sets[0])
+        return self.select_victim_from(set().union(*frame_sets))
+
+    def on_free(self, frame: int):
+        pass
+
+    def on_free_many(self, frames):
+        for frame in frames:
+            self.on_free(frame)
+
+    def resize(self, total_frames: int):
+        self.total_frames = total_frames
+        if self._owned is not None:
+            frame_owner = self._frame_owner[:total_frames]
+            frame_owner.extend([None] * (total_frames - len(frame_owner)))
+            self._frame_owner = frame_owner
+
+    # --- Struktur per pemilik untuk replacement lokal ---
+
+    def _track_owners(self, owner_of):
+        self._owner_of = owner_of
+        self._frame_owner = [None] * self.total_frames
+        self._owned = {}
+
+    def _new_group(self):
+        raise NotImplementedError
+
+    def _discard_from_group(self, group, frame: int):
+        raise NotImplementedError
+
+    def _claim(self, frame: int):
+        """Mencatat pemilik frame yang baru dimuat; mengembalikan struktur milik pemilik itu."""
+        owner = self._owner_of(frame)
+        previous = self._frame_owner[frame]
+        if previous is not None and previous != owner:
+            self._disown(frame)
+        self._frame_owner[frame] = owner
+        group = self._owned.get(owner)
+        if group is None:
+            group = self._owned[owner] = self._new_group()
+        return group
+
+    def _disown(self, frame: int):
+        """Mengeluarkan frame dari struktur pemiliknya (dikosongkan atau berpindah pemilik)."""
+        owner = self._frame_owner[frame]
+        if owner is None:
+            return
+        self._frame_owner[frame] = None
+        group = self._owned[owner]
+        self._discard_from_group(group, frame)
+        if not len(group):
+            del self._owned[owner]
+
+    def _pop_oldest_owned(self, owners) -> int:
+        """
+        Korban lokal untuk struktur OrderedDict {frame: stempel}: kepala urutan
+        dengan stempel terkecil di antara `owners` (O(1) untuk satu pemilik).
+        """
+        owned = self._owned
+        if len(owners) == 1:
+            owner = owners[0]
+        else:
+            owner = min(owners, key=lambda owner: next(iter(owned[owner].values())))
+        group = owned[owner]
+        victim_frame, _ = group.popitem(last=False)
+        self._frame_owner[victim_frame] = None
+        if not group:
+            del owned[owner]
+        return victim_frame
+
+
+def _resized(buffer, size: int):
+    """Salinan bytearray/array per frame dengan panjang `size` (frame baru bernilai nol)."""
+    resized = buffer[:size]
+    resized.extend(bytes(size - len(resized)))
+    return resized
+
+
+class _OwnedFrames:
+    """Frame milik satu pemilik (replacement lokal) beserta heap dan cache urutan korbannya."""
+    __slots__ = ('frames', 'heap', 'order', 'position')
+
+    def __init__(self):
+        self.frames = set()
+        self.heap = []  # Entri basi dibuang secara lazy
+        self.order = None
+        self.position = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+
+class _ClockRing:
+    """Ring CLOCK satu pemilik (replacement lokal): frame dalam urutan sapuan dan jarumnya."""
+    __slots__ = ('frames', 'positions', 'hand')
+
+    def __init__(self):
+        self.frames = []
+        self.positions = {}  # {frame: indeks di ring}
+        self.hand = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def add(self, frame: int):
+        if frame not in self.positions:
+            self.positions[frame] = len(self.frames)
+            self.frames.append(frame)
+
+    def discard(self, frame: int):
+        # Frame terakhir mengisi posisi yang kosong (O(1))
+        index = self.positions.pop(frame, None)
+        if index is None:
+            return
+        last = self.frames.pop()
+        if index < len(self.frames):
+            self.frames[index] = last
+            self.positions[last] = index
+        if self.hand >= len(self.frames):
+            self.hand = 0
+
+
+@register_policy('FIFO')
+class FIFOPolicy(ReplacementPolicy):
+    """First-In First-Out: korban adalah frame yang paling awal dimuat."""
+    tracks_hits = False
+
+    def __init__(self, total_frames: int):
+        super().__init__(total_frames)
+        # Antrian untuk melacak urutan kedatangan frame
+        self.queue = deque()
+        # Frame yang dimuat tidak pernah ada di antrian sebagai entri hidup: frame
+        # kosong belum pernah masuk, dan frame korban sudah dikeluarkan oleh select_victim.
+        self.on_load = self.queue.append
+        # Entri basi dari on_free: {frame: jumlah entri terdepan frame itu yang harus
+        # dilewati}. Dibuang secara lazy saat antrian di-pop (bukan queue.remove O(n)).
+        self._stale = {}
+        self._stale_count = 0
+
+    def _skip_stale(self, frame: int) -> bool:
+        """Mengonsumsi satu entri basi `frame` bila ada; True jika entri harus dilewati."""
+        remaining = self._stale.get(frame)
+        if not remaining:
+            return False
+        if remaining == 1:
+            del self._stale[frame]
+        else:
+            self._stale[frame] = remaining - 1
+        self._stale_count -= 1
+        return True
+
+    def compact(self):
+        """Membuang semua entri basi dari antrian (di tempat, on_load tetap terikat)."""
+        if self._stale_count:
+            kept = [frame for frame in self.queue if not self._skip_stale(frame)]
+            self.queue.clear()
+            self.queue.extend(kept)
+
+    def select_victim(self) -> int:
+        # Frame korban adalah entri hidup paling depan di antrian
+        victim_frame = self.queue.popleft()
+        while self._stale_count and self._skip_stale(victim_frame):
+            victim_frame = self.queue.popleft()
+        if self._owned is not None:
+            self._disown(victim_frame)
+        return victim_frame
+
+    def select_victim_from(self, frames) -> int:
+        # Frame paling awal dimuat di antara kandidat
+        self.compact()
+        victim_frame = next(frame for frame in self.queue if frame in frames)
+        self.queue.remove(victim_frame)
+        return victim_frame
+
+    def enable_local(self, owner_of):
+        # Per pemilik: OrderedDict {frame: nomor urut pemuatan}
+        self._track_owners(owner_of)
+        self._loads = 0
+        self.on_load = self._on_load_local
+
+    def _on_load_local(self, frame: int):
+        self.queue.append(frame)
+        self._loads += 1
+        self._claim(frame)[frame] = self._loads
+
+    def _new_group(self):
+        return OrderedDict()
+
+    def _discard_from_group(self, group, frame: int):
+        group.pop(frame, None)
+
+    def select_victim_local(self, owners, frame_sets) -> int:
+        if self._owned is None:
+            return super().select_victim_local(owners, frame_sets)
+        victim_frame = self._pop_oldest_owned(owners)
+        # Entri korban di antrian global menjadi basi
+        self._mark_stale(victim_frame)
+        return victim_frame
+
+    def _mark_stale(self, frame: int):
+        self._stale[frame] = self._stale.get(frame, 0) + 1
+        self._stale_count += 1
+        # Entri basi dibatasi sebanding dengan panjang antrian
+        if self._stale_count > len(self.queue) // 2 + 16:
+            self.compact()
+
+    def on_free(self, frame: int):
+        self._mark_stale(frame)
+        if self._owned is not None:
+            self._disown(frame)
+
+    def on_free_many(self, frames):
+        # Satu kali saring O(n), bukan queue.remove O(n) per frame.
+        # Antrian diisi ulang di tempat karena on_load terikat ke objek deque ini.
+        self.compact()
+        kept = [frame for frame in self.queue if frame not in frames]
+        self.queue.clear()
+        self.queue.extend(kept)
+        if self._owned is not None:
+            for frame in frames:
+                self._disown(frame)
+
+
+@register_policy('LRU')
+class LRUPolicy(ReplacementPolicy):
+    """Least Recently Used dengan OrderedDict: touch dan pemilihan korban O(1)."""
+    def __init__(self, total_frames: int):
+        super().__init__(total_frames)
+        # Kunci pertama = paling lama tidak digunakan, kunci terakhir = paling baru digunakan.
+        self.order = OrderedDict()
+        # Hook langsung memakai method C milik OrderedDict (tanpa lapisan fungsi Python)
+        self.on_hit = self.order.move_to_end
+        self.on_load = self.order.setdefault
+
+    def select_victim(self) -> int:
+        # Frame korban adalah kunci paling awal (paling lama tidak digunakan)
+        victim_frame, _ = self.order.popitem(last=False)
+        if self._owned is not None:
+            self._disown(victim_frame)
+        return victim_frame
+
+    def select_victim_from(self, frames) -> int:
+        # Kandidat yang paling lama tidak digunakan
+        victim_frame = next(frame for frame in self.order if frame in frames)
+        del self.order[victim_frame]
+        return victim_frame
+
+    def enable_local(self, owner_of):
+        # Per pemilik: OrderedDict {frame: nomor urut pemakaian terakhir}
+        self._track_owners(owner_of)
+        self._uses = 0
+        self.on_hit = self._on_hit_local
+        self.on_load = self._on_load_local
+
+    def _on_hit_local(self, frame: int):
+        self.order.move_to_end(frame)
+        self._uses += 1
+        group = self._owned[self._frame_owner[frame]]
+        group[frame] = self._uses
+        group.move_to_end(frame)
+
+    def _on_load_local(self, frame: int):
+        self.order.setdefault(frame)
+        self._uses += 1
+        group = self._claim(frame)
+        group[frame] = self._uses
+        group.move_to_end(frame)
+
+    def _new_group(self):
+        return OrderedDict()
+
+    def _discard_from_group(self, group, frame: int):
+        group.pop(frame, None)
+
+    def select_victim_local(self, owners, frame_sets) -> int:
+        if self._owned is None:
+            return super().select_victim_local(owners, frame_sets)
+        victim_frame = self._pop_oldest_owned(owners)
+        del self.order[victim_frame]
+        return victim_frame
+
+    def on_free(self, frame: int):
+        self.order.pop(frame, None)
+        if self._owned is not None:
+            self._disown(frame)
+
+
+@register_policy('OPT')
+class OPTPolicy(ReplacementPolicy):
+    """
+    Algoritma optimal Belady: korban adalah frame yang paling lama lagi akan
+    dipakai. Membutuhkan reference_trace (process_id, page_number) yang akan
+    dijalankan, lalu memakai indeks next-use dan max-heap (O(log frame) per akses).
+    """
+    observes_accesses = True
+    needs_reference_trace = True
+
+    def __init__(self, total_frames: int, reference_trace=None):
+        super().__init__(total_frames)
+        if reference_trace is None:
+            raise ValueError("Algoritma 'OPT' membutuhkan reference_trace")
+        self.trace = list(reference_trace)
+        self.next_use = build_next_use_index(self.trace)
+        self.time = 0
+        self._current_next_use = 0
+        # Entri heap: (-next_use, frame). Entri basi dibuang secara lazy.
+        self._heap = []
+        self._frame_next_use = {}
+
+    def on_access(self, process, page_number: int):
+        """Memajukan waktu OPT satu akses dan memastikan akses sesuai reference_trace."""
+        time = self.time
+        if time >= len(self.trace) or self.trace[time] != (process.process_id, page_number):
+            raise ValueError(
+                f"Akses ({process.process_id}, {page_number}) tidak sesuai dengan reference_trace OPT "
+                f"pada posisi {time}")
+        self._current_next_use = self.next_use[time]
+        self.time = time + 1
+
+    def _record_next_use(self, frame: int):
+        """Mencatat waktu pemakaian berikutnya dari frame yang baru diakses (O(log frame))."""
+        next_use = self._current_next_use
+        frame_next_use = self._frame_next_use
+        frame_next_use[frame] = next_use
+        heapq.heappush(self._heap, (-next_use, frame))
+        # Bersihkan entri basi agar ukuran heap tetap sebanding dengan jumlah frame
+        if len(self._heap) > 4 * self.total_frames + 16:
+            self._heap = [(-use, f) for f, use in frame_next_use.items()]
+            heapq.heapify(self._heap)
+        if self._owned is not None:
+            group = self._owned[self._frame_owner[frame]]
+            heapq.heappush(group.heap, (-next_use, frame))
+            if len(group.heap) > 4 * len(group.frames) + 16:
+                group.heap = [(-frame_next_use[f], f) for f in group.frames]
+                heapq.heapify(group.heap)
+
+    on_hit = _record_next_use
+
+    def on_load(self, frame: int):
+        if self._owned is not None:
+            self._claim(frame).frames.add(frame)
+        self._record_next_use(frame)
+
+    def select_victim(self) -> int:
+        heap = self._heap
+        frame_next_use = self._frame_next_use
+        while True:
+            negative_next_use, victim_frame = heapq.heappop(heap)
+            if frame_next_use.get(victim_frame) == -negative_next_use:
+                del frame_next_use[victim_frame]
+                if self._owned is not None:
+                    self._disown(victim_frame)
+                return victim_frame
+
+    def select_victim_from(self, frames) -> int:
+        # Entri heap milik korban menjadi basi dan dibuang secara lazy oleh select_victim
+        frame_next_use = self._frame_next_use
+        victim_frame = min(frames, key=lambda frame: (-frame_next_use[frame], frame))
+        del frame_next_use[victim_frame]
+        return victim_frame
+
+    def enable_local(self, owner_of):
+        # Per pemilik: max-heap (-next_use, frame) sendiri, entri basi dibuang secara lazy
+        self._track_owners(owner_of)
+
+    def _new_group(self):
+        return _OwnedFrames()
+
+    def _discard_from_group(self, group, frame: int):
+        group.frames.discard(frame)
+
+    def select_victim_local(self, owners, frame_sets) -> int:
+        owned = self._owned
+        if owned is None:
+            return super().select_victim_local(owners, frame_sets)
+        frame_next_use = self._frame_next_use
+        frame_owner = self._frame_owner
+        best = None
+        for owner in owners:
+            heap = owned[owner].heap
+            while True:
+                negative_next_use, frame = heap[0]
+                if frame_owner[frame] == owner and frame_next_use.get(frame) == -negative_next_use:
+                    break
+                heapq.heappop(heap)
+            if best is None or heap[0] < best:
+                best = heap[0]
+        victim_frame = best[1]
+        del frame_next_use[victim_frame]
+        self._disown(victim_frame)
+        return victim_frame
+
+    def on_free(self, frame: int):
+        self._frame_next_use.pop(frame, None)
+        if self._owned is not None:
+            self._disown(frame)
+
+
+@register_policy('CLOCK')
+class ClockPolicy(ReplacementPolicy):
+    """
+    CLOCK (second chance): setiap frame memiliki reference bit. Jarum jam
+    menyapu frame secara melingkar; frame dengan bit 1 diberi kesempatan
+    kedua (bit direset), frame dengan bit 0 menjadi korban. Hit hanya
+    menyalakan bit sehingga biayanya O(1) tanpa memindahkan struktur apa pun.
+    """
+    def __init__(self, total_frames: int):
+        super().__init__(total_frames)
+        self.reference_bits = bytearray(total_frames)
+        self.hand = 0
+
+    def on_hit(self, frame: int):
+        self.reference_bits[frame] = 1
+
+    def on_load(self, frame: int):
+        self.reference_bits[frame] = 1
+        if self._owned is not None:
+            self._claim(frame).add(frame)
+
+    def select_victim(self) -> int:
+        reference_bits = self.reference_bits
+        hand = self.hand
+        while reference_bits[hand]:
+            reference_bits[hand] = 0
+            hand = (hand + 1) % self.total_frames
+        self.hand = (hand + 1) % self.total_frames
+        return hand
+
+    def select_victim_from(self, frames) -> int:
+        # Jarum yang sama, tetapi frame di luar kandidat dilewati tanpa mereset bitnya
+        reference_bits = self.reference_bits
+        hand = self.hand
+        while hand not in frames or reference_bits[hand]:
+            if hand in frames:
+                reference_bits[hand] = 0
+            hand = (hand + 1) % self.total_frames
+        self.hand = (hand + 1) % self.total_frames
+        return hand
+
+    def enable_local(self, owner_of):
+        # Per pemilik: ring dengan jarum sendiri. Frame korban tetap di ring
+        # pemiliknya dan baru pindah ring bila dimuat untuk pemilik lain.
+        self._track_owners(owner_of)
+
+    def _new_group(self):
+        return _ClockRing()
+
+    def _discard_from_group(self, ring, frame: int):
+        ring.discard(frame)
+
+    def select_victim_local(self, owners, frame_sets) -> int:
+        owned = self._owned
+        if owned is None:
+            return super().select_victim_local(owners, frame_sets)
+        # Beberapa pemilik melebihi kuota: korban diambil dari ring terbesar
+        owner = owners[0] if len(owners) == 1 else max(owners, key=lambda owner: len(owned[owner]))
+        return self._sweep_ring(owned[owner])
+
+    def _sweep_ring(self, ring: _ClockRing) -> int:
+        frames = ring.frames
+        reference_bits = self.reference_bits
+        size = len(frames)
+        hand = ring.hand
+        while reference_bits[frames[hand]]:
+            reference_bits[frames[hand]] = 0
+            hand = hand + 1 if hand + 1 < size else 0
+        ring.hand = hand + 1 if hand + 1 < size else 0
+        return frames[hand]
+
+    def on_free(self, frame: int):
+        self.reference_bits[frame] = 0
+        if self._owned is not None:
+            self._disown(frame)
+
+    def resize(self, total_frames: int):
+        super().resize(total_frames)
+        self.reference_bits = _resized(self.reference_bits, total_frames)
+        self.hand %= total_frames
+
+
+@register_policy('ENHANCED_CLOCK')
+class EnhancedClockPolicy(ClockPolicy):
+    """
+    Enhanced CLOCK (Not Recently Used dengan dirty bit). Frame dikelompokkan
+    berdasarkan (reference, dirty) dan korban dipilih dari kelas terendah:
+    (0,0) lalu (0,1) lalu (1,0) lalu (1,1), sehingga halaman bersih
+    lebih disukai karena tidak perlu ditulis balik ke disk.
+    """
+    def __init__(self, total_frames: int):
+        super().__init__(total_frames)
+        self.dirty_bits = bytearray(total_frames)
+
+    def on_load(self, frame: int):
+        self.reference_bits[frame] = 1
+        self.dirty_bits[frame] = 0
+        if self._owned is not None:
+            self._claim(frame).add(frame)
+
+    def on_write(self, frame: int):
+        self.dirty_bits[frame] = 1
+
+    def select_victim(self) -> int:
+        reference_bits = self.reference_bits
+        dirty_bits = self.dirty_bits
+        total_frames = self.total_frames
+        while True:
+            # Putaran 1: cari (0,0) tanpa mengubah bit apa pun
+            hand = self.hand
+            for _ in range(total_frames):
+                if not reference_bits[hand] and not dirty_bits[hand]:
+                    self.hand = (hand + 1) % total_frames
+                    return hand
+                hand = (hand + 1) % total_frames
+            # Putaran 2: cari (0,1) sambil mereset reference bit yang dilewati
+            for _ in range(total_frames):
+                if not reference_bits[hand]:
+                    self.hand = (hand + 1) % total_frames
+                    return hand
+                reference_bits[hand] = 0
+                hand = (hand + 1) % total_frames
+            # Semua reference bit sekarang 0, ulangi dari putaran 1
+
+    def select_victim_from(self, frames) -> int:
+        reference_bits = self.reference_bits
+        dirty_bits = self.dirty_bits
+        total_frames = self.total_frames
+        while True:
+            # Dua putaran yang sama seperti select_victim, hanya untuk frame kandidat
+            hand = self.hand
+            for _ in range(total_frames):
+                if hand in frames and not reference_bits[hand] and not dirty_bits[hand]:
+                    self.hand = (hand + 1) % total_frames
+                    return hand
+                hand = (hand + 1) % total_frames
+            for _ in range(total_frames):
+                if hand in frames:
+                    if not reference_bits[hand]:
+                        self.hand = (hand + 1) % total_frames
+                        return hand
+                    reference_bits[hand] = 0
+                hand = (hand + 1) % total_frames
+
+    def _sweep_ring(self, ring: _ClockRing) -> int:
+        # Dua putaran yang sama seperti select_victim, di dalam ring pemilik
+        frames = ring.frames
+        reference_bits = self.reference_bits
+        dirty_bits = self.dirty_bits
+        size = len(frames)
+        while True:
+            hand = ring.hand
+            for _ in range(size):
+                frame = frames[hand]
+                hand = hand + 1 if hand + 1 < size else 0
+                if not reference_bits[frame] and not dirty_bits[frame]:
+                    ring.hand = hand
+                    return frame
+            for _ in range(size):
+                frame = frames[hand]
+                hand = hand + 1 if hand + 1 < size else 0
+                if not reference_bits[frame]:
+                    ring.hand = hand
+                    return frame
+                reference_bits[frame] = 0
+
+    def on_free(self, frame: int):
+        self.reference_bits[frame] = 0
+        self.dirty_bits[frame] = 0
+        if self._owned is not None:
+            self._disown(frame)
+
+    def resize(self, total_frames: int):
+        super().resize(total_frames)
+        self.dirty_bits = _resized(self.dirty_bits, total_frames)
+
+
+@register_policy('AGING')
+class AgingPolicy(ReplacementPolicy):
+    """
+    Aging: setiap `aging_interval` akses, counter setiap frame digeser ke kanan
+    dan reference bit dimasukkan sebagai bit tertinggi. Korban adalah frame
+    dengan counter terkecil (pendekatan LRU dengan hardware reference bit).
+    Hit hanya menyalakan bit; geser counter O(frame) dibagi rata ke
+    `aging_interval` akses (default = jumlah frame, sehingga O(1) amortized).
+
+    Pemilihan korban tidak memindai counter: frame yang belum disentuh sejak
+    tick terakhir tetap memakai counter tick tersebut, sehingga cukup diurutkan
+    sekali per tick, sedangkan frame yang reference bit-nya menyala sejak tick
+    dicatat di heap (key, frame) saat bitnya berubah dari 0 ke 1.
+    """
+    COUNTER_BITS = 8
+
+    def __init__(self, total_frames: int, aging_interval: int | None = None):
+        super().__init__(total_frames)
+        self.aging_interval = aging_interval or total_frames
+        self.reference_bits = bytearray(total_frames)
+        self.counters = array('I', [0]) * total_frames
+        self._accesses_since_tick = 0
+        self._reset_victim_cache()
+
+    def _reset_victim_cache(self):
+        # Urutan (counter, frame) seluruh frame saat tick, dibangun lazy oleh select_victim
+        self._victim_order = None
+        self._victim_position = 0
+        # Entri heap: (key, frame) frame yang disentuh sejak tick. Entri basi dibuang secara lazy.
+        self._referenced = []
+        if self._owned is not None:
+            for group in self._owned.values():
+                group.order = None
+                group.position = 0
+                group.heap = []
+
+    def _referenced_key(self, counter: int) -> int:
+        """Key pemilihan korban untuk frame yang reference bit-nya menyala."""
+        return counter | (1 << self.COUNTER_BITS)
+
+    def _mark_referenced(self, frame: int):
+        referenced = self._referenced
+        heapq.heappush(referenced, (self._referenced_key(self.counters[frame]), frame))
+        # Bersihkan entri basi agar ukuran heap tetap sebanding dengan jumlah frame
+        if len(referenced) > 4 * self.total_frames + 16:
+            counters = self.counters
+            self._referenced = [(self._referenced_key(counters[f]), f)
+                                for f, bit in enumerate(self.reference_bits) if bit]
+            heapq.heapify(self._referenced)
+        if self._owned is not None:
+            owner = self._frame_owner[frame]
+            if owner is not None:
+                group = self._owned[owner]
+                heapq.heappush(group.heap, (self._referenced_key(self.counters[frame]), frame))
+                if len(group.heap) > 4 * len(group.frames) + 16:
+                    counters = self.counters
+                    reference_bits = self.reference_bits
+                    group.heap = [(self._referenced_key(counters[f]), f) for f in group.frames if reference_bits[f]]
+                    heapq.heapify(group.heap)
+
+    def _count_access(self):
+        self._accesses_since_tick += 1
+        if self._accesses_since_tick >= self.aging_interval:
+            self._accesses_since_tick = 0
+            self._age_counters()
+            self._reset_victim_cache()
+
+    def _age_counters(self):
+        """Menggeser semua counter dan memasukkan reference bit (satu "clock tick")."""
+        top_bit = self.COUNTER_BITS - 1
+        counters = self.counters
+        reference_bits = self.reference_bits
+        for frame in range(self.total_frames):
+            counters[frame] = (counters[frame] >> 1) | (reference_bits[frame] << top_bit)
+        self.reference_bits = bytearray(self.total_frames)
+
+    def on_hit(self, frame: int):
+        reference_bits = self.reference_bits
+        if not reference_bits[frame]:
+            reference_bits[frame] = 1
+            self._mark_referenced(frame)
+        self._count_access()
+
+    def on_load(self, frame: int):
+        if self._owned is not None:
+            self._claim(frame).frames.add(frame)
+        # Halaman baru dimulai dengan counter nol tetapi reference bit menyala
+        self.counters[frame] = 0
+        self.reference_bits[frame] = 1
+        self._mark_referenced(frame)
+        self._count_access()
+
+    def select_victim(self) -> int:
+        # Reference bit yang menyala ikut diperhitungkan agar halaman yang baru
+        # dipakai sejak tick terakhir tidak langsung menjadi korban
+        counters = self.counters
+        reference_bits = self.reference_bits
+        order = self._victim_order
+        if order is None:
+            order = self._victim_order = sorted(range(self.total_frames), key=counters.__getitem__)
+        # Bit yang sudah menyala baru padam pada tick berikutnya: posisi hanya maju
+        position = self._victim_position
+        while position < len(order) and reference_bits[order[position]]:
+            position += 1
+        self._victim_position = position
+        referenced = self._referenced
+        while referenced:
+            key, frame = referenced[0]
+            if reference_bits[frame] and key == self._referenced_key(counters[frame]):
+                break
+            heapq.heappop(referenced)
+        if position < len(order):
+            frame = order[position]
+            if not referenced or (counters[frame], frame) < referenced[0]:
+                return frame
+        return referenced[0][1]
+
+    def select_victim_from(self, frames) -> int:
+        counters = self.counters
+        reference_bits = self.reference_bits
+        top = 1 << self.COUNTER_BITS
+        return min(frames, key=lambda frame: (
+            counters[frame] | top if reference_bits[frame] else counters[frame], frame))
+
+    def enable_local(self, owner_of):
+        # Per pemilik: urutan tick dan heap frame yang disentuh, seperti select_victim
+        self._track_owners(owner_of)
+
+    def _new_group(self):
+        return _OwnedFrames()
+
+    def _discard_from_group(self, group, frame: int):
+        group.frames.discard(frame)
+
+    def select_victim_local(self, owners, frame_sets) -> int:
+        owned = self._owned
+        if owned is None:
+            return super().select_victim_local(owners, frame_sets)
+        best = None
+        for owner in owners:
+            candidate = self._owner_candidate(owner, owned[owner])
+            if best is None or candidate < best:
+                best = candidate
+        return best[1]
+
+    def _owner_candidate(self, owner, group: _OwnedFrames) -> tuple:
+        """(key, frame) korban terbaik milik satu pemilik."""
+        counters = self.counters
+        reference_bits = self.reference_bits
+        frame_owner = self._frame_owner
+        order = group.order
+        if order is None:
+            order = group.order = sorted(group.frames, key=lambda frame: (counters[frame], frame))
+        # Frame yang menyala atau berpindah pemilik baru kembali setelah tick berikutnya
+        position = group.position
+        while position < len(order) and (reference_bits[order[position]]
+                                         or frame_owner[order[position]] != owner):
+            position += 1
+        group.position = position
+        heap = group.heap
+        while heap:
+            key, frame = heap[0]
+            if (reference_bits[frame] and frame_owner[frame] == owner
+                    and key == self._referenced_key(counters[frame])):
+                break
+            heapq.heappop(heap)
+        if position < len(order):
+            frame = order[position]
+            if not heap or (counters[frame], frame) < heap[0]:
+                return counters[frame], frame
+        return heap[0]
+
+    def on_free(self, frame: int):
+        self.counters[frame] = 0
+        self.reference_bits[frame] = 0
+        if self._owned is not None:
+            self._disown(frame)
+
+    def resize(self, total_frames: int):
+        super().resize(total_frames)
+        self.counters = _resized(self.counters, total_frames)
+        self.reference_bits = _resized(self.reference_bits, total_frames)
+        self._reset_victim_cache()
+        # Frame yang disentuh sejak tick dicatat ulang untuk heap korban
+        for frame, referenced in enumerate(self.reference_bits):
+            if referenced:
+                self._mark_referenced(frame)
+
+
+@register_policy('NFU')
+class NFUPolicy(AgingPolicy):
+    """
+    Not Frequently Used: seperti Aging tetapi counter hanya dijumlahkan
+    (tanpa digeser), sehingga riwayat lama tidak pernah "dilupakan".
+    """
+    def _referenced_key(self, counter: int) -> int:
+        return counter + 1
+
+    def _age_counters(self):
+        counters = self.counters
+        reference_bits = self.reference_bits
+        for frame in range(self.total_frames):
+            counters[frame] += reference_bits[frame]
+        self.reference_bits = bytearray(self.total_frames)
+
+    def select_victim_from(self, frames) -> int:
+        counters = self.counters
+        reference_bits = self.reference_bits
+        return min(frames, key=lambda frame: (counters[frame] + reference_bits[frame], frame))
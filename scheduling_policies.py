@@ -0,0 +1,483 @@
+# File: scheduling_policies.py
+# Deskripsi: Algoritma penjadwalan CPU dalam bentuk kelas-kelas "policy" yang
+# dipasang ke CPUScheduler. Setiap policy memiliki antrian siapnya sendiri
+# (deque untuk FCFS, antrian bertingkat untuk MLFQ/RR, heap untuk
+# SJF/SRTF/PRIORITY) dan didaftarkan lewat
+# registry, sehingga algoritma baru tidak menambah cabang `if` di CPUScheduler.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import heapq
+import math
+from collections import deque
+
+# Registry: {nama_algoritma: kelas_policy}
+SCHEDULING_POLICIES = {}
+
+
+def register_scheduler(name: str):
+    """Decorator untuk mendaftarkan kelas policy penjadwalan dengan nama tertentu."""
+    def decorator(policy_class):
+        policy_class.name = name.upper()
+        SCHEDULING_POLICIES[name.upper()] = policy_class
+        return policy_class
+    return decorator
+
+
+class SchedulingPolicy:
+    """
+    Antarmuka dasar algoritma penjadwalan.
+
+    Policy menyimpan antrian siap dan memutuskan proses yang berjalan lewat
+    `select(scheduler)`, yang membaca/menulis `scheduler.current_process`.
+    Perilaku default adalah non-preemptive: proses yang sedang berjalan
+    dipertahankan sampai selesai (atau terblokir).
+    """
+    name = None
+
+    def __init__(self):
+        self._queue = deque()
+
+    # --- Operasi antrian siap ---
+
+    def push(self, process, now: int):
+        """Memasukkan proses ke antrian siap."""
+        self._queue.append(process)
+
+    def pop(self, now: int):
+        """Mengambil proses berikutnya dari antrian siap."""
+        return self._queue.popleft()
+
+    def peek_tail(self):
+        """Proses yang paling akhir akan dijalankan (kandidat untuk dicuri core lain)."""
+        return self._queue[-1]
+
+    def pop_tail(self):
+        """Mengambil proses dari ekor antrian (work stealing)."""
+        return self._queue.pop()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({[p.process_id for p in self]})"
+
+    # --- Keputusan penjadwalan ---
+
+    def select(self, scheduler):
+        current = scheduler.current_process
+        if current is None or current.burst_time_remaining <= 0:
+            if not self:
+                scheduler.current_process = None
+                return None # Tidak ada lagi proses di antrian
+            scheduler.current_process = self.pop(scheduler.current_time)
+        # Kembalikan proses yang sama sampai selesai
+        return scheduler.current_process
+
+    def tick(self, scheduler, elapsed: int):
+        """Dipanggil setiap kali waktu simulasi maju."""
+        pass
+
+    def on_block(self, scheduler, process):
+        """Dipanggil saat proses yang berjalan terblokir (mis. menunggu I/O page fault)."""
+        pass
+
+    def max_run_length(self, scheduler) -> int | None:
+        """Batas detik proses saat ini boleh berjalan tanpa memanggil select (None = tanpa batas)."""
+        return None
+
+    def lone_run_length(self, scheduler, horizon: int) -> int | None:
+        """
+        Batas run proses saat ini bila antrian siap kosong dan tidak ada kedatangan
+        sebelum `horizon`, atau None jika batas kuantum tetap merupakan titik keputusan.
+        """
+        return None
+
+    def skip_quanta(self, scheduler, elapsed: int):
+        """Memajukan kuantum proses yang berjalan sendirian sejauh hasil `lone_run_length`."""
+        pass
+
+    def next_event_time(self) -> int | None:
+        """
+        Waktu titik keputusan berikutnya yang tidak dipicu proses (mis. priority
+        boost MLFQ), agar CPU yang idle tidak melompatinya. None jika tidak ada.
+        """
+        return None
+
+    # --- Migrasi antar core ---
+
+    def export_state(self, process):
+        """Melepas state per proses milik policy ini saat proses pindah ke core lain."""
+        return None
+
+    def import_state(self, process, state):
+        """Menerima state hasil `export_state` policy core asal."""
+        pass
+
+
+@register_scheduler('FCFS')
+class FCFSPolicy(SchedulingPolicy):
+    """First-Come First-Served: antrian deque, proses berjalan sampai selesai."""
+
+
+class _ChainedQueue:
+    """
+    Antrian FIFO yang tersusun dari rangkaian deque. `splice` menyambungkan
+    seluruh isi antrian lain ke belakang antrian ini tanpa menyalin elemennya
+    satu per satu, sehingga priority boost MLFQ tidak bergantung jumlah proses.
+    """
+    __slots__ = ('_chunks', '_length')
+
+    def __init__(self):
+        self._chunks = deque([deque()])
+        self._length = 0
+
+    def append(self, item):
+        self._chunks[-1].append(item)
+        self._length += 1
+
+    def popleft(self):
+        chunks = self._chunks
+        while not chunks[0]:
+            chunks.popleft() # Buang chunk kosong di depan (amortized O(1))
+        self._length -= 1
+        return chunks[0].popleft()
+
+    def _trim_tail(self):
+        chunks = self._chunks
+        while not chunks[-1] and len(chunks) > 1:
+            chunks.pop()
+
+    def peek_tail(self):
+        self._trim_tail()
+        return self._chunks[-1][-1]
+
+    def pop_tail(self):
+        self._trim_tail()
+        self._length -= 1
+        return self._chunks[-1].pop()
+
+    def splice(self, other: '_ChainedQueue'):
+        """Memindahkan seluruh isi `other` ke akhir antrian ini; `other` menjadi kosong."""
+        if not other._length:
+            return
+        self._chunks.extend(other._chunks)
+        self._length += other._length
+        other._chunks = deque([deque()])
+        other._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+
+@register_scheduler('MLFQ')
+class MLFQPolicy(SchedulingPolicy):
+    """
+    Multi-Level Feedback Queue.
+
+    - Proses baru masuk level 0 (prioritas tertinggi); setiap level punya kuantum sendiri.
+    - Proses yang menghabiskan kuantumnya turun satu level.
+    - Proses yang terblokir I/O (termasuk melayani page fault) sebelum kuantumnya
+      habis naik satu level (`promote_on_io`).
+    - Setiap `boost_interval` detik semua proses dikembalikan ke level 0.
+    - Proses di level lebih tinggi yang siap merebut CPU dari proses level lebih rendah.
+
+    Level proses disimpan bersama nomor "epoch" boost: boost cukup menaikkan
+    epoch dan menyambungkan antrian level bawah ke level 0 (O(jumlah level)),
+    tanpa menyentuh setiap proses.
+    """
+    def __init__(self, quanta: tuple | list | None = (3, 6, 12), boost_interval: int | None = None,
+                 promote_on_io: bool = True):
+        """
+        Args:
+            quanta (tuple | list | None): Kuantum per level, dari level tertinggi.
+                None = satu level dengan kuantum `scheduler.time_quantum`.
+            boost_interval (int | None): Periode priority boost (detik). None = tanpa boost.
+            promote_on_io (bool): Naikkan level proses yang terblokir I/O.
+        """
+        if quanta is not None and (len(quanta) == 0 or min(quanta) <= 0):
+            raise ValueError("Kuantum setiap level MLFQ harus bilangan positif")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("Interval boost MLFQ harus bilangan positif")
+        self.quanta = tuple(quanta) if quanta is not None else None
+        self.num_levels = len(self.quanta) if self.quanta is not None else 1
+        self.boost_interval = boost_interval
+        self.promote_on_io = promote_on_io
+        self._queues = [_ChainedQueue() for _ in range(self.num_levels)]
+
+        # {proses: (level, epoch)}; level dari epoch lama dianggap 0 (sudah di-boost)
+        self._levels = {}
+        self._epoch = 0
+        self._next_boost = boost_interval
+
+        self.boosts = 0
+        self.demotions = 0
+        self.promotions = 0
+
+    def level_of(self, process) -> int:
+        """Level antrian proses saat ini (0 = prioritas tertinggi)."""
+        entry = self._levels.get(process)
+        if entry is None or entry[1] != self._epoch:
+            return 0
+        return entry[0]
+
+    def _set_level(self, process, level: int):
+        self._levels[process] = (level, self._epoch)
+
+    def _quantum(self, scheduler, level: int) -> int:
+        return self.quanta[level] if self.quanta is not None else scheduler.time_quantum
+
+    # --- Operasi antrian siap ---
+
+    def push(self, process, now: int):
+        self._queues[self.level_of(process)].append(process)
+
+    def pop(self, now: int):
+        for queue in self._queues:
+            if queue:
+                return queue.popleft()
+        raise IndexError("pop dari antrian MLFQ yang kosong")
+
+    def _lowest_ready_queue(self) -> _ChainedQueue:
+        for queue in reversed(self._queues):
+            if queue:
+                return queue
+        raise IndexError("antrian MLFQ kosong")
+
+    def peek_tail(self):
+        return self._lowest_ready_queue().peek_tail()
+
+    def pop_tail(self):
+        return self._lowest_ready_queue().pop_tail()
+
+    def _highest_ready_level(self) -> int | None:
+        for level, queue in enumerate(self._queues):
+            if queue:
+                return level
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues)
+
+    def __iter__(self):
+        for queue in self._queues:
+            yield from queue
+
+    # --- Keputusan penjadwalan ---
+
+    def boost(self):
+        """Priority boost: semua proses (siap, berjalan, maupun terblokir) kembali ke level 0."""
+        top = self._queues[0]
+        for queue in self._queues[1:]:
+            top.splice(queue)
+        self._epoch += 1
+        self.boosts += 1
+
+    def _boost_if_due(self, now: int):
+        if self.boost_interval is not None and now >= self._next_boost:
+            self.boost()
+            self._next_boost = (now // self.boost_interval + 1) * self.boost_interval
+
+    def select(self, scheduler):
+        now = scheduler.current_time
+        self._boost_if_due(now)
+        current = scheduler.current_process
+
+        # Kapan kita perlu memilih proses baru?
+        # 1. Jika belum ada proses yang berjalan atau proses saat ini sudah selesai.
+        # 2. Jika kuantum waktu proses saat ini sudah habis (proses turun level).
+        # 3. Jika ada proses siap di level yang lebih tinggi (preemption).
+        if current is not None and current.burst_time_remaining <= 0:
+            self._levels.pop(current, None) # Proses selesai, level tidak perlu disimpan lagi
+        elif current is not None:
+            level = self.level_of(current)
+            if scheduler.quantum_counter <= 0:
+                if level < self.num_levels - 1:
+                    self._set_level(current, level + 1)
+                    self.demotions += 1
+                # Kembalikan ke akhir antrian levelnya
+                self.push(current, now)
+            else:
+                higher = self._highest_ready_level()
+                if higher is None or higher >= level:
+                    return current
+                current.status = 'ready'
+                self.push(current, now)
+
+        if self:
+            process = self.pop(now)
+            scheduler.current_process = process
+            scheduler.quantum_counter = self._quantum(scheduler, self.level_of(process)) # Reset kuantum
+        else:
+            scheduler.current_process = None # Tidak ada proses sama sekali
+        return scheduler.current_process
+
+    def on_block(self, scheduler, process):
+        if self.promote_on_io and scheduler.quantum_counter > 0:
+            level = self.level_of(process)
+            if level > 0:
+                self._set_level(process, level - 1)
+                self.promotions += 1
+
+    def tick(self, scheduler, elapsed: int):
+        scheduler.quantum_counter = max(0, scheduler.quantum_counter - elapsed)
+
+    def max_run_length(self, scheduler) -> int | None:
+        run_limit = scheduler.quantum_counter
+        if self.boost_interval is not None:
+            run_limit = min(run_limit, max(1, self._next_boost - scheduler.current_time))
+        return run_limit
+
+    def next_event_time(self) -> int | None:
+        return self._next_boost if self.boost_interval is not None else None
+
+    def lone_run_length(self, scheduler, horizon: int) -> int | None:
+        # Di level terendah kuantum yang habis hanya memasukkan lalu memilih lagi
+        # proses yang sama (tanpa demosi), jadi batas kuantum bisa dilewati
+        current = scheduler.current_process
+        if self or current is None or self.level_of(current) < self.num_levels - 1:
+            return None
+        if self.boost_interval is not None:
+            horizon = min(horizon, max(1, self._next_boost - scheduler.current_time))
+        return horizon
+
+    def skip_quanta(self, scheduler, elapsed: int):
+        # Sisa kuantum seperti jika proses dipilih ulang di setiap batas kuantum
+        quantum = self._quantum(scheduler, self.level_of(scheduler.current_process))
+        scheduler.quantum_counter = (scheduler.quantum_counter - elapsed) % quantum
+
+    def export_state(self, process):
+        # Level efektif dibawa pindah; entri di core asal dibuang agar tidak bocor
+        level = self.level_of(process)
+        self._levels.pop(process, None)
+        return level
+
+    def import_state(self, process, state):
+        if state:
+            self._set_level(process, min(state, self.num_levels - 1))
+
+
+@register_scheduler('RR')
+class RoundRobinPolicy(MLFQPolicy):
+    """Round Robin: MLFQ satu level dengan kuantum waktu `scheduler.time_quantum`."""
+    def __init__(self):
+        super().__init__(quanta=None, promote_on_io=False)
+
+
+class _HeapPolicy(SchedulingPolicy):
+    """
+    Dasar policy berbasis heap: antrian siap diurutkan berdasarkan `_key`,
+    dengan nomor urut kedatangan sebagai pemecah seri (FIFO untuk kunci sama).
+    push/pop bernilai O(log n).
+    """
+    def __init__(self):
+        self._heap = []
+        self._sequence = 0
+
+    def _key(self, process, now: int):
+        raise NotImplementedError
+
+    def push(self, process, now: int):
+        heapq.heappush(self._heap, (self._key(process, now), self._sequence, process))
+        self._sequence += 1
+
+    def pop(self, now: int):
+        return heapq.heappop(self._heap)[2]
+
+    def peek_tail(self):
+        # Daun terakhir heap: bisa dilepas tanpa merusak sifat heap
+        return self._heap[-1][2]
+
+    def pop_tail(self):
+        return self._heap.pop()[2]
+
+    def peek_key(self):
+        """Kunci proses terdepan di antrian (tanpa mengeluarkannya)."""
+        return self._heap[0][0]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self):
+        return (entry[2] for entry in sorted(self._heap))
+
+
+@register_scheduler('SJF')
+class SJFPolicy(_HeapPolicy):
+    """Shortest Job First (non-preemptive): sisa burst terkecil dijalankan lebih dulu."""
+    def _key(self, process, now: int):
+        return process.burst_time_remaining
+
+
+@register_scheduler('SRTF')
+class SRTFPolicy(SJFPolicy):
+    """
+    Shortest Remaining Time First (SJF preemptive): setiap select, proses yang
+    berjalan diganti jika ada proses siap dengan sisa waktu lebih kecil.
+    Sisa waktu proses yang menunggu tidak berubah, sehingga kunci heap tetap valid.
+    """
+    def select(self, scheduler):
+        current = scheduler.current_process
+        if (current is not None and current.burst_time_remaining > 0
+                and self and self.peek_key() < current.burst_time_remaining):
+            # Preempt: kembalikan proses saat ini ke antrian siap
+            current.status = 'ready'
+            self.push(current, scheduler.current_time)
+            scheduler.current_process = self.pop(scheduler.current_time)
+            return scheduler.current_process
+        return super().select(scheduler)
+
+
+@register_scheduler('PRIORITY')
+class PriorityPolicy(_HeapPolicy):
+    """
+    Penjadwalan prioritas (angka lebih kecil = prioritas lebih tinggi) dengan aging.
+
+    Prioritas efektif proses yang menunggu turun sebesar `aging_rate` per detik:
+        efektif(now) = priority - aging_rate * (now - waktu_masuk_antrian)
+    Karena suku `aging_rate * now` sama untuk semua proses yang menunggu,
+    urutannya cukup disimpan dengan kunci statis priority + aging_rate * waktu_masuk,
+    sehingga aging tidak memerlukan pembaruan seluruh antrian (tetap O(log n)).
+    """
+    def __init__(self, aging_rate: float = 0.1, preemptive: bool = False):
+        super().__init__()
+        self.aging_rate = aging_rate
+        self.preemptive = preemptive
+
+    def _key(self, process, now: int):
+        return process.priority + self.aging_rate * now
+
+    def _should_preempt(self, current, now: int) -> bool:
+        """Apakah proses terdepan di antrian (setelah aging) mengalahkan proses yang berjalan."""
+        return (self.preemptive and current is not None and current.burst_time_remaining > 0
+                and bool(self) and self.peek_key() - self.aging_rate * now < current.priority)
+
+    def select(self, scheduler):
+        current = scheduler.current_process
+        if self._should_preempt(current, scheduler.current_time):
+            current.status = 'ready'
+            self.push(current, scheduler.current_time)
+            scheduler.current_process = self.pop(scheduler.current_time)
+            return scheduler.current_process
+        return super().select(scheduler)
+
+    def max_run_length(self, scheduler) -> int | None:
+        # Dengan aging, proses yang menunggu bisa menyalip proses yang berjalan
+        # tanpa ada event apa pun; titik itu dihitung langsung dari kunci heap.
+        current = scheduler.current_process
+        if not (self.preemptive and self.aging_rate > 0 and current is not None and self):
+            return None
+        now = scheduler.current_time
+        overtake = max(now + 1, math.floor((self.peek_key() - current.priority) / self.aging_rate))
+        # Koreksi pembulatan floating point agar sama persis dengan _should_preempt
+        while overtake > now + 1 and self._should_preempt(current, overtake - 1):
+            overtake -= 1
+        while not self._should_preempt(current, overtake):
+            overtake += 1
+        return overtake - now
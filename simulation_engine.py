@@ -0,0 +1,336 @@
+# File: simulation_engine.py
+# Deskripsi: Mesin simulasi terintegrasi yang menggabungkan CPUScheduler dan
+# MemoryManager. Memegang jam simulasi, menjalankan satu akses memori per detik
+# untuk proses yang sedang berjalan, dan memodelkan layanan page fault sebagai
+# I/O yang memblokir proses.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import heapq
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from smp_scheduler import MultiCoreScheduler
+from snapshot import Snapshot
+
+
+class SimulationEngine:
+    """
+    Menjalankan simulasi lengkap dalam salah satu dari dua mode:
+
+    - 'TICK': referensi sederhana, penjadwal dipanggil setiap detik.
+    - 'EVENT': penjadwal hanya dipanggil pada titik keputusan (kuantum habis,
+      proses selesai/terblokir, proses baru tiba, atau ada proses yang bangun
+      dari I/O). Periode
+      idle dilompati langsung ke event berikutnya di antrian event, dan detik-detik
+      di antara keputusan dijalankan dalam loop akses memori yang ketat.
+
+    Kedua mode menghasilkan timeline, waktu selesai, dan statistik yang identik.
+    """
+    MODES = ['TICK', 'EVENT']
+
+    def __init__(self, scheduler: CPUScheduler, memory_manager: MemoryManager,
+                 fault_latency: int = 0, mode: str = 'EVENT', load_controller=None,
+                 reclaim_on_exit: bool = False, trace_writer=None):
+        """
+        Args:
+            scheduler (CPUScheduler): Penjadwal berisi semua proses.
+            memory_manager (MemoryManager): Pengelola memori untuk akses halaman.
+            fault_latency (int): Lama (detik) proses terblokir melayani satu page fault.
+                0 berarti page fault tidak memblokir.
+            mode (str): 'EVENT' (default) atau 'TICK'.
+            load_controller (PFFController | None): Pengendali beban opsional yang
+                melihat setiap akses dan dievaluasi setiap `check_interval` detik.
+            reclaim_on_exit (bool): Bebaskan semua frame proses saat proses selesai.
+                False (default, perilaku lama) = frame proses yang selesai tertinggal
+                sampai diusir satu per satu.
+            trace_writer (TraceWriter | None): Jika diisi, setiap akses memori direkam
+                (process_id, halaman, tick, HIT/FAULT) ke trace biner.
+        """
+        if mode.upper() not in self.MODES:
+            raise ValueError("Mode simulasi harus 'TICK' atau 'EVENT'")
+        self.scheduler = scheduler
+        self.memory_manager = memory_manager
+        self.fault_latency = fault_latency
+        self.mode = mode.upper()
+        self.load_controller = load_controller
+        self.reclaim_on_exit = reclaim_on_exit
+        self.trace_writer = trace_writer
+
+        self.processes = list(scheduler.processes)
+        for process in self.processes:
+            memory_manager.register_process(process)
+
+        # Jam simulasi dan antrian event I/O: (waktu_bangun, urutan, proses)
+        self.current_time = 0
+        self._io_queue = []
+        self._io_sequence = 0
+
+        # Hasil simulasi
+        self.timeline = []          # [process_id, waktu_mulai, durasi]
+        self.completion_times = {}  # {process_id: waktu_selesai}
+        self.idle_time = 0
+
+        # Metrik penjadwal dicatat ke Statistics milik MemoryManager
+        self.statistics = memory_manager.statistics
+        self._first_run = {}        # {process_id: detik pertama kali berjalan}
+        self._last_process_id = None
+
+    # --- Langkah-langkah simulasi ---
+
+    def _wake_due_processes(self):
+        """Mengembalikan proses yang selesai menunggu I/O ke antrian siap."""
+        io_queue = self._io_queue
+        while io_queue and io_queue[0][0] <= self.current_time:
+            _, _, process = heapq.heappop(io_queue)
+            self.scheduler.add_process(process)
+
+    def _record_run(self, process: Process, start: int, duration: int):
+        """Menambahkan segmen ke timeline, digabung dengan segmen sebelumnya jika bersambung."""
+        timeline = self.timeline
+        if timeline and timeline[-1][0] == process.process_id and sum(timeline[-1][1:]) == start:
+            timeline[-1][2] += duration
+        else:
+            timeline.append([process.process_id, start, duration])
+
+    def _run_process(self, process: Process, max_ticks: int) -> tuple[int, bool]:
+        """
+        Menjalankan proses paling lama `max_ticks` detik, satu akses memori per detik.
+
+        Returns:
+            tuple[int, bool]: (detik yang benar-benar dijalankan, apakah berhenti karena page fault
+            yang memblokir).
+        """
+        # Mode cepat: hanya HIT/FAULT yang dibutuhkan, tanpa dict hasil per akses
+        access = self.memory_manager.access
+        get_next_page = process.get_next_page_to_access
+        blocking_faults = self.fault_latency > 0
+        on_access = self.load_controller.on_access if self.load_controller is not None else None
+        record = self.trace_writer.write if self.trace_writer is not None else None
+        for ticks in range(1, max_ticks + 1):
+            page_number = get_next_page()
+            faulted = page_number is not None and not access(process, page_number)
+            if on_access is not None and page_number is not None:
+                on_access(process, page_number, faulted)
+            if record is not None and page_number is not None:
+                record(process.process_id, page_number, self.current_time + ticks - 1, hit=not faulted)
+            process.burst_time_remaining -= 1
+            if process.burst_time_remaining <= 0 or (faulted and blocking_faults):
+                return ticks, faulted and blocking_faults
+        return max_ticks, False
+
+    def _record_scheduler_metrics(self, process: Process, start: int, duration: int, last_process_id):
+        """Mencatat context switch, waktu sibuk, dan waktu mulai pertama proses."""
+        if last_process_id is not None and last_process_id != process.process_id:
+            self.statistics.record_context_switch()
+        self.statistics.record_cpu_time(busy=duration)
+        self._first_run.setdefault(process.process_id, start)
+
+    def _complete(self, process: Process):
+        """Menandai proses selesai dan mencatat metrik penjadwalannya."""
+        process.status = 'terminated'
+        self.completion_times[process.process_id] = self.current_time
+        if self.load_controller is not None:
+            self.load_controller.on_exit(process)
+        if self.reclaim_on_exit:
+            self.memory_manager.release_process(process)
+        self.statistics.record_process_completion(
+            process.process_id, process.arrival_time, process.burst_time_total,
+            self._first_run[process.process_id], self.current_time)
+
+    def _after_run(self, process: Process, blocked: bool):
+        """Memperbarui status proses setelah berjalan (selesai atau terblokir oleh I/O)."""
+        if process.burst_time_remaining <= 0:
+            self._complete(process)
+        elif blocked:
+            self.scheduler.block_current()
+            heapq.heappush(self._io_queue, (self.current_time + self.fault_latency, self._io_sequence, process))
+            self._io_sequence += 1
+
+    def step(self) -> bool:
+        """
+        Maju satu langkah simulasi (satu detik pada mode TICK, satu keputusan
+        penjadwalan pada mode EVENT).
+
+        Returns:
+            bool: False jika simulasi sudah selesai.
+        """
+        controller = self.load_controller
+        if controller is not None and self.current_time >= controller.next_check:
+            controller.evaluate(self.current_time)
+        self._wake_due_processes()
+        process = self.scheduler.select_next_process()
+
+        if process is None:
+            next_arrival = self.scheduler.next_arrival_time()
+            if not self._io_queue and next_arrival is None:
+                if controller is not None and controller.has_suspended():
+                    # Semua proses aktif selesai: paksa evaluasi agar proses yang disuspend di-resume
+                    controller.evaluate(self.current_time)
+                    return True
+                return False
+            # CPU idle menunggu I/O atau kedatangan proses berikutnya
+            if self.mode == 'EVENT':
+                next_events = [self._io_queue[0][0]] if self._io_queue else []
+                if next_arrival is not None:
+                    next_events.append(next_arrival)
+                if controller is not None:
+                    next_events.append(controller.next_check)
+                next_event = self.scheduler.next_event_time()
+                if next_event is not None:
+                    next_events.append(next_event)
+                next_time = min(next_events)
+            else:
+                next_time = self.current_time + 1
+            self.scheduler.tick(next_time - self.current_time)
+            self.statistics.record_cpu_time(idle=next_time - self.current_time)
+            self.idle_time += next_time - self.current_time
+            self.current_time = next_time
+            return True
+
+        process.status = 'running'
+        if self.mode == 'TICK':
+            max_ticks = 1
+        else:
+            # Jalankan sampai titik keputusan berikutnya: batas kuantum, proses selesai,
+            # kedatangan proses baru, atau ada proses yang bangun dari I/O.
+            max_ticks = process.burst_time_remaining
+            run_limit = self.scheduler.max_run_length()
+            if run_limit is not None:
+                max_ticks = min(max_ticks, run_limit)
+            if self._io_queue:
+                max_ticks = min(max_ticks, self._io_queue[0][0] - self.current_time)
+            if controller is not None:
+                max_ticks = min(max_ticks, controller.next_check - self.current_time)
+            max_ticks = max(1, max_ticks)
+
+        start = self.current_time
+        ticks, blocked = self._run_process(process, max_ticks)
+        self.scheduler.tick(ticks)
+        self.current_time += ticks
+        self._record_run(process, start, ticks)
+        self._record_scheduler_metrics(process, start, ticks, self._last_process_id)
+        self._last_process_id = process.process_id
+        self._after_run(process, blocked)
+        return True
+
+    def run(self, max_time: int | None = None) -> dict:
+        """
+        Menjalankan simulasi sampai semua proses selesai (atau sampai `max_time`).
+
+        Returns:
+            dict: Ringkasan hasil simulasi.
+        """
+        while max_time is None or self.current_time < max_time:
+            if not self.step():
+                break
+        return self.get_results()
+
+    def snapshot(self) -> Snapshot:
+        """
+        Mengambil snapshot state simulasi saat ini. `snapshot.restore(...)`
+        menghasilkan engine baru untuk melanjutkan dari titik ini (lihat snapshot.py).
+        """
+        return Snapshot.capture(self)
+
+    def get_results(self) -> dict:
+        """Ringkasan hasil simulasi dalam bentuk dictionary."""
+        busy_time = self.current_time - self.idle_time
+        return {
+            "total_time": self.current_time,
+            "idle_time": self.idle_time,
+            "cpu_utilization": busy_time / self.current_time if self.current_time else 0.0,
+            "timeline": [tuple(segment) for segment in self.timeline],
+            "completion_times": dict(self.completion_times),
+            "statistics": self.memory_manager.statistics,
+            "load_control": self.load_controller.report() if self.load_controller is not None else None,
+        }
+
+
+class MultiCoreSimulationEngine(SimulationEngine):
+    """
+    Simulasi SMP: setiap detik, setiap core menjalankan satu akses memori untuk
+    prosesnya (core 0 lebih dulu, lalu core 1, dst.), semuanya berbagi satu
+    MemoryManager. Jika MemoryManager memakai TLB per core (`attach_cpu_tlbs`),
+    TLB core yang sedang berjalan diaktifkan sebelum aksesnya, sehingga migrasi
+    proses antar core terlihat sebagai TLB miss. Periode ketika semua core idle
+    dilompati langsung ke event berikutnya.
+    """
+    def __init__(self, scheduler: MultiCoreScheduler, memory_manager: MemoryManager,
+                 fault_latency: int = 0, reclaim_on_exit: bool = False, trace_writer=None):
+        super().__init__(scheduler, memory_manager, fault_latency=fault_latency, mode='TICK',
+                         reclaim_on_exit=reclaim_on_exit, trace_writer=trace_writer)
+        self.core_timelines = [[] for _ in range(scheduler.num_cores)]
+        self._last_process_ids = [None] * scheduler.num_cores
+
+    def _record_core_run(self, core_id: int, process: Process, start: int, duration: int):
+        timeline = self.core_timelines[core_id]
+        if timeline and timeline[-1][0] == process.process_id and sum(timeline[-1][1:]) == start:
+            timeline[-1][2] += duration
+        else:
+            timeline.append([process.process_id, start, duration])
+
+    def step(self) -> bool:
+        """Maju satu detik simulasi di semua core. Returns False jika simulasi sudah selesai."""
+        self._wake_due_processes()
+        running = self.scheduler.select_next_processes()
+
+        if not any(running):
+            next_arrival = self.scheduler.next_arrival_time()
+            if not self._io_queue and next_arrival is None:
+                return False
+            # Semua core idle: lompat ke event berikutnya
+            next_events = [self._io_queue[0][0]] if self._io_queue else []
+            if next_arrival is not None:
+                next_events.append(next_arrival)
+            next_event = self.scheduler.next_event_time()
+            if next_event is not None:
+                next_events.append(next_event)
+            next_time = min(next_events)
+            self.scheduler.tick(next_time - self.current_time)
+            self.statistics.record_cpu_time(idle=(next_time - self.current_time) * self.scheduler.num_cores)
+            self.idle_time += next_time - self.current_time
+            self.current_time = next_time
+            return True
+
+        blocked_cores = []
+        self.statistics.record_cpu_time(idle=running.count(None))
+        for core_id, process in enumerate(running):
+            if process is None:
+                continue
+            process.status = 'running'
+            self.memory_manager.select_cpu(core_id)
+            _, blocked = self._run_process(process, 1)
+            self._record_core_run(core_id, process, self.current_time, 1)
+            self._record_scheduler_metrics(process, self.current_time, 1, self._last_process_ids[core_id])
+            self._last_process_ids[core_id] = process.process_id
+            if blocked:
+                blocked_cores.append(core_id)
+
+        self.scheduler.tick(1)
+        self.current_time += 1
+        for core_id, process in enumerate(running):
+            if process is None:
+                continue
+            if process.burst_time_remaining <= 0:
+                self._complete(process)
+            elif core_id in blocked_cores:
+                self.scheduler.block_current(core_id)
+                heapq.heappush(self._io_queue, (self.current_time + self.fault_latency, self._io_sequence, process))
+                self._io_sequence += 1
+        return True
+
+    def get_results(self) -> dict:
+        """Ringkasan hasil simulasi multi-core dalam bentuk dictionary."""
+        results = super().get_results()
+        del results["timeline"]
+        results.update({
+            "num_cores": self.scheduler.num_cores,
+            "throughput": len(self.completion_times) / self.current_time if self.current_time else 0.0,
+            "core_utilization": self.scheduler.get_core_utilization(),
+            "core_timelines": [[tuple(segment) for segment in timeline] for timeline in self.core_timelines],
+            "migrations": self.scheduler.migrations,
+            "process_migrations": dict(self.scheduler.process_migrations),
+            "steals": self.scheduler.steals,
+        })
+        return results
@@ -0,0 +1,178 @@
+# File: smp_scheduler.py
+# Deskripsi: Penjadwalan multi-core (SMP). Setiap core memiliki CPUScheduler
+# sendiri (run queue per core, algoritma apa pun dari scheduling_policies.py).
+# Proses ditempatkan ke core yang terakhir menjalankannya atau ke core dengan
+# beban paling kecil, core yang menganggur mencuri proses dari core tersibuk
+# (work stealing), dan affinity membatasi core yang boleh menjalankan proses.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import heapq
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from scheduling_policies import SCHEDULING_POLICIES
+
+
+class MultiCoreScheduler:
+    """
+    Penjadwal K core. `select_next_processes()` mengembalikan satu proses (atau
+    None) untuk setiap core, dan `tick()` memajukan jam semua core sekaligus.
+    """
+    def __init__(self, algorithm: str, process_list: list[Process], num_cores: int = 2,
+                 policy_options: dict | None = None, time_quantum: int = 3,
+                 affinity: dict | None = None, work_stealing: bool = True, soft_affinity: bool = True):
+        """
+        Args:
+            algorithm (str): Algoritma penjadwalan setiap core (salah satu dari SCHEDULING_POLICIES).
+            process_list (list[Process]): Daftar semua proses yang akan dijadwalkan.
+            num_cores (int): Jumlah core.
+            policy_options (dict | None): Parameter tambahan untuk policy setiap core.
+            time_quantum (int): Kuantum waktu Round Robin.
+            affinity (dict | None): {process_id: iterable nomor core} untuk hard affinity.
+                Proses tanpa entri boleh berjalan di semua core.
+            work_stealing (bool): Core yang menganggur mencuri proses dari run queue core lain.
+            soft_affinity (bool): Proses yang bangun/dipreempt kembali ke core terakhirnya
+                (menjaga TLB tetap "hangat") selama core itu diizinkan.
+        """
+        if algorithm.upper() not in SCHEDULING_POLICIES:
+            raise ValueError(f"Algoritma harus salah satu dari {list(SCHEDULING_POLICIES)}")
+        if num_cores <= 0:
+            raise ValueError("Jumlah core harus lebih besar dari 0")
+
+        self.algorithm = algorithm.upper()
+        self.num_cores = num_cores
+        self.cores = [CPUScheduler(algorithm, [], policy_options=policy_options, time_quantum=time_quantum)
+                      for _ in range(num_cores)]
+        self.work_stealing = work_stealing
+        self.soft_affinity = soft_affinity
+
+        # Urutkan proses berdasarkan ID agar penempatan deterministik
+        sorted_processes = sorted(process_list, key=lambda p: p.pid)
+        self.processes = list(sorted_processes)
+
+        self.affinity = {}
+        for process_id, cores in (affinity or {}).items():
+            allowed = frozenset(cores)
+            if not allowed or not all(0 <= core < num_cores for core in allowed):
+                raise ValueError(f"Affinity {process_id} harus berisi nomor core 0..{num_cores - 1}")
+            self.affinity[process_id] = allowed
+
+        # Core terakhir yang menjalankan setiap proses: {process_id: core}
+        self.last_core = {}
+        self.migrations = 0
+        self.process_migrations = {}  # {process_id: jumlah migrasi}
+        self.steals = 0
+        self.busy_time = [0] * num_cores
+        self._running = [None] * num_cores
+
+        # Jam penjadwal dan proses yang belum tiba: heap (waktu_tiba, urutan, proses)
+        self.current_time = 0
+        self._arrivals = [(p.arrival_time, order, p) for order, p in enumerate(sorted_processes)]
+        heapq.heapify(self._arrivals)
+        self._release_arrivals()
+
+    # --- Penempatan proses ---
+
+    def _allows(self, process: Process, core_id: int) -> bool:
+        allowed = self.affinity.get(process.process_id)
+        return allowed is None or core_id in allowed
+
+    def _load(self, core_id: int) -> int:
+        current = self.cores[core_id].current_process
+        return len(self.cores[core_id].policy) + (current is not None and current.burst_time_remaining > 0)
+
+    def _place(self, process: Process) -> int:
+        """Memilih core untuk proses yang masuk antrian siap."""
+        last = self.last_core.get(process.process_id)
+        if self.soft_affinity and last is not None and self._allows(process, last):
+            return last
+        candidates = [core_id for core_id in range(self.num_cores) if self._allows(process, core_id)]
+        return min(candidates, key=self._load)
+
+    def add_process(self, process: Process):
+        """Memasukkan proses (baru atau yang selesai menunggu I/O) ke run queue salah satu core."""
+        core_id = self._place(process)
+        last = self.last_core.get(process.process_id)
+        if last is not None and last != core_id:
+            self._migrate_state(process, last, core_id)
+        self.cores[core_id].add_process(process)
+
+    def _migrate_state(self, process: Process, source: int, target: int):
+        """Memindahkan state policy proses (mis. level MLFQ) dari core `source` ke `target`."""
+        state = self.cores[source].policy.export_state(process)
+        self.cores[target].policy.import_state(process, state)
+
+    def _release_arrivals(self):
+        arrivals = self._arrivals
+        while arrivals and arrivals[0][0] <= self.current_time:
+            self.add_process(heapq.heappop(arrivals)[2])
+
+    def next_arrival_time(self) -> int | None:
+        """Waktu kedatangan proses berikutnya yang belum tiba (None jika tidak ada)."""
+        return self._arrivals[0][0] if self._arrivals else None
+
+    def next_event_time(self) -> int | None:
+        """Titik keputusan policy berikutnya yang paling awal di antara semua core."""
+        events = [event for event in (core.next_event_time() for core in self.cores) if event is not None]
+        return min(events) if events else None
+
+    def _steal(self, thief: int) -> Process | None:
+        """Mencuri satu proses dari ekor run queue core dengan antrian terpanjang."""
+        victims = sorted((core_id for core_id in range(self.num_cores)
+                          if core_id != thief and len(self.cores[core_id].policy) > 0),
+                         key=lambda core_id: -len(self.cores[core_id].policy))
+        for victim in victims:
+            queue = self.cores[victim].policy
+            if self._allows(queue.peek_tail(), thief):
+                self.steals += 1
+                process = queue.pop_tail()
+                self._migrate_state(process, victim, thief)
+                return process
+        return None
+
+    # --- Keputusan penjadwalan ---
+
+    def select_next_processes(self) -> list[Process | None]:
+        """
+        Memilih proses untuk setiap core.
+
+        Returns:
+            list[Process | None]: Proses yang berjalan di core ke-i (None = core idle).
+        """
+        self._release_arrivals()
+        running = self._running
+        for core_id, core in enumerate(self.cores):
+            process = core.select_next_process()
+            if process is None and self.work_stealing:
+                stolen = self._steal(core_id)
+                if stolen is not None:
+                    core.add_process(stolen)
+                    process = core.select_next_process()
+            if process is not None:
+                last = self.last_core.get(process.process_id)
+                if last is not None and last != core_id:
+                    self.migrations += 1
+                    self.process_migrations[process.process_id] = (
+                        self.process_migrations.get(process.process_id, 0) + 1)
+                self.last_core[process.process_id] = core_id
+            running[core_id] = process
+        return list(running)
+
+    def tick(self, elapsed: int = 1):
+        """Memajukan jam semua core; core yang menjalankan proses dihitung sibuk."""
+        self.current_time += elapsed
+        for core_id, core in enumerate(self.cores):
+            if self._running[core_id] is not None:
+                self.busy_time[core_id] += elapsed
+            core.tick(elapsed)
+        self._running = [None] * self.num_cores
+
+    def block_current(self, core_id: int):
+        """Mengeluarkan proses yang sedang berjalan di core `core_id` (mis. menunggu I/O)."""
+        self.cores[core_id].block_current()
+
+    def get_core_utilization(self) -> list[float]:
+        """Utilisasi setiap core (waktu sibuk / waktu simulasi)."""
+        if not self.current_time:
+            return [0.0] * self.num_cores
+        return [busy / self.current_time for busy in self.busy_time]
@@ -0,0 +1,171 @@
+# File: snapshot.py
+# Deskripsi: Snapshot dan restore seluruh state SimulationEngine (penjadwal,
+# MemoryManager, proses, statistik) untuk analisis "what-if": jalankan workload
+# sekali sampai tick T, lalu cabangkan ke beberapa kelanjutan (algoritma
+# replacement, kuantum, atau jumlah frame berbeda) tanpa mengulang dari nol.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import io
+import pickle
+import zlib
+
+from core_models import Process, RestoredProcess
+from page_table import PageTableImage
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickler yang menyimpan page table proses di luar state: setiap proses
+    dipickle sebagai RestoredProcess tanpa `page_table` (diganti PageTableImage
+    yang dirujuk lewat persistent id) dan tanpa iterator pola akses yang sedang berjalan.
+    """
+    def __init__(self, file, images: list):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.images = images
+        self._image_ids = {id(image): index for index, image in enumerate(images)}
+
+    def persistent_id(self, obj):
+        if type(obj) is PageTableImage:
+            index = self._image_ids.get(id(obj))
+            if index is None:
+                index = self._image_ids[id(obj)] = len(self.images)
+                self.images.append(obj)
+            return index
+        return None
+
+    def reducer_override(self, obj):
+        if type(obj) is Process:
+            image = PageTableImage.freeze(obj.page_table, obj.num_pages)
+        elif type(obj) is RestoredProcess:
+            # Page table belum dimaterialisasi: image lamanya dipakai ulang tanpa disentuh
+            image = obj._page_table_image
+        else:
+            return NotImplemented
+        state = {name: getattr(obj, name) for name in Process.__slots__ if name != 'page_table'}
+        # Iterator lazy dibuat ulang dari access_step saat akses berikutnya
+        state['_access_iter'] = None
+        state['_page_table_image'] = image
+        # State berbentuk (dict, slot) sesuai protokol pickle untuk objek ber-__slots__
+        return RestoredProcess.__new__, (RestoredProcess,), (None, state)
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, images: list):
+        super().__init__(file)
+        self.images = images
+
+    def persistent_load(self, pid):
+        return self.images[pid]
+
+
+class Snapshot:
+    """
+    State lengkap sebuah SimulationEngine pada satu titik waktu.
+
+    State disimpan sebagai bytes pickle yang ringkas, kecuali page table:
+    setiap page table dibekukan menjadi PageTableImage (array halaman/frame)
+    yang dipakai bersama, bukan disalin, oleh semua cabang hasil `restore`.
+    Proses di cabang memuat page table-nya sendiri baru saat pertama kali
+    disentuh, sehingga proses yang sudah selesai atau tidak lagi mengalami
+    fault tidak pernah membayar biaya salinan. Snapshot yang diambil dari
+    cabang memakai ulang image proses yang page table-nya belum disentuh.
+
+    Trace writer dan event sink tidak ikut disimpan (cabang berjalan tanpa
+    keduanya). Lepaskan Profiler sebelum mengambil snapshot.
+    """
+    def __init__(self, state: bytes, images: list, time: int):
+        self.state = state
+        self.images = images
+        self.time = time
+
+    @classmethod
+    def capture(cls, engine) -> "Snapshot":
+        """Mengambil snapshot dari engine tanpa mengubah jalannya simulasi."""
+        memory_manager = engine.memory_manager
+        trace_writer, sinks, emitters = engine.trace_writer, memory_manager._sinks, memory_manager._emitters
+        engine.trace_writer, memory_manager._sinks, memory_manager._emitters = None, [], []
+        try:
+            buffer = io.BytesIO()
+            images = []
+            _SnapshotPickler(buffer, images).dump(engine)
+        finally:
+            engine.trace_writer, memory_manager._sinks, memory_manager._emitters = trace_writer, sinks, emitters
+        return cls(buffer.getvalue(), images, engine.current_time)
+
+    def restore(self, replacement_algorithm: str | None = None, total_frames: int | None = None,
+                time_quantum: int | None = None, policy_options: dict | None = None, reference_trace=None):
+        """
+        Membuat engine baru yang independen dari state snapshot, opsional dengan
+        konfigurasi berbeda untuk kelanjutannya.
+
+        Args:
+            replacement_algorithm (str | None): Ganti algoritma page replacement.
+            total_frames (int | None): Ganti jumlah frame fisik (lihat MemoryManager.reconfigure).
+            time_quantum (int | None): Ganti kuantum waktu RR/MLFQ (semua core pada SMP).
+            policy_options (dict | None): Parameter policy replacement yang baru.
+            reference_trace (list | None): Urutan akses (process_id, page_number) sisa
+                simulasi setelah snapshot, untuk cabang dengan algoritma seperti 'OPT'.
+
+        Returns:
+            SimulationEngine: Engine (kelas yang sama dengan aslinya) siap dilanjutkan dengan run().
+        """
+        if time_quantum is not None and time_quantum <= 0:
+            raise ValueError("Kuantum waktu harus bilangan positif")
+        engine = _SnapshotUnpickler(io.BytesIO(self.state), self.images).load()
+        memory_manager = engine.memory_manager
+        if (replacement_algorithm is not None or total_frames is not None or policy_options is not None
+                or reference_trace is not None):
+            memory_manager.reconfigure(total_frames, replacement_algorithm, policy_options, reference_trace)
+            if engine.load_controller is not None:
+                engine.load_controller.total_frames = memory_manager.physical_memory.size
+        if time_quantum is not None:
+            for core in getattr(engine.scheduler, 'cores', None) or [engine.scheduler]:
+                core.time_quantum = time_quantum
+        return engine
+
+    def branch(self, variants: dict, max_time: int | None = None) -> dict:
+        """
+        Melanjutkan beberapa cabang dari snapshot yang sama sampai selesai.
+
+        Args:
+            variants (dict): {nama_cabang: dict argumen restore()}, mis.
+                {"opt": {"replacement_algorithm": 'OPT', "reference_trace": trace}}.
+            max_time (int | None): Batas waktu simulasi setiap cabang.
+
+        Returns:
+            dict: {nama_cabang: hasil engine.run()}.
+        """
+        return {name: self.restore(**options).run(max_time) for name, options in variants.items()}
+
+    # --- Bentuk serial ---
+
+    def to_bytes(self, compress: bool = True) -> bytes:
+        """Serialisasi snapshot (state + image page table) ke bytes, opsional dikompres zlib."""
+        payload = pickle.dumps((SNAPSHOT_FORMAT_VERSION, self.time, self.state, self.images),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+        return b'Z' + zlib.compress(payload) if compress else b'P' + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Snapshot":
+        """Membaca snapshot hasil `to_bytes`."""
+        if data[:1] == b'Z':
+            payload = zlib.decompress(data[1:])
+        elif data[:1] == b'P':
+            payload = data[1:]
+        else:
+            raise ValueError("Data snapshot tidak dikenali")
+        version, time, state, images = pickle.loads(payload)
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Versi snapshot {version} tidak didukung")
+        return cls(state, images, time)
+
+    @property
+    def size_bytes(self) -> int:
+        """Perkiraan ukuran snapshot di memori (state + array image page table)."""
+        return len(self.state) + sum(image.pages.itemsize * (len(image.pages) + len(image.frames))
+                                     for image in self.images)
+
+    def __repr__(self) -> str:
+        return f"Snapshot(time={self.time}, state={len(self.state)} B, page_tables={len(self.images)})"
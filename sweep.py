@@ -0,0 +1,179 @@
+# File: sweep.py
+# Deskripsi: Runner sweep parameter paralel. Grid deklaratif (algoritma
+# replacement x jumlah frame x algoritma penjadwalan x kuantum x seed workload)
+# diekspansi menjadi konfigurasi independen, dijalankan per potongan (chunk) di
+# ProcessPoolExecutor, dan hasilnya dialirkan ke CSV sesuai urutan grid.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import csv
+import itertools
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from simulation_engine import SimulationEngine
+
+# Nilai default setiap parameter konfigurasi. Workload tidak pernah dikirim
+# sebagai objek Process: worker membangunnya sendiri dari seed dan parameter ini.
+DEFAULT_CONFIG = {
+    "replacement_algorithm": 'LRU',
+    "total_frames": 32,
+    "scheduling_algorithm": 'RR',
+    "time_quantum": 3,
+    "seed": 0,
+    "num_processes": 8,
+    "burst_time": (50, 200),     # (minimum, maksimum) burst per proses
+    "num_pages": 32,
+    "access_pattern": 'ZIPF',
+    "arrival_spread": 100,       # Kedatangan acak di rentang [0, arrival_spread]
+    "fault_latency": 5,
+}
+
+# Kolom metrik yang diambil dari Statistics setiap run
+METRIC_FIELDS = ["total_time", "total_accesses", "page_faults", "hit_ratio", "context_switches",
+                 "cpu_utilization", "average_waiting_time", "average_turnaround_time", "average_response_time"]
+
+
+def expand_grid(grid: dict) -> list[dict]:
+    """
+    Mengekspansi grid {parameter: daftar nilai} menjadi daftar konfigurasi
+    (produk kartesius) dengan urutan deterministik: parameter mengikuti urutan
+    kunci grid, nilai mengikuti urutan daftar. Hanya list/range yang dianggap
+    daftar pilihan (tuple seperti burst_time (50, 200) adalah satu nilai).
+    Parameter yang tidak disebut memakai DEFAULT_CONFIG.
+    """
+    unknown = set(grid) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Parameter sweep tidak dikenal: {sorted(unknown)}")
+    keys = list(grid)
+    values = [list(grid[key]) if isinstance(grid[key], (list, range)) else [grid[key]] for key in keys]
+    if any(not options for options in values):
+        raise ValueError("Setiap parameter sweep harus memiliki minimal satu nilai")
+    return [{**DEFAULT_CONFIG, **dict(zip(keys, combination))} for combination in itertools.product(*values)]
+
+
+def build_workload(config: dict) -> list[Process]:
+    """
+    Membangun daftar proses secara deterministik dari seed konfigurasi. PID
+    diberikan per workload (P0, P1, ...) tanpa menyentuh counter global Process.
+    """
+    rng = random.Random(config["seed"])
+    min_burst, max_burst = config["burst_time"]
+    return [Process(burst_time=rng.randint(min_burst, max_burst), process_size=config["num_pages"] * 4096,
+                    access_pattern=config["access_pattern"], seed=rng.randrange(2 ** 32),
+                    arrival_time=rng.randint(0, config["arrival_spread"]), pid=pid)
+            for pid in range(config["num_processes"])]
+
+
+def run_config(config: dict) -> dict:
+    """
+    Menjalankan satu konfigurasi sampai selesai.
+
+    Returns:
+        dict: Parameter konfigurasi ditambah METRIC_FIELDS.
+    """
+    processes = build_workload(config)
+    scheduler = CPUScheduler(config["scheduling_algorithm"], processes, time_quantum=config["time_quantum"])
+    mm = MemoryManager(total_frames=config["total_frames"], replacement_algorithm=config["replacement_algorithm"])
+    results = SimulationEngine(scheduler, mm, fault_latency=config["fault_latency"]).run()
+    statistics = results["statistics"]
+    return {
+        **config,
+        "total_time": results["total_time"],
+        "total_accesses": statistics.total_accesses,
+        "page_faults": statistics.page_faults,
+        "hit_ratio": statistics.get_hit_ratio(),
+        "context_switches": statistics.context_switches,
+        "cpu_utilization": statistics.get_cpu_utilization(),
+        "average_waiting_time": statistics.waiting_time_histogram.mean(),
+        "average_turnaround_time": statistics.turnaround_time_histogram.mean(),
+        "average_response_time": statistics.response_time_histogram.mean(),
+    }
+
+
+def _run_chunk(chunk: list[tuple[int, dict]]) -> list[tuple[int, dict]]:
+    """Dijalankan di worker: satu potongan konfigurasi (indeks, konfigurasi)."""
+    return [(index, run_config(config)) for index, config in chunk]
+
+
+class _OrderedCSVWriter:
+    """Menulis baris ke CSV sesuai urutan indeks, meskipun hasil datang acak."""
+    def __init__(self, path: str | None, fieldnames: list[str]):
+        self._file = open(path, 'w', newline='', encoding='utf-8') if path is not None else None
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames) if self._file is not None else None
+        if self._writer is not None:
+            self._writer.writeheader()
+        self._pending = {}
+        self.next_index = 0
+        self.rows = []
+
+    def add(self, index: int, row: dict):
+        self._pending[index] = row
+        # Alirkan semua baris yang prefiksnya sudah lengkap
+        while self.next_index in self._pending:
+            row = self._pending.pop(self.next_index)
+            self.rows.append(row)
+            if self._writer is not None:
+                self._writer.writerow(row)
+            self.next_index += 1
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def run_sweep(grid: dict, workers: int | None = None, chunk_size: int | None = None,
+              output_path: str | None = None) -> list[dict]:
+    """
+    Menjalankan seluruh grid secara paralel.
+
+    Konfigurasi dibagi menjadi potongan berisi `chunk_size` run agar biaya
+    pengiriman antar proses kecil dibanding waktu simulasi. Setiap run hanya
+    bergantung pada konfigurasinya sendiri (workload dibangun dari seed di
+    worker), sehingga hasil dan isi CSV identik untuk jumlah worker berapa pun.
+
+    Args:
+        grid (dict): {parameter: daftar nilai}, lihat DEFAULT_CONFIG.
+        workers (int | None): Jumlah proses worker (default: jumlah CPU).
+            1 berarti dijalankan di proses ini tanpa pool.
+        chunk_size (int | None): Jumlah run per potongan (default: dibagi rata
+            menjadi sekitar 4 potongan per worker).
+        output_path (str | None): File CSV tujuan; baris ditulis begitu prefiks
+            hasilnya lengkap.
+
+    Returns:
+        list[dict]: Satu baris per konfigurasi, sesuai urutan `expand_grid(grid)`.
+    """
+    configs = expand_grid(grid)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Jumlah worker harus lebih besar dari 0")
+    if chunk_size is None:
+        chunk_size = max(1, len(configs) // (workers * 4))
+    if chunk_size <= 0:
+        raise ValueError("Ukuran chunk harus lebih besar dari 0")
+
+    indexed = list(enumerate(configs))
+    chunks = [indexed[start:start + chunk_size] for start in range(0, len(indexed), chunk_size)]
+    writer = _OrderedCSVWriter(output_path, list(DEFAULT_CONFIG) + METRIC_FIELDS)
+    try:
+        if workers == 1:
+            for chunk in chunks:
+                for index, row in _run_chunk(chunk):
+                    writer.add(index, row)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = {executor.submit(_run_chunk, chunk) for chunk in chunks}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for index, row in future.result():
+                            writer.add(index, row)
+    finally:
+        writer.close()
+    return writer.rows
@@ -3,6 +3,7 @@
 # Ini adalah cara Tim Struktur Data memastikan fondasi bekerja sebelum melanjutkan
 # ke milestone berikutnya.
 
+from access_patterns import create_access_pattern
 from core_models import PhysicalMemory, Process, Statistics, PAGE_SIZE
 
 def run_tests():
@@ -47,6 +48,43 @@ def run_tests():
     assert p1.num_pages == 4, "Perhitungan halaman untuk ukuran pas salah!"
     print("  ✅ Verifikasi ID counter dan perhitungan halaman pas BERHASIL.")
 
+    # Proses besar (4 GB) dengan page table sparse/radix: pembuatan harus instan
+    for mode in ('SPARSE', 'RADIX'):
+        big = Process(burst_time=4, process_size=4 * 1024**3, page_table_mode=mode)
+        print(f"  Proses 4 GB dengan page table {mode}: {big.page_table}")
+        assert len(big.page_table) == big.num_pages == 1024**2
+        assert big.page_table.materialized_count == 0, "Page table lazy tidak boleh dialokasikan di awal!"
+        assert big.page_table.get(123456) is None
+        big.page_table[123456][0] = 7
+        big.page_table[123456][1] = 1
+        assert big.page_table.get(123456) == [7, 1]
+        assert big.page_table.materialized_count == 1
+    print("  ✅ Verifikasi page table sparse dan radix BERHASIL.")
+
+    # Pola akses lazy dengan seed: urutan harus dapat direproduksi
+    for pattern in ('UNIFORM', 'SEQUENTIAL', 'ZIPF', 'LOOP', 'PHASE'):
+        pa = Process(burst_time=10000, process_size=4096 * 50, access_pattern=pattern, seed=123)
+        pb = Process(burst_time=10000, process_size=4096 * 50, access_pattern=pattern, seed=123)
+        pages_a = [pa.get_next_page_to_access() for _ in range(10000)]
+        pages_b = [pb.get_next_page_to_access() for _ in range(10000)]
+        assert pages_a == pages_b == list(pa.page_access_sequence), f"Pola {pattern} tidak reproducible!"
+        assert all(0 <= page < pa.num_pages for page in pages_a)
+        assert pa.get_next_page_to_access() is None, "Akses melebihi burst time!"
+        print(f"  Pola {pattern}: 10 akses pertama {pages_a[:10]}")
+
+    # Zipf harus lebih terkonsentrasi pada halaman "panas" dibanding seragam
+    zipf = list(Process(burst_time=5000, process_size=4096 * 100, access_pattern='ZIPF', seed=1).page_access_sequence)
+    uniform = list(Process(burst_time=5000, process_size=4096 * 100, access_pattern='UNIFORM', seed=1).page_access_sequence)
+    assert zipf.count(0) > 5 * uniform.count(0), "Distribusi Zipf tidak condong ke halaman panas!"
+
+    # Fase kosong tidak pernah menghasilkan akses: ditolak saat dibuat, bukan hang saat diiterasi
+    try:
+        create_access_pattern('PHASE', 50, 10, seed=1, phase_length=0)
+        assert False, "phase_length=0 seharusnya ditolak"
+    except ValueError as error:
+        print(f"  phase_length=0 ditolak dengan benar: {error}")
+    print("  ✅ Verifikasi pola akses lazy BERHASIL.")
+
     # --- 2. Menguji Kelas PhysicalMemory ---
     print("\n[TEST 2] Menguji Kelas PhysicalMemory...")
     mem = PhysicalMemory(total_frames=8)
@@ -61,6 +99,20 @@ def run_tests():
     mem.frames[0] = {'process_id': 'P0', 'page_number': 0}
     print(f"  Memori setelah frame 0 diisi: {mem}")
     assert mem.get_empty_frame_index() == 1
+
+    # Isi semua frame lalu bebaskan satu: frame tersebut harus kembali ke pool
+    for i in range(1, mem.size):
+        mem.frames[i] = {'process_id': 'P0', 'page_number': i}
+    print(f"  Memori setelah semua frame diisi: {mem}")
+    assert mem.is_full()
+    assert mem.get_empty_frame_index() == -1
+    assert mem.filled_count == mem.size
+
+    mem.free_frame(5)
+    print(f"  Memori setelah frame 5 dibebaskan: {mem}")
+    assert not mem.is_full()
+    assert mem.get_empty_frame_index() == 5
+    assert mem.frames.count(None) == 1
     print("  ✅ Verifikasi PhysicalMemory BERHASIL.")
 
     # --- 3. Menguji Kelas Statistics ---
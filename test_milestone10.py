@@ -0,0 +1,166 @@
+# File: test_milestone10.py
+# Deskripsi: Script untuk menguji format trace biner (TraceWriter/TraceReader),
+# perekaman simulasi, replay ke MemoryManager, dan impor trace JSONL/CSV.
+
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from replacement_policies import REPLACEMENT_POLICIES
+from simulation_engine import SimulationEngine
+from trace_io import RECORD, TraceReader, TraceWriter, import_text_trace
+
+
+def _make_processes(count: int, num_pages: int = 16) -> list[Process]:
+    Process.reset_id_counter()
+    return [Process(burst_time=300, process_size=4096 * num_pages, access_pattern='ZIPF', seed=i)
+            for i in range(count)]
+
+
+def test_binary_roundtrip():
+    print("\n=========================================")
+    print("  [TEST 1] Trace Biner Tulis & Baca      ")
+    print("=========================================")
+
+    rng = random.Random(11)
+    records = [(f"P{rng.randrange(4)}", rng.randrange(1000), tick, rng.choice((True, False, None)),
+                rng.random() < 0.2)
+               for tick in range(5000)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "trace.bin")
+        with TraceWriter(path, buffer_records=333) as writer:
+            for process_id, page, tick, hit, is_write in records:
+                writer.write(process_id, page, tick, hit=hit, is_write=is_write)
+        print(f"  {len(records)} record, ukuran file {os.path.getsize(path)} byte "
+              f"({RECORD.size} byte per record)")
+
+        with TraceReader(path, chunk_records=700) as reader:
+            assert len(reader) == len(records)
+            assert sorted(reader.process_ids) == ["P0", "P1", "P2", "P3"]
+            assert list(reader) == records
+            assert reader.reference_trace() == [(process_id, page) for process_id, page, *_ in records]
+
+        # File yang bukan trace ditolak
+        bogus = os.path.join(directory, "bogus.bin")
+        with open(bogus, 'wb') as file:
+            file.write(b"bukan trace sama sekali, hanya teks")
+        try:
+            TraceReader(bogus)
+            assert False, "File bukan trace seharusnya ditolak"
+        except ValueError as error:
+            print(f"  Ditolak dengan benar: {error}")
+    print("\n✅ Verifikasi trace biner BERHASIL.")
+
+
+def test_record_and_replay_simulation():
+    print("\n=========================================")
+    print("  [TEST 2] Rekam Simulasi & Replay       ")
+    print("=========================================")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.bin")
+        processes = _make_processes(4)
+        mm = MemoryManager(total_frames=20, replacement_algorithm='LRU')
+        with TraceWriter(path) as writer:
+            results = SimulationEngine(CPUScheduler('RR', processes), mm, fault_latency=3,
+                                       reclaim_on_exit=False, trace_writer=writer).run()
+        recorded = results['statistics']
+
+        with TraceReader(path) as reader:
+            assert len(reader) == recorded.total_accesses
+            # Replay dengan policy yang sama menghasilkan hasil yang persis sama
+            processes = _make_processes(4)
+            replay_mm = MemoryManager(total_frames=20, replacement_algorithm='LRU')
+            for process in processes:
+                replay_mm.register_process(process)
+            replay = reader.replay(replay_mm)
+            print(f"  Simulasi: {recorded.hits} hit / {recorded.page_faults} fault, replay LRU: {replay}")
+            assert replay["hits"] == recorded.hits and replay["matches"] == replay["accesses"]
+
+            # Replay ke policy lain memakai trace yang sama
+            for algorithm in REPLACEMENT_POLICIES:
+                processes = _make_processes(4)
+                policy_mm = MemoryManager(total_frames=20, replacement_algorithm=algorithm,
+                                          reference_trace=reader.reference_trace())
+                replay = reader.replay(policy_mm, {p.process_id: p for p in processes})
+                print(f"  {algorithm:>14}: hit ratio {replay['hits'] / replay['accesses']:.2%}")
+                assert replay["accesses"] == len(reader)
+                if algorithm == 'OPT':
+                    assert replay["hits"] >= recorded.hits
+    print("\n✅ Verifikasi replay BERHASIL.")
+
+
+def test_import_text_traces():
+    print("\n=========================================")
+    print("  [TEST 3] Impor Trace JSONL & CSV       ")
+    print("=========================================")
+
+    rows = [{"process_id": "P0", "page_number": 3, "tick": 0, "outcome": "FAULT"},
+            {"pid": "P1", "page": 5},
+            {"process_id": "P0", "page_number": 3, "outcome": "HIT", "is_write": True}]
+    with tempfile.TemporaryDirectory() as directory:
+        jsonl_path = os.path.join(directory, "trace.jsonl")
+        with open(jsonl_path, 'w', encoding='utf-8') as file:
+            file.write("\n".join(json.dumps(row) for row in rows) + "\n\n")
+        csv_path = os.path.join(directory, "trace.csv")
+        with open(csv_path, 'w', encoding='utf-8') as file:
+            file.write("process_id,page_number,tick,outcome,is_write\n"
+                       "P0,3,0,FAULT,0\nP1,5,,,0\nP0,3,2,HIT,1\n")
+
+        expected = [("P0", 3, 0, False, False), ("P1", 5, 1, None, False), ("P0", 3, 2, True, True)]
+        for source in (jsonl_path, csv_path):
+            binary_path = source + ".bin"
+            assert import_text_trace(source, binary_path) == 3
+            with TraceReader(binary_path) as reader:
+                print(f"  {os.path.basename(source)}: {list(reader)}")
+                assert list(reader) == expected
+    print("\n✅ Verifikasi impor trace BERHASIL.")
+
+
+def test_large_trace_replay_memory():
+    print("\n=========================================")
+    print("  [TEST 4] Replay Trace Besar            ")
+    print("=========================================")
+
+    num_records = 500_000
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "large.bin")
+        start = time.perf_counter()
+        with TraceWriter(path) as writer:
+            for process_index in range(5):
+                pages = [rng.randrange(64) for _ in range(num_records // 5)]
+                writer.write_batch(f"P{process_index}", pages, start_tick=process_index * len(pages))
+        write_time = time.perf_counter() - start
+
+        Process.reset_id_counter()
+        processes = [Process(burst_time=1, process_size=4096 * 64) for _ in range(5)]
+        mm = MemoryManager(total_frames=128, replacement_algorithm='CLOCK')
+        for process in processes:
+            mm.register_process(process)
+        with TraceReader(path) as reader:
+            tracemalloc.start()
+            start = time.perf_counter()
+            replay = reader.replay(mm)
+            replay_time = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(f"  {num_records} record: tulis {write_time:.2f}s, replay {replay_time:.2f}s, "
+              f"puncak memori replay {peak / 1024:.0f} KiB")
+        assert replay["accesses"] == num_records
+        # Record tidak dimuat sebagai objek Python: memori puncak jauh di bawah ukuran file
+        assert peak < os.path.getsize(path) / 4
+    print("\n✅ Verifikasi replay trace besar BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_binary_roundtrip()
+    test_record_and_replay_simulation()
+    test_import_text_traces()
+    test_large_trace_replay_memory()
@@ -0,0 +1,115 @@
+# File: test_milestone11.py
+# Deskripsi: Script untuk menguji mode cepat MemoryManager.access (tanpa dict
+# hasil) dan event sink (ring buffer, file trace, callback).
+
+import os
+import random
+import tempfile
+
+from benchmark import bench_result_modes
+from core_models import Process
+from event_sinks import CallbackSink, FileSink, RingBufferSink
+from memory_manager import MemoryManager
+from tlb import TLB
+from trace_io import TraceReader
+
+
+def _make_setup(algorithm='LRU', tlb=None):
+    Process.reset_id_counter()
+    processes = [Process(burst_time=1, process_size=4096 * 12) for _ in range(2)]
+    mm = MemoryManager(total_frames=8, replacement_algorithm=algorithm, tlb=tlb)
+    for process in processes:
+        mm.register_process(process)
+    return mm, processes
+
+
+def test_fast_mode_matches_access_page():
+    print("\n=========================================")
+    print("  [TEST 1] Mode Cepat = access_page      ")
+    print("=========================================")
+
+    rng = random.Random(21)
+    accesses = [(rng.randrange(2), rng.randrange(12), rng.random() < 0.3) for _ in range(3000)]
+    for algorithm in ('FIFO', 'LRU', 'CLOCK', 'ENHANCED_CLOCK', 'AGING'):
+        for tlb_size in (None, 4):
+            full_mm, full_processes = _make_setup(algorithm, TLB(size=tlb_size) if tlb_size else None)
+            expected = [full_mm.access_page(full_processes[pid], page, is_write)["status"] == "HIT"
+                        for pid, page, is_write in accesses]
+            fast_mm, fast_processes = _make_setup(algorithm, TLB(size=tlb_size) if tlb_size else None)
+            hits = [fast_mm.access(fast_processes[pid], page, is_write) for pid, page, is_write in accesses]
+            assert hits == expected
+            assert fast_mm.statistics.snapshot() == full_mm.statistics.snapshot()
+            assert fast_mm.physical_memory.frames == full_mm.physical_memory.frames
+        print(f"  {algorithm:>14}: {sum(hits)} hit dari {len(hits)} akses (identik dengan access_page)")
+    print("\n✅ Verifikasi mode cepat BERHASIL.")
+
+
+def test_event_sinks():
+    print("\n=========================================")
+    print("  [TEST 2] Event Sink                    ")
+    print("=========================================")
+
+    mm, (p0, p1) = _make_setup('FIFO')
+    ring = RingBufferSink(capacity=5)
+    received = []
+    callback = CallbackSink(received.append)
+    mm.subscribe(ring)
+    mm.subscribe(callback)
+
+    results = [mm.access_page(p0, page) for page in range(8)]
+    results.append(mm.access_page(p1, 0))   # Memori penuh: halaman P0 di frame 0 diusir
+    results.append(mm.access_page(p0, 3))   # HIT
+    assert len(received) == 10 and ring.total_events == 10 and ring.dropped == 5
+    assert ring.events() == received[-5:]
+    for event, result in zip(received, results):
+        sequence, process_id, page_number, frame_number, hit, evicted_owner = event
+        assert hit == (result["status"] == "HIT")
+        assert frame_number == result.get("frame_number", result.get("loaded_into_frame"))
+    assert received[8][5] == ("P0", 0) and received[9][4] is True
+    assert [event[0] for event in received] == list(range(1, 11))
+    print("  Event terakhir di ring buffer:")
+    for event in ring.events():
+        print(f"    {event}")
+
+    # access_many memakai jalur per akses selama ada sink, sehingga setiap akses tetap terlihat
+    mm.access_many(p1, [1, 2, 1])
+    assert len(received) == 13 and [event[2] for event in received[-3:]] == [1, 2, 1]
+
+    # Setelah unsubscribe tidak ada event lagi
+    mm.unsubscribe(ring)
+    mm.unsubscribe(callback)
+    mm.access(p0, 5)
+    mm.access_many(p1, [4, 5])
+    assert len(received) == 13 and ring.total_events == 13
+
+    # FileSink: event direkam ke trace biner yang dapat dibaca TraceReader
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "events.bin")
+        mm, (p0, p1) = _make_setup('LRU')
+        with FileSink(path) as sink:
+            mm.subscribe(sink)
+            outcomes = [mm.access(p0 if page % 2 else p1, page % 10) for page in range(50)]
+        with TraceReader(path) as reader:
+            records = list(reader)
+        assert [hit for *_, hit, _ in records] == outcomes
+        assert [tick for _, _, tick, _, _ in records] == list(range(1, 51))
+        print(f"  FileSink: {len(records)} event tersimpan di trace biner")
+    print("\n✅ Verifikasi event sink BERHASIL.")
+
+
+def test_result_mode_throughput():
+    print("\n=========================================")
+    print("  [TEST 3] Throughput per Mode Hasil     ")
+    print("=========================================")
+
+    results = bench_result_modes(num_accesses=100_000)
+    for mode, throughput in results.items():
+        print(f"  {mode:>20}: {throughput:>12,.0f} akses/detik")
+    assert results['access_many'] > results['access_page']
+    print("\n✅ Verifikasi throughput BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_fast_mode_matches_access_page()
+    test_event_sinks()
+    test_result_mode_throughput()
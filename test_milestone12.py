@@ -0,0 +1,89 @@
+# File: test_milestone12.py
+# Deskripsi: Script untuk menguji runner sweep parameter paralel: ekspansi grid,
+# determinisme terhadap jumlah worker/ukuran chunk, dan streaming hasil ke CSV.
+
+import csv
+import os
+import tempfile
+
+from core_models import Process
+from sweep import DEFAULT_CONFIG, METRIC_FIELDS, build_workload, expand_grid, run_config, run_sweep
+
+GRID = {
+    "replacement_algorithm": ['FIFO', 'LRU', 'CLOCK'],
+    "total_frames": [16, 48],
+    "scheduling_algorithm": ['RR', 'SJF'],
+    "time_quantum": [2, 4],
+    "seed": range(2),
+    "num_processes": 4,
+    "burst_time": (40, 120),
+}
+
+
+def test_expand_grid():
+    print("\n=========================================")
+    print("  [TEST 1] Ekspansi Grid Sweep           ")
+    print("=========================================")
+
+    configs = expand_grid(GRID)
+    print(f"  {len(configs)} konfigurasi, pertama: {configs[0]}")
+    assert len(configs) == 3 * 2 * 2 * 2 * 2
+    # Urutan deterministik: parameter terakhir berubah paling cepat
+    assert [c["seed"] for c in configs[:4]] == [0, 1, 0, 1]
+    assert [c["time_quantum"] for c in configs[:4]] == [2, 2, 4, 4]
+    assert all(c["num_pages"] == DEFAULT_CONFIG["num_pages"] and c["num_processes"] == 4 for c in configs)
+    assert all(c["burst_time"] == (40, 120) for c in configs)
+
+    for bad_grid in ({"frames": [8]}, {"seed": []}):
+        try:
+            expand_grid(bad_grid)
+            assert False, f"Grid {bad_grid} seharusnya ditolak"
+        except ValueError as error:
+            print(f"  Ditolak dengan benar: {error}")
+    print("\n✅ Verifikasi ekspansi grid BERHASIL.")
+
+
+def test_sweep_deterministic_across_workers():
+    print("\n=========================================")
+    print("  [TEST 2] Determinisme Sweep Paralel    ")
+    print("=========================================")
+
+    with tempfile.TemporaryDirectory() as directory:
+        outputs = {}
+        for workers, chunk_size in ((1, None), (2, 1), (3, 5)):
+            path = os.path.join(directory, f"sweep_{workers}.csv")
+            rows = run_sweep(GRID, workers=workers, chunk_size=chunk_size, output_path=path)
+            with open(path, newline='', encoding='utf-8') as file:
+                outputs[workers] = (rows, file.read())
+            print(f"  {workers} worker, chunk={chunk_size}: {len(rows)} baris")
+
+        serial_rows, serial_csv = outputs[1]
+        for rows, text in outputs.values():
+            assert rows == serial_rows
+            assert text == serial_csv
+
+        # Setiap baris sama dengan run tunggal konfigurasinya, dan CSV memuat semua kolom
+        configs = expand_grid(GRID)
+        assert serial_rows[5] == run_config(configs[5])
+        with open(os.path.join(directory, "sweep_1.csv"), newline='', encoding='utf-8') as file:
+            table = list(csv.DictReader(file))
+        assert list(table[0]) == list(DEFAULT_CONFIG) + METRIC_FIELDS
+        assert [int(row["page_faults"]) for row in table] == [row["page_faults"] for row in serial_rows]
+
+        # Jalur serial berjalan di proses pemanggil: counter PID global tidak disentuh
+        Process.reset_id_counter()
+        existing = Process(burst_time=1, process_size=4096)
+        workload = build_workload(configs[0])
+        run_config(configs[0])
+        assert [p.process_id for p in workload] == [f"P{i}" for i in range(len(workload))]
+        assert Process(burst_time=1, process_size=4096).pid == existing.pid + 1
+
+        best = max(serial_rows, key=lambda row: row["hit_ratio"])
+        print(f"  Hit ratio terbaik: {best['hit_ratio']:.2%} ({best['replacement_algorithm']}, "
+              f"{best['total_frames']} frame, {best['scheduling_algorithm']} q={best['time_quantum']})")
+    print("\n✅ Verifikasi sweep paralel BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_expand_grid()
+    test_sweep_deterministic_across_workers()
@@ -0,0 +1,81 @@
+# File: test_milestone13.py
+# Deskripsi: Script untuk menguji suite benchmark: struktur hasil JSON, dan
+# mode pembanding baseline yang menandai regresi sesuai arah metrik.
+
+import json
+import os
+import tempfile
+
+from benchmark import bench_scheduler_selections, compare_results, main
+
+
+def make_suite(values: dict) -> dict:
+    """Membangun hasil suite tiruan: {nama: (nilai, higher_is_better)}."""
+    return {"meta": {"suite_version": 1},
+            "results": {name: {"value": value, "unit": "x", "higher_is_better": higher}
+                        for name, (value, higher) in values.items()}}
+
+
+def test_compare_results():
+    print("\n=========================================")
+    print("  [TEST 1] Pembanding Baseline Benchmark ")
+    print("=========================================")
+
+    baseline = make_suite({"throughput": (1000.0, True), "latency": (10.0, False),
+                           "stabil": (500.0, True), "dihapus": (1.0, True)})
+    current = make_suite({"throughput": (800.0, True), "latency": (8.0, False),
+                          "stabil": (520.0, True), "baru": (2.0, True)})
+    rows = {row["name"]: row for row in compare_results(current, baseline, threshold=0.10)}
+    for row in rows.values():
+        print(f"  {row['name']:<12} -> {row['status']}")
+
+    # Throughput turun 20% = regresi; latency turun 20% = lebih baik
+    assert rows["throughput"]["status"] == 'REGRESI'
+    assert abs(rows["throughput"]["change"] + 0.20) < 1e-9
+    assert rows["latency"]["status"] == 'LEBIH BAIK'
+    assert rows["stabil"]["status"] == 'OK'
+    assert rows["dihapus"]["status"] == 'HILANG'
+    assert rows["baru"]["status"] == 'BARU'
+
+    try:
+        compare_results(current, baseline, threshold=-0.1)
+        assert False, "Ambang negatif seharusnya ditolak"
+    except ValueError as error:
+        print(f"  Ditolak dengan benar: {error}")
+    print("\n✅ Verifikasi pembanding baseline BERHASIL.")
+
+
+def test_suite_cli_json_and_compare():
+    print("\n=========================================")
+    print("  [TEST 2] CLI Suite: JSON & Regresi     ")
+    print("=========================================")
+
+    # Proses dengan burst sangat panjang tetap murah dibuat (pola akses lazy)
+    for algorithm in ('RR', 'SJF', 'MLFQ'):
+        assert bench_scheduler_selections(algorithm, queue_size=50, num_selections=500) > 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hasil.json")
+        assert main(["--suite", "--quick", "--json", path]) == 0
+        with open(path, encoding='utf-8') as file:
+            suite = json.load(file)
+        names = list(suite["results"])
+        print(f"  {len(names)} hasil benchmark tersimpan")
+        assert suite["meta"]["size"] == 'quick'
+        for group in ("access_page/", "select_next_process/", "process_creation/", "peak_memory/"):
+            assert any(name.startswith(group) for name in names), group
+        assert all(result["value"] > 0 for result in suite["results"].values())
+
+        # Baseline yang jauh lebih cepat membuat hasil sekarang terdeteksi sebagai regresi
+        name = next(name for name in names if name.startswith("access_page/"))
+        suite["results"][name]["value"] *= 100
+        baseline_path = os.path.join(directory, "baseline.json")
+        with open(baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(suite, file)
+        assert main(["--suite", "--quick", "--compare", baseline_path, "--threshold", "0.5"]) == 1
+    print("\n✅ Verifikasi CLI suite benchmark BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_compare_results()
+    test_suite_cli_json_and_compare()
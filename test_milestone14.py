@@ -0,0 +1,135 @@
+# File: test_milestone14.py
+# Deskripsi: Script untuk menguji Profiler: hasil simulasi tidak berubah saat
+# diinstrumentasi, jumlah panggilan per fase sesuai Statistics, dan method asli
+# dipulihkan sepenuhnya setelah profiler dilepas.
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from profiling import Profiler
+from simulation_engine import SimulationEngine
+from smp_scheduler import MultiCoreScheduler
+
+
+def build_simulation(replacement_algorithm: str = 'CLOCK', total_frames: int = 16):
+    Process.reset_id_counter()
+    processes = [Process(burst_time=300, process_size=4096 * 32, access_pattern='ZIPF', seed=i)
+                 for i in range(4)]
+    scheduler = CPUScheduler('RR', processes, time_quantum=3)
+    mm = MemoryManager(total_frames=total_frames, replacement_algorithm=replacement_algorithm)
+    return scheduler, mm
+
+
+def test_profiler_phases_and_transparency():
+    print("\n=========================================")
+    print("  [TEST 1] Profiler Fase Simulasi        ")
+    print("=========================================")
+
+    scheduler, mm = build_simulation()
+    expected = SimulationEngine(scheduler, mm, fault_latency=2).run()
+
+    scheduler, mm = build_simulation()
+    profiler = Profiler(sample_capacity=256)
+    profiler.attach_memory_manager(mm)
+    profiler.attach_scheduler(scheduler)
+    profiled = SimulationEngine(scheduler, mm, fault_latency=2).run()
+    profiler.detach()
+    assert repr(profiled.pop("statistics")) == repr(expected.pop("statistics"))
+    assert profiled == expected
+
+    report = profiler.report()
+    print(profiler.format_report())
+    memory, cpu = report["memory/CLOCK"], report["scheduler/RR"]
+    statistics = mm.statistics
+    assert memory["access"]["calls"] == statistics.total_accesses
+    assert memory["page_fault"]["calls"] == statistics.page_faults
+    assert memory["page_load"]["calls"] == statistics.page_faults
+    # Setiap fault memakai frame kosong atau memilih korban (frame proses selesai ikut dipakai ulang)
+    assert memory["free_frame_search"]["calls"] + memory["victim_selection"]["calls"] == statistics.page_faults
+    assert memory["victim_selection"]["calls"] == memory["eviction"]["calls"]
+    assert memory["page_table_lookup"]["total_ns"] + memory["page_fault"]["total_ns"] == memory["access"]["total_ns"]
+    assert abs(memory["access"]["share"] - 1.0) < 1e-9
+    assert cpu["select_next_process"]["calls"] == cpu["policy_select"]["calls"] > 0
+    assert all(row["p50_ns"] <= row["p99_ns"] for row in memory.values() if row["p50_ns"] is not None)
+
+    # Setelah detach tidak ada pembungkus tersisa di instance
+    for owner in (mm, mm.policy, mm.physical_memory, scheduler, scheduler.policy):
+        assert not any(callable(value) for value in vars(owner).values() if hasattr(value, '__code__'))
+    assert 'access' not in vars(mm) and 'select' not in vars(scheduler.policy)
+
+    profiler.reset()
+    assert profiler.report() == {}
+    print("\n✅ Verifikasi profiler BERHASIL.")
+
+
+def test_profiler_batch_and_multicore():
+    print("\n=========================================")
+    print("  [TEST 2] Profiler Batch & Multi-Core   ")
+    print("=========================================")
+
+    profiler = Profiler()
+    for algorithm in ('FIFO', 'LRU'):
+        Process.reset_id_counter()
+        process = Process(burst_time=1, process_size=4096 * 64)
+        mm = MemoryManager(total_frames=8, replacement_algorithm=algorithm)
+        mm.register_process(process)
+        profiler.attach_memory_manager(mm)
+        result = mm.access_many(process, list(range(64)) * 2)
+        profiler.detach()
+        rows = profiler.report()[f"memory/{algorithm}"]
+        print(f"  {algorithm}: {rows['access_many']['calls']} batch, "
+              f"{rows['victim_selection']['calls']} seleksi korban")
+        assert rows["access_many"]["calls"] == 1
+        assert rows["victim_selection"]["calls"] == result["faults"] - 8
+        # Penggantian inline di access_many tidak boleh terhitung sebagai lookup page table
+        assert "page_table_lookup" not in rows
+
+    Process.reset_id_counter()
+    processes = [Process(burst_time=50, process_size=4096 * 8) for _ in range(6)]
+    scheduler = MultiCoreScheduler('RR', processes, num_cores=2, time_quantum=2)
+    profiler.attach_scheduler(scheduler)
+    while any(process is not None for process in scheduler.select_next_processes()):
+        for core in scheduler.cores:
+            if core.current_process is not None:
+                core.current_process.burst_time_remaining -= 1
+            core.tick()
+    profiler.detach()
+    rows = profiler.report()["scheduler/RR"]
+    print(f"  Multi-core: {rows['select_next_process']['calls']} keputusan di 2 core")
+    assert rows["select_next_process"]["calls"] >= 150 // 2
+    print("\n✅ Verifikasi profiler batch & multi-core BERHASIL.")
+
+
+def test_profiler_instance_bound_hooks():
+    print("\n=========================================")
+    print("  [TEST 3] Profiler Hook per Instance    ")
+    print("=========================================")
+
+    # LRU mengikat on_hit/on_load langsung ke method OrderedDict di instance policy
+    scheduler, mm = build_simulation('LRU')
+    expected = SimulationEngine(scheduler, mm, fault_latency=2).run()
+
+    scheduler, mm = build_simulation('LRU')
+    on_hit, on_load = mm.policy.on_hit, mm.policy.on_load
+    profiler = Profiler()
+    profiler.attach_memory_manager(mm)
+    profiler.attach_memory_manager(mm)  # Pemasangan ulang tidak membungkus dua kali
+    profiled = SimulationEngine(scheduler, mm, fault_latency=2).run()
+    profiler.detach()
+    assert repr(profiled.pop("statistics")) == repr(expected.pop("statistics"))
+    assert profiled == expected
+
+    rows = profiler.report()["memory/LRU"]
+    print(f"  policy_hit_update: {rows['policy_hit_update']['calls']} panggilan, "
+          f"{mm.statistics.hits} hit")
+    assert rows["policy_hit_update"]["calls"] == mm.statistics.hits
+    # Hook per instance dipulihkan, bukan dihapus (fallback ke method kelas yang kosong)
+    assert mm.policy.on_hit == on_hit and mm.policy.on_load == on_load
+    assert 'access' not in vars(mm)
+    print("\n✅ Verifikasi hook per instance BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_profiler_phases_and_transparency()
+    test_profiler_batch_and_multicore()
+    test_profiler_instance_bound_hooks()
@@ -0,0 +1,213 @@
+# File: test_milestone15.py
+# Deskripsi: Script untuk menguji snapshot simulasi: kelanjutan dari snapshot
+# identik dengan simulasi tanpa jeda, cabang "what-if" dengan konfigurasi
+# berbeda tetap konsisten, dan page table dipakai bersama sampai disentuh.
+
+import os
+import tempfile
+
+from core_models import Process, RestoredProcess
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from simulation_engine import MultiCoreSimulationEngine, SimulationEngine
+from smp_scheduler import MultiCoreScheduler
+from snapshot import Snapshot
+from tlb import TLB
+from trace_io import TraceReader, TraceWriter
+
+
+def build_engine(page_table_mode: str = 'DENSE', compact: bool = False, replacement_algorithm: str = 'LRU',
+                 fault_latency: int = 2) -> SimulationEngine:
+    Process.reset_id_counter()
+    processes = [Process(burst_time=400 + 100 * i, process_size=4096 * 48, page_table_mode=page_table_mode,
+                         access_pattern='ZIPF', seed=i, arrival_time=20 * i)
+                 for i in range(6)]
+    scheduler = CPUScheduler('RR', processes, time_quantum=3)
+    mm = MemoryManager(total_frames=32, replacement_algorithm=replacement_algorithm, compact_frames=compact,
+                       tlb=TLB(8))
+    return SimulationEngine(scheduler, mm, fault_latency=fault_latency)
+
+
+def summarize(results: dict) -> tuple:
+    return (results["timeline"], results["completion_times"], results["statistics"].snapshot())
+
+
+def check_memory_consistency(mm: MemoryManager):
+    """Setiap frame terisi cocok dengan entri page table valid pemiliknya, dan sebaliknya."""
+    owners = {}
+    for frame_number in range(mm.physical_memory.size):
+        owner = mm.physical_memory.frames.owner_of(frame_number)
+        if owner is not None:
+            owners[owner] = frame_number
+            assert mm.processes[owner[0]].page_table[owner[1]] == [frame_number, 1]
+            assert frame_number in mm.resident_frames[owner[0]]
+    for process in mm.processes.values():
+        for page_number, entry in process.page_table.items():
+            if entry[1] == 1:
+                assert owners[(process.process_id, page_number)] == entry[0]
+
+
+def test_snapshot_restore_matches_uninterrupted_run():
+    print("\n=========================================")
+    print("  [TEST 1] Restore Snapshot = Tanpa Jeda ")
+    print("=========================================")
+
+    for page_table_mode, compact in (('DENSE', False), ('SPARSE', True), ('RADIX', False)):
+        expected = summarize(build_engine(page_table_mode, compact).run())
+
+        engine = build_engine(page_table_mode, compact)
+        engine.run(max_time=900)
+        snapshot = engine.snapshot()
+        data = snapshot.to_bytes()
+        print(f"  {page_table_mode:<6} compact={compact!s:<5}: {snapshot}, serial {len(data)} B")
+
+        # Engine asli tetap bisa dilanjutkan setelah snapshot diambil
+        assert summarize(engine.run()) == expected
+        assert summarize(snapshot.restore().run()) == expected
+        assert summarize(Snapshot.from_bytes(data).restore().run()) == expected
+        assert summarize(Snapshot.from_bytes(snapshot.to_bytes(compress=False)).restore().run()) == expected
+
+    try:
+        Snapshot.from_bytes(b'X' + data[1:])
+        assert False, "Data snapshot rusak seharusnya ditolak"
+    except ValueError as error:
+        print(f"  Ditolak dengan benar: {error}")
+    print("\n✅ Verifikasi restore snapshot BERHASIL.")
+
+
+def test_branching_and_shared_page_tables():
+    print("\n=========================================")
+    print("  [TEST 2] Cabang What-If & Page Table   ")
+    print("=========================================")
+
+    engine = build_engine()
+    engine.run(max_time=3000)
+    snapshot = engine.snapshot()
+
+    # Page table dipakai bersama sampai proses menyentuhnya
+    branch = snapshot.restore()
+    assert all(type(process) is RestoredProcess for process in branch.processes)
+    terminated = [process for process in branch.processes if process.status == 'terminated']
+    assert terminated
+    branch.run()
+    assert all(type(process) is RestoredProcess for process in terminated)
+    # Snapshot dari cabang memakai ulang image proses yang tidak pernah disentuh
+    resnapshot = branch.snapshot()
+    for process in terminated:
+        image = process._page_table_image
+        assert any(image is shared for shared in snapshot.images)
+        assert any(image is shared for shared in resnapshot.images)
+
+    variants = {
+        "lru": {},
+        "clock": {"replacement_algorithm": 'CLOCK'},
+        "fifo_16_frames": {"replacement_algorithm": 'FIFO', "total_frames": 16},
+        "lru_48_frames": {"total_frames": 48},
+        "quantum_8": {"time_quantum": 8},
+    }
+    results = snapshot.branch(variants)
+    for name, result in results.items():
+        print(f"  {name:<15}: total_time={result['total_time']}, {result['statistics']}")
+        assert len(result["completion_times"]) == 6
+        assert result["statistics"].total_accesses == sum(400 + 100 * i for i in range(6))
+    assert summarize(results["lru"]) == summarize(engine.run())
+    assert results["quantum_8"]["timeline"] != results["lru"]["timeline"]
+
+    # Konsistensi frame <-> page table setelah mengecilkan dan membesarkan memori
+    for total_frames in (8, 32, 64):
+        branch = snapshot.restore(replacement_algorithm='CLOCK', total_frames=total_frames)
+        mm = branch.memory_manager
+        assert mm.physical_memory.size == total_frames and mm.algorithm == 'CLOCK'
+        assert mm.physical_memory.filled_count == min(total_frames, engine.memory_manager.physical_memory.size)
+        check_memory_consistency(mm)
+        branch.run(max_time=3500)
+        check_memory_consistency(mm)
+
+    # Hanya jumlah frame yang berubah: policy lama dipertahankan beserta urutan LRU-nya
+    reference = snapshot.restore().memory_manager.lru_tracker
+    assert snapshot.restore(total_frames=48).memory_manager.lru_tracker == reference
+    assert snapshot.restore(total_frames=16).memory_manager.lru_tracker == [f for f in reference if f < 16]
+    for algorithm in ('FIFO', 'CLOCK', 'ENHANCED_CLOCK', 'AGING', 'NFU'):
+        resized = build_engine(replacement_algorithm=algorithm)
+        resized.run(max_time=3000)
+        resized_snapshot = resized.snapshot()
+        for total_frames in (8, 64):
+            branch = resized_snapshot.restore(total_frames=total_frames)
+            assert branch.memory_manager.policy.total_frames == total_frames
+            branch.run()
+            check_memory_consistency(branch.memory_manager)
+            assert len(branch.completion_times) == 6
+
+    try:
+        snapshot.restore(replacement_algorithm='BOGUS')
+        assert False, "Algoritma tidak dikenal seharusnya ditolak"
+    except ValueError as error:
+        print(f"  Ditolak dengan benar: {error}")
+    print("\n✅ Verifikasi cabang what-if BERHASIL.")
+
+
+def test_opt_branch_with_reference_trace():
+    print("\n=========================================")
+    print("  [TEST 3] Cabang OPT dari Snapshot      ")
+    print("=========================================")
+
+    # Tanpa latensi fault, urutan akses tidak bergantung pada algoritma replacement
+    engine = build_engine(fault_latency=0)
+    engine.run(max_time=1000)
+    snapshot = engine.snapshot()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rest.trace")
+        branch = snapshot.restore()
+        with TraceWriter(path) as writer:
+            branch.trace_writer = writer
+            branch.run()
+        with TraceReader(path) as reader:
+            trace = reader.reference_trace()
+
+    results = snapshot.branch({
+        "lru": {},
+        "opt": {"replacement_algorithm": 'OPT', "reference_trace": trace},
+        # reference_trace di policy_options tidak ditimpa argumen reference_trace
+        "opt_options": {"replacement_algorithm": 'OPT', "policy_options": {"reference_trace": trace}},
+    })
+    faults = {name: result["statistics"].page_faults for name, result in results.items()}
+    print(f"  Sisa trace {len(trace)} akses, page fault kumulatif: {faults}")
+    assert faults["opt"] == faults["opt_options"] <= faults["lru"]
+    assert results["opt"]["statistics"].total_accesses == results["lru"]["statistics"].total_accesses
+
+    try:
+        snapshot.restore(replacement_algorithm='OPT')
+        assert False, "Cabang OPT tanpa reference_trace seharusnya ditolak"
+    except ValueError as error:
+        print(f"  Ditolak dengan benar: {error}")
+    print("\n✅ Verifikasi cabang OPT BERHASIL.")
+
+
+def test_multicore_snapshot():
+    print("\n=========================================")
+    print("  [TEST 4] Snapshot Simulasi Multi-Core  ")
+    print("=========================================")
+
+    def build():
+        Process.reset_id_counter()
+        processes = [Process(burst_time=300, process_size=4096 * 32, access_pattern='LOOP', seed=i)
+                     for i in range(5)]
+        mm = MemoryManager(total_frames=24, replacement_algorithm='FIFO')
+        mm.attach_cpu_tlbs([TLB(8), TLB(8)])
+        return MultiCoreSimulationEngine(MultiCoreScheduler('RR', processes, num_cores=2), mm, fault_latency=1)
+
+    expected = build().run()
+    engine = build()
+    engine.run(max_time=200)
+    restored = engine.snapshot().restore().run()
+    print(f"  Core timelines sama: {restored['core_timelines'] == expected['core_timelines']}")
+    assert restored["core_timelines"] == expected["core_timelines"]
+    assert restored["statistics"].snapshot() == expected["statistics"].snapshot()
+    print("\n✅ Verifikasi snapshot multi-core BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_snapshot_restore_matches_uninterrupted_run()
+    test_branching_and_shared_page_tables()
+    test_opt_branch_with_reference_trace()
+    test_multicore_snapshot()
@@ -0,0 +1,76 @@
+# File: test_milestone16.py
+# Deskripsi: Script untuk menguji representasi proses yang ringkas: PID numerik
+# untuk pengurutan (P2 sebelum P10), objek tanpa __dict__, dan memori per
+# proses pada workload besar.
+
+from access_patterns import ZipfPattern, create_access_pattern
+from benchmark import measure_process_bytes
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from smp_scheduler import MultiCoreScheduler
+
+
+def test_numeric_pid_ordering():
+    print("\n=========================================")
+    print("  [TEST 1] Urutan PID Numerik            ")
+    print("=========================================")
+
+    Process.reset_id_counter()
+    processes = [Process(burst_time=2, process_size=4096) for _ in range(12)]
+    assert [p.pid for p in processes] == list(range(12))
+    assert processes[10].process_id == "P10"
+
+    # Urutan input diacak: FCFS tetap menjalankan P0, P1, P2, ..., P10, P11
+    scheduler = CPUScheduler('FCFS', processes[::-1])
+    order = []
+    while (process := scheduler.select_next_process()) is not None:
+        process.burst_time_remaining = 0
+        order.append(process.process_id)
+    print(f"  Urutan FCFS: {order}")
+    assert order == [f"P{i}" for i in range(12)]
+
+    smp = MultiCoreScheduler('FCFS', processes[::-1], num_cores=2)
+    assert [p.process_id for p in smp.processes] == [f"P{i}" for i in range(12)]
+    print("\n✅ Verifikasi urutan PID BERHASIL.")
+
+
+def test_compact_process_memory():
+    print("\n=========================================")
+    print("  [TEST 2] Memori Proses Ringkas         ")
+    print("=========================================")
+
+    Process.reset_id_counter()
+    process = Process(burst_time=10, process_size=4096 * 8, page_table_mode='SPARSE', access_pattern='LOOP')
+    assert not hasattr(process, '__dict__')
+    assert not hasattr(process.page_access_sequence, '__dict__')
+    assert not hasattr(process.page_table, '__dict__')
+    try:
+        process.unknown_attribute = 1
+        assert False, "Atribut di luar __slots__ seharusnya ditolak"
+    except AttributeError:
+        print("  Atribut di luar __slots__ ditolak dengan benar")
+
+    # Page table sparse yang belum disentuh tidak punya dict entri sendiri
+    other = Process(burst_time=10, process_size=4096 * 8, page_table_mode='SPARSE')
+    assert process.page_table._entries is other.page_table._entries
+    process.page_table[3][1] = 1
+    assert process.page_table.materialized_count == 1 and other.page_table.materialized_count == 0
+    assert other.page_table.get(3) is None
+
+    # Bobot kumulatif Zipf dipakai bersama oleh pola berukuran sama
+    first, second = (create_access_pattern('ZIPF', 64, 100, seed=seed) for seed in (1, 2))
+    assert list(first) != list(second) and isinstance(first, ZipfPattern)
+    assert len(list(first)) == 100
+
+    bytes_per_process = measure_process_bytes(20_000)
+    dict_bytes_per_process = measure_process_bytes(20_000, dict_baseline=True)
+    print(f"  Memori per proses (SPARSE, pola lazy, 20k proses): {bytes_per_process:.0f} B "
+          f"(pembanding dict: {dict_bytes_per_process:.0f} B)")
+    # Ukuran absolut bergantung versi/platform Python; yang diuji adalah penghematan relatif
+    assert bytes_per_process < 0.75 * dict_bytes_per_process
+    print("\n✅ Verifikasi memori proses BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_numeric_pid_ordering()
+    test_compact_process_memory()
@@ -1,8 +1,12 @@
 # File: test_milestone2.py
 # Deskripsi: Script untuk menguji MemoryManager dan algoritma page replacement.
 
-from core_models import Process
+import random
+
+from core_models import Histogram, Process
+from cpu_scheduler import CPUScheduler
 from memory_manager import MemoryManager
+from trace_analysis import reference_trace_from_schedule
 
 def print_memory_state(mm: MemoryManager):
     """Fungsi helper untuk mencetak status memori dan antrian algoritma."""
@@ -114,6 +118,326 @@ def test_lru_logic():
     assert result_fault['evicted_page_info']['page_number'] == 1, "Halaman yang diusir salah."
     print("\n✅ Verifikasi LRU BERHASIL.")
 
+def test_lru_matches_reference_model():
+    print("\n=========================================")
+    print("  [TEST 3] Membandingkan LRU dengan Model Referensi")
+    print("=========================================")
+
+    # Model referensi: implementasi LRU lama berbasis list (remove + pop(0)).
+    mm = MemoryManager(total_frames=5, replacement_algorithm='LRU')
+    Process.reset_id_counter()
+    p0 = Process(burst_time=1, process_size=4096 * 12)
+    mm.register_process(p0)
+
+    rng = random.Random(42)
+    reference_frames = [None] * 5
+    reference_lru = []
+
+    for _ in range(2000):
+        page = rng.randrange(12)
+        result = mm.access_page(p0, page)
+
+        if page in reference_frames:
+            frame = reference_frames.index(page)
+            expected_status, expected_frame = "HIT", frame
+        elif None in reference_frames:
+            frame = reference_frames.index(None)
+            expected_status, expected_frame = "FAULT", frame
+        else:
+            frame = reference_lru.pop(0)
+            expected_status, expected_frame = "FAULT", frame
+        reference_frames[frame] = page
+        if frame in reference_lru:
+            reference_lru.remove(frame)
+        reference_lru.append(frame)
+
+        actual_frame = result.get('frame_number', result.get('loaded_into_frame'))
+        assert result['status'] == expected_status, "Status akses LRU berbeda dari model referensi!"
+        assert actual_frame == expected_frame, "Frame LRU berbeda dari model referensi!"
+
+    assert mm.lru_tracker == reference_lru, "Urutan LRU akhir berbeda dari model referensi!"
+    print("\n✅ Verifikasi LRU terhadap model referensi BERHASIL.")
+
+def test_compact_frame_table_matches_dict_table():
+    print("\n=========================================")
+    print("  [TEST 4] Menguji Tabel Frame Compact   ")
+    print("=========================================")
+
+    # Trace yang sama dijalankan pada tabel frame dict dan tabel frame compact
+    rng = random.Random(7)
+    trace = [(rng.randrange(2), rng.randrange(6)) for _ in range(1000)]
+
+    results = {}
+    for compact in (False, True):
+        mm = MemoryManager(total_frames=4, replacement_algorithm='FIFO', compact_frames=compact)
+        Process.reset_id_counter()
+        processes = [Process(burst_time=1, process_size=4096 * 6) for _ in range(2)]
+        for p in processes:
+            mm.register_process(p)
+        results[compact] = [mm.access_page(processes[pid], page) for pid, page in trace]
+        final_frames = [dict(frame) for frame in mm.physical_memory.frames]
+        print(f"  compact={compact}: {final_frames}")
+        results[compact].append(final_frames)
+
+    assert results[False] == results[True], "Hasil tabel frame compact berbeda dari tabel dict!"
+
+    # Frame view tetap menampilkan bentuk dict
+    view = mm.physical_memory.frames[0]
+    assert set(view.keys()) == {"process_id", "page_number"}
+    assert view.copy() == dict(view)
+    print("\n✅ Verifikasi tabel frame compact BERHASIL.")
+
+def test_lazy_page_tables_match_dense():
+    print("\n=========================================")
+    print("  [TEST 5] Menguji Page Table Sparse & Radix")
+    print("=========================================")
+
+    # Halaman dipilih melintasi beberapa tabel daun radix (1024 halaman per daun)
+    rng = random.Random(11)
+    trace = [rng.choice([0, 5, 1023, 1024, 2048, 5000, 5001, 9999]) for _ in range(500)]
+
+    outcomes = {}
+    for mode in ('DENSE', 'SPARSE', 'RADIX'):
+        mm = MemoryManager(total_frames=3, replacement_algorithm='LRU')
+        Process.reset_id_counter()
+        p0 = Process(burst_time=1, process_size=4096 * 10000, page_table_mode=mode)
+        mm.register_process(p0)
+        results = [mm.access_page(p0, page) for page in trace]
+        resident = sorted(page for page in set(trace) if p0.page_table[page][1] == 1)
+        outcomes[mode] = (results, resident)
+        print(f"  Mode {mode}: halaman resident = {resident}")
+
+    assert outcomes['DENSE'] == outcomes['SPARSE'] == outcomes['RADIX'], "Hasil page table lazy berbeda!"
+    print("\n✅ Verifikasi page table sparse & radix BERHASIL.")
+
+def test_access_many_matches_access_page():
+    print("\n=========================================")
+    print("  [TEST 6] Menguji Akses Batch (access_many)")
+    print("=========================================")
+
+    rng = random.Random(3)
+    pages = [rng.randrange(8) for _ in range(3000)]
+
+    for algorithm in ('FIFO', 'LRU'):
+        Process.reset_id_counter()
+        single_mm = MemoryManager(total_frames=4, replacement_algorithm=algorithm)
+        single_p = Process(burst_time=1, process_size=4096 * 8)
+        single_mm.register_process(single_p)
+        single_results = [single_mm.access_page(single_p, page) for page in pages]
+
+        Process.reset_id_counter()
+        batch_mm = MemoryManager(total_frames=4, replacement_algorithm=algorithm)
+        batch_p = Process(burst_time=1, process_size=4096 * 8)
+        batch_mm.register_process(batch_p)
+        batch = batch_mm.access_many(batch_p, pages, record_status=True)
+
+        print(f"  {algorithm}: hits={batch['hits']}, faults={batch['faults']}, "
+              f"evictions={len(batch['evictions'])}, stats={batch_mm.statistics}")
+        expected_status = bytearray(1 if r['status'] == 'HIT' else 0 for r in single_results)
+        expected_evictions = [(r['evicted_page_info']['process_id'], r['evicted_page_info']['page_number'])
+                              for r in single_results if r['status'] == 'FAULT' and r['evicted_page_info']]
+        assert batch['status'] == expected_status, "Status per akses batch berbeda!"
+        assert batch['evictions'] == expected_evictions, "Daftar eviksi batch berbeda!"
+        assert batch_p.page_table == single_p.page_table, "Page table batch berbeda!"
+        assert batch_mm.physical_memory.frames == single_mm.physical_memory.frames
+        assert repr(batch_mm.statistics) == repr(single_mm.statistics), "Statistics batch berbeda!"
+    print("\n✅ Verifikasi access_many BERHASIL.")
+
+def _brute_force_opt_faults(trace, frames: int) -> int:
+    """Model referensi OPT naif: scan ke depan pada setiap page fault."""
+    resident = []
+    faults = 0
+    for time, key in enumerate(trace):
+        if key in resident:
+            continue
+        faults += 1
+        if len(resident) < frames:
+            resident.append(key)
+            continue
+        future = trace[time + 1:]
+        victim = max(resident, key=lambda k: future.index(k) if k in future else len(future))
+        resident[resident.index(victim)] = key
+    return faults
+
+
+def test_opt_logic():
+    print("\n=========================================")
+    print("  [TEST 7] Menguji Logika OPT (Belady)   ")
+    print("=========================================")
+
+    # Contoh klasik buku teks: 20 referensi, 3 frame -> 9 page fault untuk OPT
+    Process.reset_id_counter()
+    p0 = Process(burst_time=20, process_size=4096 * 8)
+    p0.page_access_sequence = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+    reference = [(p0.process_id, page) for page in p0.page_access_sequence]
+    mm = MemoryManager(total_frames=3, replacement_algorithm='OPT', reference_trace=reference)
+    mm.register_process(p0)
+    for page in p0.page_access_sequence:
+        mm.access_page(p0, page)
+    print(f"  Contoh buku teks: {mm.statistics}")
+    assert mm.statistics.page_faults == 9, "Jumlah page fault OPT salah!"
+
+    # Beberapa proses bergantian di bawah Round Robin
+    Process.reset_id_counter()
+    processes = [Process(burst_time=60, process_size=4096 * 6) for _ in range(3)]
+    scheduler = CPUScheduler(algorithm='RR', process_list=processes)
+    execution_order = []
+    while (current := scheduler.select_next_process()) is not None:
+        execution_order.append(current.process_id)
+        current.burst_time_remaining -= 1
+        scheduler.tick()
+    trace = reference_trace_from_schedule(processes, execution_order)
+
+    faults = {}
+    for algorithm in ('FIFO', 'LRU', 'OPT'):
+        mm = MemoryManager(total_frames=5, replacement_algorithm=algorithm, reference_trace=trace)
+        for p in processes:
+            mm.register_process(p)
+            p.page_table = {i: [None, 0] for i in range(p.num_pages)}
+        by_id = {p.process_id: p for p in processes}
+        for process_id, page in trace:
+            mm.access_page(by_id[process_id], page)
+        faults[algorithm] = mm.statistics.page_faults
+    print(f"  Page fault (3 proses, RR, 5 frame): {faults}")
+    assert faults['OPT'] == _brute_force_opt_faults(trace, 5), "OPT berbeda dari model referensi!"
+    assert faults['OPT'] <= min(faults['FIFO'], faults['LRU'])
+    print("\n✅ Verifikasi OPT BERHASIL.")
+
+def test_clock_family_policies():
+    print("\n=========================================")
+    print("  [TEST 8] Menguji CLOCK, Enhanced CLOCK, dan Aging")
+    print("=========================================")
+
+    # --- CLOCK (second chance) ---
+    mm = MemoryManager(total_frames=3, replacement_algorithm='CLOCK')
+    Process.reset_id_counter()
+    p0 = Process(burst_time=1, process_size=4096 * 8)
+    mm.register_process(p0)
+    for page in (0, 1, 2):
+        mm.access_page(p0, page)
+    # Semua reference bit = 1: jarum menyapu satu putaran penuh, korban frame 0
+    result = mm.access_page(p0, 3)
+    print(f"  CLOCK: akses H3 -> frame {result['loaded_into_frame']}, bits={list(mm.policy.reference_bits)}")
+    assert result['loaded_into_frame'] == 0
+    # H1 mendapat kesempatan kedua, sehingga korban berikutnya frame 2 (H2)
+    mm.access_page(p0, 1)
+    result = mm.access_page(p0, 4)
+    print(f"  CLOCK: akses H4 -> frame {result['loaded_into_frame']}, diusir {result['evicted_page_info']}")
+    assert result['loaded_into_frame'] == 2 and result['evicted_page_info']['page_number'] == 2
+
+    # --- Enhanced CLOCK: halaman bersih lebih disukai daripada halaman dirty ---
+    mm = MemoryManager(total_frames=3, replacement_algorithm='ENHANCED_CLOCK')
+    Process.reset_id_counter()
+    p0 = Process(burst_time=1, process_size=4096 * 8)
+    mm.register_process(p0)
+    mm.access_page(p0, 0, is_write=True)
+    mm.access_page(p0, 1)
+    mm.access_page(p0, 2, is_write=True)
+    result = mm.access_page(p0, 3)
+    print(f"  ENHANCED_CLOCK: akses H3 -> diusir {result['evicted_page_info']} (satu-satunya halaman bersih)")
+    assert result['evicted_page_info']['page_number'] == 1
+
+    # --- Aging: halaman yang sering dipakai bertahan ---
+    mm = MemoryManager(total_frames=3, replacement_algorithm='AGING', policy_options={"aging_interval": 1})
+    Process.reset_id_counter()
+    p0 = Process(burst_time=1, process_size=4096 * 8)
+    mm.register_process(p0)
+    for page in (0, 1, 2, 0, 0, 1, 0):
+        mm.access_page(p0, page)
+    result = mm.access_page(p0, 5)
+    print(f"  AGING: counters={list(mm.policy.counters)} -> diusir {result['evicted_page_info']}")
+    assert result['evicted_page_info']['page_number'] == 2
+
+    # Semua policy terdaftar: access_many harus sama dengan access_page
+    rng = random.Random(21)
+    pages = [rng.randrange(10) for _ in range(800)]
+    for algorithm in ('FIFO', 'LRU', 'CLOCK', 'ENHANCED_CLOCK', 'AGING', 'NFU'):
+        outcomes = []
+        for batched in (False, True):
+            mm = MemoryManager(total_frames=4, replacement_algorithm=algorithm)
+            Process.reset_id_counter()
+            p0 = Process(burst_time=1, process_size=4096 * 10)
+            mm.register_process(p0)
+            if batched:
+                mm.access_many(p0, pages)
+            else:
+                for page in pages:
+                    mm.access_page(p0, page)
+            outcomes.append((repr(mm.statistics), list(mm.physical_memory.frames)))
+        print(f"  {algorithm:>14}: {outcomes[0][0]}")
+        assert outcomes[0] == outcomes[1], f"access_many berbeda untuk {algorithm}!"
+    print("\n✅ Verifikasi CLOCK, Enhanced CLOCK, dan Aging BERHASIL.")
+
+def test_rich_statistics():
+    print("\n=========================================")
+    print("  [TEST 9] Statistik Per Proses & Jendela Geser")
+    print("=========================================")
+
+    rng = random.Random(16)
+    for batched in (False, True):
+        Process.reset_id_counter()
+        processes = [Process(burst_time=1, process_size=4096 * 10) for _ in range(3)]
+        mm = MemoryManager(total_frames=8, replacement_algorithm='LRU')
+        for p in processes:
+            mm.register_process(p)
+
+        statuses, expected = [], {p.process_id: {"hits": 0, "faults": 0, "evictions": 0} for p in processes}
+        for _ in range(300):
+            p = rng.choice(processes)
+            pages = [rng.randrange(10) for _ in range(rng.randint(1, 20))]
+            if batched:
+                result = mm.access_many(p, pages, record_status=True)
+                batch_status = list(result["status"])
+                evicted = [owner for owner, _ in result["evictions"]]
+            else:
+                results = [mm.access_page(p, page) for page in pages]
+                batch_status = [1 if r["status"] == "HIT" else 0 for r in results]
+                evicted = [r["evicted_page_info"]["process_id"] for r in results
+                           if r["status"] == "FAULT" and r["evicted_page_info"]]
+            statuses.extend(batch_status)
+            expected[p.process_id]["hits"] += batch_status.count(1)
+            expected[p.process_id]["faults"] += batch_status.count(0)
+            for owner in evicted:
+                expected[owner]["evictions"] += 1
+
+        stats = mm.statistics
+        snapshot = stats.snapshot()
+        for process_id, counts in expected.items():
+            assert stats.get_process_stats(process_id) == counts
+        assert sum(c["hits"] for c in snapshot["per_process"].values()) == stats.hits
+        # Fault rate jendela geser = hitung ulang manual dari status per akses
+        for window_size in stats.window_sizes:
+            recent = statuses[-window_size:]
+            assert stats.get_windowed_fault_rate(window_size) == recent.count(0) / len(recent)
+        print(f"  batched={batched!s:>5}: per proses={snapshot['per_process']}, "
+              f"jendela={ {k: round(v, 3) for k, v in snapshot['windowed_fault_rates'].items()} }")
+
+        # Snapshot adalah salinan: akses berikutnya tidak mengubahnya
+        mm.access_page(processes[0], 0)
+        assert snapshot["total_accesses"] == stats.total_accesses - 1
+
+    # Histogram bucket tetap: percentile dalam toleransi lebar bucket (<= 12.5%)
+    values = [int(rng.expovariate(1 / 500)) for _ in range(20_000)]
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    values.sort()
+    for p in (50, 90, 99):
+        exact = values[max(0, -(-len(values) * p // 100) - 1)]
+        approx = histogram.percentile(p)
+        print(f"  p{p}: exact={exact}, histogram={approx}")
+        assert exact <= approx <= max(exact * 1.125, exact + 1)
+    assert histogram.max == values[-1] and histogram.count == len(values)
+    print("\n✅ Verifikasi statistik kaya BERHASIL.")
+
+
 if __name__ == "__main__":
     test_fifo_logic()
-    test_lru_logic()
\ No newline at end of file
+    test_lru_logic()
+    test_lru_matches_reference_model()
+    test_compact_frame_table_matches_dict_table()
+    test_lazy_page_tables_match_dense()
+    test_access_many_matches_access_page()
+    test_opt_logic()
+    test_clock_family_policies()
+    test_rich_statistics()
\ No newline at end of file
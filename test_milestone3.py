@@ -1,8 +1,11 @@
 # File: test_milestone3.py
-# Deskripsi: Script untuk menguji CPUScheduler dan algoritma FCFS & RR.
+# Deskripsi: Script untuk menguji CPUScheduler dan algoritma FCFS, RR, MLFQ, SJF, SRTF & PRIORITY.
+
+import random
+import time
 
 from core_models import Process
-from cpu_scheduler import CPUScheduler
+from cpu_scheduler import CPUScheduler, format_gantt
 
 def test_fcfs_scheduler():
     print("\n=========================================")
@@ -73,6 +76,281 @@ def test_rr_scheduler():
     print("\n✅ Verifikasi Round Robin BERHASIL.")
 
 
+def _run_until_done(scheduler: CPUScheduler) -> tuple[list[str], dict]:
+    """Menjalankan penjadwal detik demi detik (CPU idle jika belum ada proses yang tiba)."""
+    execution_order, completion_times = [], {}
+    while len(completion_times) < len(scheduler.processes):
+        current_p = scheduler.select_next_process()
+        execution_order.append(current_p.process_id if current_p else None)
+        if current_p:
+            current_p.burst_time_remaining -= 1
+        scheduler.tick()
+        if current_p and current_p.burst_time_remaining == 0:
+            completion_times[current_p.process_id] = scheduler.current_time
+    return execution_order, completion_times
+
+
+def test_sjf_srtf_with_arrivals():
+    print("\n=========================================")
+    print("  [TEST 3] SJF & SRTF dengan Waktu Kedatangan")
+    print("=========================================")
+
+    # Contoh klasik: (waktu_tiba, burst) = (0,8), (1,4), (2,9), (3,5)
+    expected = {
+        'SJF': {'P0': 8, 'P1': 12, 'P3': 17, 'P2': 26},
+        'SRTF': {'P1': 5, 'P3': 10, 'P0': 17, 'P2': 26},
+    }
+    for algorithm, expected_completion in expected.items():
+        Process.reset_id_counter()
+        process_list = [Process(burst_time=burst, process_size=4096, arrival_time=arrival)
+                        for arrival, burst in [(0, 8), (1, 4), (2, 9), (3, 5)]]
+        scheduler = CPUScheduler(algorithm=algorithm, process_list=process_list)
+        execution_order, completion_times = _run_until_done(scheduler)
+        print(f"  {algorithm:>4}: waktu selesai {completion_times}")
+        assert completion_times == expected_completion, f"Waktu selesai {algorithm} salah!"
+        assert list(completion_times) == list(expected_completion)
+
+    # Proses yang tiba belakangan: CPU idle sampai proses tersebut datang
+    Process.reset_id_counter()
+    late = Process(burst_time=2, process_size=4096, arrival_time=3)
+    execution_order, _ = _run_until_done(CPUScheduler(algorithm='FCFS', process_list=[late]))
+    assert execution_order == [None, None, None, 'P0', 'P0']
+    print("\n✅ Verifikasi SJF & SRTF BERHASIL.")
+
+
+def test_priority_aging():
+    print("\n=========================================")
+    print("  [TEST 4] Priority Scheduling dengan Aging")
+    print("=========================================")
+
+    def finish_rank(aging_rate: float) -> int:
+        Process.reset_id_counter()
+        # P0 berprioritas rendah, disusul aliran proses berprioritas tinggi
+        low = Process(burst_time=2, process_size=4096, priority=10)
+        stream = [Process(burst_time=2, process_size=4096, priority=0, arrival_time=2 * i) for i in range(30)]
+        scheduler = CPUScheduler(algorithm='PRIORITY', process_list=[low] + stream,
+                                 policy_options={"aging_rate": aging_rate})
+        _, completion_times = _run_until_done(scheduler)
+        return list(completion_times).index(low.process_id)
+
+    starving_rank = finish_rank(aging_rate=0)
+    aged_rank = finish_rank(aging_rate=0.5)
+    print(f"  Urutan selesai P0 tanpa aging: {starving_rank}, dengan aging: {aged_rank}")
+    assert starving_rank == 30, "Tanpa aging, proses berprioritas rendah seharusnya menunggu paling akhir"
+    assert aged_rank < 15, "Aging seharusnya mencegah starvation"
+
+    # Preemptive: proses berprioritas tinggi yang tiba langsung merebut CPU
+    Process.reset_id_counter()
+    background = Process(burst_time=5, process_size=4096, priority=5)
+    urgent = Process(burst_time=1, process_size=4096, priority=0, arrival_time=2)
+    scheduler = CPUScheduler(algorithm='PRIORITY', process_list=[background, urgent],
+                             policy_options={"aging_rate": 0, "preemptive": True})
+    execution_order, _ = _run_until_done(scheduler)
+    assert execution_order == ['P0', 'P0', 'P1', 'P0', 'P0', 'P0']
+    print("\n✅ Verifikasi Priority + Aging BERHASIL.")
+
+
+def test_heap_scheduler_scales():
+    print("\n=========================================")
+    print("  [TEST 5] SJF dengan Ribuan Proses      ")
+    print("=========================================")
+
+    Process.reset_id_counter()
+    rng = random.Random(12)
+    process_list = [Process(burst_time=rng.randint(1, 5), process_size=4096) for _ in range(5000)]
+    scheduler = CPUScheduler(algorithm='SJF', process_list=process_list)
+
+    start = time.perf_counter()
+    _, completion_times = _run_until_done(scheduler)
+    elapsed = time.perf_counter() - start
+    bursts = [process.burst_time_total for process in process_list]
+    print(f"  {len(process_list)} proses selesai dalam {scheduler.current_time} detik simulasi, "
+          f"waktu nyata={elapsed:.2f} s")
+    # Semua tiba bersamaan: SJF menjalankan proses dari burst terpendek
+    by_id = {process.process_id: process for process in process_list}
+    assert [by_id[pid].burst_time_total for pid in completion_times] == sorted(bursts)
+    assert elapsed < 10
+    print("\n✅ Verifikasi skalabilitas SJF BERHASIL.")
+
+
+def test_mlfq_scheduler():
+    print("\n=========================================")
+    print("  [TEST 6] Multi-Level Feedback Queue    ")
+    print("=========================================")
+
+    # 1. Proses CPU-bound turun level setiap kali kuantumnya habis
+    Process.reset_id_counter()
+    cpu_bound = Process(burst_time=10, process_size=4096)
+    scheduler = CPUScheduler(algorithm='MLFQ', process_list=[cpu_bound],
+                             policy_options={"quanta": (1, 2, 4)})
+    levels = []
+    while scheduler.select_next_process() is not None:
+        levels.append(scheduler.policy.level_of(cpu_bound))
+        cpu_bound.burst_time_remaining -= 1
+        scheduler.tick()
+    print("  Level per detik (CPU-bound):", levels)
+    assert levels == [0, 1, 1, 2, 2, 2, 2, 2, 2, 2]
+
+    # 2. Proses interaktif (terblokir I/O setiap 1 detik) tetap di level atas dan
+    #    merebut CPU dari proses CPU-bound saat bangun dari I/O.
+    Process.reset_id_counter()
+    cpu_bound = Process(burst_time=12, process_size=4096)
+    interactive = Process(burst_time=4, process_size=4096)
+    scheduler = CPUScheduler(algorithm='MLFQ', process_list=[cpu_bound, interactive],
+                             policy_options={"quanta": (2, 4)})
+    execution_order, waiting_io = [], []
+    while (current_p := scheduler.select_next_process()) is not None or waiting_io:
+        execution_order.append(current_p.process_id if current_p else None)
+        if current_p:
+            current_p.burst_time_remaining -= 1
+        scheduler.tick()
+        for p in waiting_io:
+            scheduler.add_process(p)
+        waiting_io = []
+        if current_p is interactive and interactive.burst_time_remaining > 0:
+            scheduler.block_current()
+            waiting_io.append(interactive)
+    print("  Urutan eksekusi:", execution_order)
+    assert scheduler.policy.level_of(interactive) == 0
+    assert execution_order[:6] == ['P0', 'P0', 'P1', 'P0', 'P1', 'P0']
+    assert execution_order.count('P1') == 4 and execution_order.count('P0') == 12
+
+    # 3. Priority boost mengembalikan semua proses ke level 0
+    Process.reset_id_counter()
+    process_list = [Process(burst_time=50, process_size=4096) for _ in range(3)]
+    scheduler = CPUScheduler(algorithm='MLFQ', process_list=process_list,
+                             policy_options={"quanta": (1, 2, 4), "boost_interval": 20})
+    for _ in range(20):
+        scheduler.select_next_process().burst_time_remaining -= 1
+        scheduler.tick()
+    assert all(scheduler.policy.level_of(p) == 2 for p in process_list)
+    scheduler.select_next_process()
+    assert scheduler.policy.boosts == 1
+    assert all(scheduler.policy.level_of(p) == 0 for p in process_list)
+
+    # 4. Boost tidak bergantung jumlah proses yang mengantri (antrian disambung, bukan disalin)
+    Process.reset_id_counter()
+    many = [Process(burst_time=1, process_size=4096) for _ in range(100_000)]
+    scheduler = CPUScheduler(algorithm='MLFQ', process_list=[])
+    policy = scheduler.policy
+    for i, p in enumerate(many):
+        policy._set_level(p, i % policy.num_levels)
+        policy.push(p, 0)
+    start = time.perf_counter()
+    policy.boost()
+    boost_time = time.perf_counter() - start
+    print(f"  Boost {len(many)} proses: {boost_time * 1e6:.1f} us")
+    assert boost_time < 0.01
+    assert len(policy) == len(many)
+    # Urutan setelah boost: level 0 lama, lalu level 1, lalu level 2
+    expected_order = [p for level in range(3) for p in many[level::3]]
+    assert [policy.pop(0) for _ in range(len(many))] == expected_order
+    print("\n✅ Verifikasi MLFQ BERHASIL.")
+
+
+def test_rr_is_single_level_mlfq():
+    print("\n=========================================")
+    print("  [TEST 7] RR = MLFQ Satu Level          ")
+    print("=========================================")
+
+    for quantum in (1, 2, 5):
+        orders = []
+        for algorithm, options in (('RR', None), ('MLFQ', {"quanta": (quantum,)})):
+            Process.reset_id_counter()
+            process_list = [Process(burst_time=burst, process_size=4096, arrival_time=arrival)
+                            for arrival, burst in [(0, 7), (1, 3), (4, 6), (4, 2)]]
+            scheduler = CPUScheduler(algorithm=algorithm, process_list=process_list,
+                                     policy_options=options, time_quantum=quantum)
+            orders.append(_run_until_done(scheduler)[0])
+        print(f"  Kuantum {quantum}: {''.join(pid[1] if pid else '-' for pid in orders[0])}")
+        assert orders[0] == orders[1]
+    print("\n✅ Verifikasi RR sebagai MLFQ satu level BERHASIL.")
+
+
+def _segments_from_ticks(execution_order: list) -> list[tuple[str, int, int]]:
+    """Mengubah urutan eksekusi per detik menjadi segmen (process_id, mulai, durasi)."""
+    segments = []
+    for second, process_id in enumerate(execution_order):
+        if process_id is None:
+            continue
+        if segments and segments[-1][0] == process_id and sum(segments[-1][1:]) == second:
+            segments[-1][2] += 1
+        else:
+            segments.append([process_id, second, 1])
+    return [tuple(segment) for segment in segments]
+
+
+def test_fast_forward_schedule():
+    print("\n=========================================")
+    print("  [TEST 8] Jadwal Fast-Forward vs Per Detik")
+    print("=========================================")
+
+    # 1. Contoh kecil dengan Gantt chart dan metrik
+    Process.reset_id_counter()
+    process_list = [Process(burst_time=burst, process_size=4096, arrival_time=arrival)
+                    for arrival, burst in [(0, 5), (1, 3), (12, 2)]]
+    schedule = CPUScheduler(algorithm='RR', process_list=process_list).compute_schedule()
+    print(format_gantt(schedule['segments']))
+    assert schedule['segments'] == [('P0', 0, 3), ('P1', 3, 3), ('P0', 6, 2), ('P2', 12, 2)]
+    assert schedule['metrics']['P0'] == {"waiting_time": 3, "turnaround_time": 8, "response_time": 0}
+    assert schedule['metrics']['P1'] == {"waiting_time": 2, "turnaround_time": 5, "response_time": 2}
+    assert schedule['idle_time'] == 4 and schedule['context_switches'] == 3
+
+    # 2. Validasi silang dengan jalur per detik pada workload acak
+    rng = random.Random(15)
+    for trial in range(20):
+        workload = [(rng.randint(0, 40), rng.randint(1, 12)) for _ in range(rng.randint(1, 12))]
+        for algorithm in ('FCFS', 'RR', 'SJF', 'SRTF', 'MLFQ'):
+            results = []
+            for fast in (False, True):
+                Process.reset_id_counter()
+                process_list = [Process(burst_time=burst, process_size=4096, arrival_time=arrival)
+                                for arrival, burst in workload]
+                scheduler = CPUScheduler(algorithm=algorithm, process_list=process_list, time_quantum=2)
+                if fast:
+                    schedule = scheduler.compute_schedule()
+                    results.append((schedule['segments'], schedule['completion_times']))
+                else:
+                    execution_order, completion_times = _run_until_done(scheduler)
+                    results.append((_segments_from_ticks(execution_order), completion_times))
+            assert results[0] == results[1], f"Jadwal {algorithm} berbeda untuk workload {workload}"
+    print("  20 workload acak x 5 algoritma: jadwal fast-forward identik dengan jalur per detik")
+
+    # 3. Burst 10^7 tanpa 10^7 pemanggilan
+    Process.reset_id_counter()
+    process_list = [Process(burst_time=10_000_000, process_size=4096, access_pattern='UNIFORM')
+                    for _ in range(3)]
+    start = time.perf_counter()
+    schedule = CPUScheduler(algorithm='FCFS', process_list=process_list).compute_schedule()
+    elapsed = time.perf_counter() - start
+    print(f"  FCFS 3 x 10^7 detik: {schedule['segments']} ({elapsed * 1000:.2f} ms)")
+    assert schedule['total_time'] == 30_000_000
+    assert schedule['average_waiting_time'] == 10_000_000
+    assert elapsed < 0.5
+
+    # 4. Proses sendirian di RR/MLFQ tidak berhenti di setiap batas kuantum
+    for algorithm in ('RR', 'MLFQ'):
+        Process.reset_id_counter()
+        process_list = [Process(burst_time=1_000_000, process_size=4096, access_pattern='UNIFORM'),
+                        Process(burst_time=5, process_size=4096, arrival_time=500_000)]
+        start = time.perf_counter()
+        scheduler = CPUScheduler(algorithm=algorithm, process_list=process_list, time_quantum=3)
+        schedule = scheduler.compute_schedule()
+        elapsed = time.perf_counter() - start
+        print(f"  {algorithm} 10^6 detik sendirian: {schedule['segments']} ({elapsed * 1000:.2f} ms)")
+        # RR menunggu batas kuantum (kelipatan 3), MLFQ langsung mempreempt dari level terendah
+        assert schedule['segments'][0] == ('P0', 0, 500_001 if algorithm == 'RR' else 500_000)
+        assert schedule['total_time'] == 1_000_005 and len(schedule['segments']) <= 5
+        assert elapsed < 0.05
+    print("\n✅ Verifikasi jadwal fast-forward BERHASIL.")
+
+
 if __name__ == "__main__":
     test_fcfs_scheduler()
-    test_rr_scheduler()
\ No newline at end of file
+    test_rr_scheduler()
+    test_sjf_srtf_with_arrivals()
+    test_priority_aging()
+    test_heap_scheduler_scales()
+    test_mlfq_scheduler()
+    test_rr_is_single_level_mlfq()
+    test_fast_forward_schedule()
\ No newline at end of file
@@ -0,0 +1,83 @@
+# File: test_milestone4.py
+# Deskripsi: Script untuk menguji analisis trace (stack distance LRU dan kurva FIFO)
+# dengan membandingkannya terhadap hasil MemoryManager.
+
+import random
+
+from core_models import Process
+from memory_manager import MemoryManager
+from trace_analysis import TraceAnalyzer
+
+
+def _build_trace(seed: int, num_processes: int, num_pages: int, length: int):
+    """Membuat trace (process_index, page_number) acak dengan sedikit lokalitas."""
+    rng = random.Random(seed)
+    trace = []
+    for _ in range(length):
+        pid = rng.randrange(num_processes)
+        # 70% akses ke 3 halaman "panas", sisanya seragam
+        page = rng.randrange(3) if rng.random() < 0.7 else rng.randrange(num_pages)
+        trace.append((pid, page))
+    return trace
+
+
+def _run_memory_manager(trace, num_processes: int, num_pages: int, frames: int, algorithm: str) -> int:
+    """Menjalankan trace di MemoryManager dan mengembalikan jumlah hit."""
+    Process.reset_id_counter()
+    mm = MemoryManager(total_frames=frames, replacement_algorithm=algorithm)
+    processes = [Process(burst_time=1, process_size=4096 * num_pages) for _ in range(num_processes)]
+    for p in processes:
+        mm.register_process(p)
+    for pid, page in trace:
+        mm.access_page(processes[pid], page)
+    return mm.statistics.hits
+
+
+def test_lru_curve_matches_memory_manager():
+    print("\n=========================================")
+    print("  [TEST 1] Kurva LRU Stack Distance      ")
+    print("=========================================")
+
+    trace = _build_trace(seed=5, num_processes=3, num_pages=10, length=2000)
+    analyzer = TraceAnalyzer(trace)
+    print(f"  {analyzer}")
+
+    max_frames = analyzer.distinct_pages + 2
+    curve_hits = analyzer.lru_hit_counts(max_frames)
+    for frames in range(1, max_frames + 1):
+        expected = _run_memory_manager(trace, 3, 10, frames, 'LRU')
+        assert curve_hits[frames] == expected, f"Hit LRU untuk {frames} frame berbeda!"
+
+    curve = analyzer.lru_hit_ratio_curve(max_frames)
+    print("  Hit ratio LRU per jumlah frame:", [f"{ratio:.2f}" for ratio in curve])
+    assert curve[0] == 0.0
+    assert all(a <= b for a, b in zip(curve, curve[1:])), "Kurva LRU harus monoton naik!"
+    assert curve[-1] == 1 - analyzer.cold_misses / len(trace)
+    print("\n✅ Verifikasi kurva LRU BERHASIL.")
+
+
+def test_fifo_ratios_match_memory_manager():
+    print("\n=========================================")
+    print("  [TEST 2] Hit Ratio FIFO                ")
+    print("=========================================")
+
+    trace = _build_trace(seed=9, num_processes=2, num_pages=8, length=1500)
+    analyzer = TraceAnalyzer(trace)
+    frame_counts = [1, 3, 5, 8, 16]
+    fifo_hits = analyzer.fifo_hit_counts(frame_counts)
+    for frames in frame_counts:
+        expected = _run_memory_manager(trace, 2, 8, frames, 'FIFO')
+        assert fifo_hits[frames] == expected, f"Hit FIFO untuk {frames} frame berbeda!"
+    print("  Hit ratio FIFO:", {k: f"{v:.2f}" for k, v in analyzer.fifo_hit_ratios(frame_counts).items()})
+
+    # Anomali Belady klasik: FIFO dengan 4 frame lebih buruk dari 3 frame
+    belady = TraceAnalyzer([1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5])
+    belady_hits = belady.fifo_hit_counts([3, 4])
+    print(f"  Anomali Belady: hit 3 frame = {belady_hits[3]}, hit 4 frame = {belady_hits[4]}")
+    assert belady_hits[4] < belady_hits[3]
+    print("\n✅ Verifikasi hit ratio FIFO BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_lru_curve_matches_memory_manager()
+    test_fifo_ratios_match_memory_manager()
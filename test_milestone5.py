@@ -0,0 +1,79 @@
+# File: test_milestone5.py
+# Deskripsi: Script untuk menguji model TLB di depan lookup page table.
+
+import random
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from tlb import TLB
+
+
+def test_tlb_consistency():
+    print("\n=========================================")
+    print("  [TEST 1] Konsistensi TLB dengan Page Table")
+    print("=========================================")
+
+    rng = random.Random(4)
+    trace = [(rng.randrange(2), rng.randrange(12)) for _ in range(3000)]
+
+    outcomes = []
+    for tlb in (None, TLB(size=8, associativity=2), TLB(size=8, replacement='RANDOM', seed=1, asid_tagging=True)):
+        Process.reset_id_counter()
+        mm = MemoryManager(total_frames=6, replacement_algorithm='LRU', tlb=tlb)
+        processes = [Process(burst_time=1, process_size=4096 * 12) for _ in range(2)]
+        for p in processes:
+            mm.register_process(p)
+        results = [mm.access_page(processes[pid], page) for pid, page in trace]
+        print(f"  {tlb}: {mm.statistics}")
+        # Hasil HIT/FAULT dan frame tidak boleh berubah karena adanya TLB
+        outcomes.append(results)
+        if tlb is not None:
+            assert mm.statistics.tlb_hits + mm.statistics.tlb_misses == len(trace)
+            assert mm.statistics.tlb_hits > 0
+
+    assert outcomes[0] == outcomes[1] == outcomes[2], "TLB mengubah hasil akses (entri basi)!"
+    print("\n✅ Verifikasi konsistensi TLB BERHASIL.")
+
+
+def _run_rr_with_tlb(time_quantum: int, asid_tagging: bool) -> MemoryManager:
+    """Menjalankan 3 proses di bawah RR sambil mengakses memori lewat TLB."""
+    Process.reset_id_counter()
+    processes = [Process(burst_time=300, process_size=4096 * 4, access_pattern='UNIFORM', seed=i)
+                 for i in range(3)]
+    mm = MemoryManager(total_frames=12, replacement_algorithm='LRU',
+                       tlb=TLB(size=16, asid_tagging=asid_tagging))
+    for p in processes:
+        mm.register_process(p)
+    scheduler = CPUScheduler(algorithm='RR', process_list=processes, time_quantum=time_quantum)
+    while (current := scheduler.select_next_process()) is not None:
+        mm.access_page(current, current.get_next_page_to_access())
+        current.burst_time_remaining -= 1
+        scheduler.tick()
+    return mm
+
+
+def test_context_switch_cost():
+    print("\n=========================================")
+    print("  [TEST 2] Pengaruh Kuantum RR terhadap TLB")
+    print("=========================================")
+
+    ratios = {}
+    for asid_tagging in (False, True):
+        for quantum in (1, 3, 20):
+            mm = _run_rr_with_tlb(quantum, asid_tagging)
+            ratios[(asid_tagging, quantum)] = mm.statistics.get_tlb_hit_ratio()
+            mode = "ASID " if asid_tagging else "flush"
+            print(f"  {mode} kuantum={quantum:>2}: TLB hit ratio={mm.statistics.get_tlb_hit_ratio():.2%}, "
+                  f"EAT={mm.statistics.get_effective_access_time():.1f} ns, flush={mm.tlb.flushes}")
+
+    # Tanpa ASID, kuantum kecil -> lebih sering flush -> hit ratio TLB lebih rendah
+    assert ratios[(False, 1)] < ratios[(False, 3)] < ratios[(False, 20)]
+    # Dengan ASID, context switch tidak membuang translasi
+    assert ratios[(True, 1)] > ratios[(False, 1)]
+    print("\n✅ Verifikasi pengaruh context switch BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_tlb_consistency()
+    test_context_switch_cost()
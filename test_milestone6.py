@@ -0,0 +1,161 @@
+# File: test_milestone6.py
+# Deskripsi: Script untuk menguji SimulationEngine (gabungan CPUScheduler dan
+# MemoryManager) dalam mode TICK dan EVENT.
+
+import time
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from simulation_engine import SimulationEngine
+
+
+def _run_simulation(mode: str, scheduler_algorithm: str, fault_latency: int,
+                    bursts=(40, 25, 60, 10), total_frames: int = 6,
+                    arrivals=None, priorities=None, policy_options=None) -> tuple[dict, MemoryManager]:
+    Process.reset_id_counter()
+    arrivals = arrivals or [0] * len(bursts)
+    priorities = priorities or [0] * len(bursts)
+    processes = [Process(burst_time=burst, process_size=4096 * 8, access_pattern='PHASE', seed=i,
+                         pattern_options={"working_set_size": 3, "phase_length": 15},
+                         arrival_time=arrivals[i], priority=priorities[i])
+                 for i, burst in enumerate(bursts)]
+    scheduler = CPUScheduler(algorithm=scheduler_algorithm, process_list=processes,
+                             policy_options=policy_options)
+    mm = MemoryManager(total_frames=total_frames, replacement_algorithm='LRU')
+    engine = SimulationEngine(scheduler, mm, fault_latency=fault_latency, mode=mode)
+    return engine.run(), mm
+
+
+def test_event_mode_matches_tick_mode():
+    print("\n=========================================")
+    print("  [TEST 1] Mode EVENT vs Mode TICK       ")
+    print("=========================================")
+
+    for scheduler_algorithm in ('FCFS', 'RR'):
+        for fault_latency in (0, 1, 5):
+            tick_results, tick_mm = _run_simulation('TICK', scheduler_algorithm, fault_latency)
+            event_results, event_mm = _run_simulation('EVENT', scheduler_algorithm, fault_latency)
+            print(f"  {scheduler_algorithm:>4} latency={fault_latency}: total={event_results['total_time']}, "
+                  f"idle={event_results['idle_time']}, {event_results['statistics']}")
+            assert tick_results.pop('statistics').snapshot() == event_results.pop('statistics').snapshot()
+            assert tick_results == event_results, "Hasil mode EVENT berbeda dari mode TICK!"
+            assert list(tick_mm.physical_memory.frames) == list(event_mm.physical_memory.frames)
+
+    # Dengan latency, CPU harus sempat idle dan proses lain mengisi waktu tunggu
+    results, _ = _run_simulation('EVENT', 'RR', fault_latency=5)
+    assert results['idle_time'] > 0
+    assert len(results['completion_times']) == 4
+    assert results['total_time'] == sum((40, 25, 60, 10)) + results['idle_time']
+    print("  Timeline RR (10 segmen pertama):", results['timeline'][:10])
+    print("\n✅ Verifikasi mode EVENT BERHASIL.")
+
+
+def test_event_mode_with_arrivals():
+    print("\n=========================================")
+    print("  [TEST 2] Mode EVENT dengan Kedatangan Proses")
+    print("=========================================")
+
+    arrivals = [0, 5, 30, 200]
+    priorities = [3, 1, 2, 0]
+    configs = [('FCFS', None), ('RR', None), ('SJF', None), ('SRTF', None),
+               ('PRIORITY', {"aging_rate": 0.2, "preemptive": True}),
+               ('MLFQ', {"quanta": (2, 5, 10), "boost_interval": 40})]
+    for scheduler_algorithm, policy_options in configs:
+        for fault_latency in (0, 4):
+            runs = [_run_simulation(mode, scheduler_algorithm, fault_latency, arrivals=arrivals,
+                                    priorities=priorities, policy_options=policy_options)[0]
+                    for mode in ('TICK', 'EVENT')]
+            print(f"  {scheduler_algorithm:>8} latency={fault_latency}: total={runs[1]['total_time']}, "
+                  f"idle={runs[1]['idle_time']}, selesai={runs[1]['completion_times']}")
+            assert runs[0].pop('statistics').snapshot() == runs[1].pop('statistics').snapshot()
+            assert runs[0] == runs[1], "Hasil mode EVENT berbeda dari mode TICK!"
+            # P3 baru tiba pada detik 200, setelah yang lain selesai: CPU sempat idle
+            assert runs[1]['idle_time'] > 0
+            assert runs[1]['timeline'][-1][0] == 'P3' and runs[1]['timeline'][-1][1] >= 200
+    print("\n✅ Verifikasi kedatangan proses BERHASIL.")
+
+
+def test_scheduler_metrics_match_fast_forward_schedule():
+    print("\n=========================================")
+    print("  [TEST 3] Metrik Penjadwal di Statistics")
+    print("=========================================")
+
+    arrivals = [0, 5, 30, 200]
+    for scheduler_algorithm in ('FCFS', 'RR', 'SRTF'):
+        results, _ = _run_simulation('EVENT', scheduler_algorithm, fault_latency=0, arrivals=arrivals)
+        snapshot = results['statistics'].snapshot()['scheduler']
+
+        Process.reset_id_counter()
+        processes = [Process(burst_time=burst, process_size=4096 * 8, access_pattern='UNIFORM', arrival_time=arrival)
+                     for burst, arrival in zip((40, 25, 60, 10), arrivals)]
+        schedule = CPUScheduler(algorithm=scheduler_algorithm, process_list=processes).compute_schedule()
+
+        print(f"  {scheduler_algorithm:>4}: context switch={snapshot['context_switches']}, "
+              f"utilisasi={snapshot['cpu_utilization']:.2%}, waiting={snapshot['waiting_time']}")
+        # Tanpa latency I/O, simulasi lengkap = jadwal murni CPU
+        assert snapshot['completed_processes'] == schedule['metrics']
+        assert snapshot['context_switches'] == schedule['context_switches']
+        assert snapshot['idle_time'] == schedule['idle_time'] == results['idle_time']
+        assert snapshot['cpu_utilization'] == results['cpu_utilization']
+        assert snapshot['waiting_time']['mean'] == schedule['average_waiting_time']
+    print("\n✅ Verifikasi metrik penjadwal BERHASIL.")
+
+
+def test_long_workload_is_fast():
+    print("\n=========================================")
+    print("  [TEST 4] Workload Panjang (1 juta detik)")
+    print("=========================================")
+
+    Process.reset_id_counter()
+    processes = [Process(burst_time=250_000, process_size=4096 * 64, access_pattern='LOOP', seed=i,
+                         page_table_mode='SPARSE', pattern_options={"loop_size": 8})
+                 for i in range(4)]
+    scheduler = CPUScheduler(algorithm='FCFS', process_list=processes)
+    mm = MemoryManager(total_frames=32, replacement_algorithm='CLOCK')
+    engine = SimulationEngine(scheduler, mm, fault_latency=50)
+
+    start = time.perf_counter()
+    results = engine.run()
+    elapsed = time.perf_counter() - start
+    print(f"  total_time={results['total_time']}, idle={results['idle_time']}, "
+          f"{results['statistics']}, waktu nyata={elapsed:.2f} s")
+    assert results['total_time'] >= 1_000_000
+    # Target < 2 s dengan margin untuk mesin CI yang lebih lambat
+    assert elapsed < 4, "Simulasi satu juta detik terlalu lambat!"
+    print("\n✅ Verifikasi workload panjang BERHASIL.")
+
+
+def test_mlfq_boost_during_io_idle():
+    print("\n=========================================")
+    print("  [TEST 5] Boost MLFQ Saat CPU Idle (I/O)")
+    print("=========================================")
+
+    # P2 sendirian lalu terblokir page fault; boost t=20 jatuh di celah idle itu,
+    # sebelum P0 tiba dan P2 bangun. Mode EVENT tidak boleh melompati boost.
+    def run(mode: str) -> dict:
+        Process.reset_id_counter()
+        specs = [(36, 4, 'LOOP', 3, 21), (23, 24, 'PHASE', 92, 28), (33, 22, 'PHASE', 35, 3)]
+        processes = [Process(burst_time=burst, process_size=4096 * pages, access_pattern=pattern, seed=seed,
+                             arrival_time=arrival)
+                     for burst, pages, pattern, seed, arrival in specs]
+        scheduler = CPUScheduler('MLFQ', processes, policy_options={"quanta": (1, 2, 4), "boost_interval": 10})
+        mm = MemoryManager(total_frames=6, replacement_algorithm='LRU')
+        results = SimulationEngine(scheduler, mm, fault_latency=5, mode=mode).run()
+        results['boosts'] = scheduler.policy.boosts
+        return results
+
+    tick_results, event_results = run('TICK'), run('EVENT')
+    print(f"  boost: TICK={tick_results['boosts']}, EVENT={event_results['boosts']}")
+    print("  Timeline EVENT (6 segmen pertama):", event_results['timeline'][:6])
+    assert tick_results.pop('statistics').snapshot() == event_results.pop('statistics').snapshot()
+    assert tick_results == event_results, "Boost MLFQ terlewat pada mode EVENT!"
+    print("\n✅ Verifikasi boost MLFQ saat idle BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_event_mode_matches_tick_mode()
+    test_event_mode_with_arrivals()
+    test_scheduler_metrics_match_fast_forward_schedule()
+    test_long_workload_is_fast()
+    test_mlfq_boost_during_io_idle()
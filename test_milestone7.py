@@ -0,0 +1,150 @@
+# File: test_milestone7.py
+# Deskripsi: Script untuk menguji penjadwalan multi-core (MultiCoreScheduler)
+# dan MultiCoreSimulationEngine: work stealing, affinity, migrasi, dan TLB per core.
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from simulation_engine import MultiCoreSimulationEngine, SimulationEngine
+from smp_scheduler import MultiCoreScheduler
+from tlb import TLB
+
+
+def _make_processes(bursts, access_pattern='PHASE', num_pages=8) -> list[Process]:
+    Process.reset_id_counter()
+    return [Process(burst_time=burst, process_size=4096 * num_pages, access_pattern=access_pattern, seed=i,
+                    pattern_options={"working_set_size": 3, "phase_length": 15} if access_pattern == 'PHASE' else None)
+            for i, burst in enumerate(bursts)]
+
+
+def test_single_core_matches_uniprocessor():
+    print("\n=========================================")
+    print("  [TEST 1] 1 Core = Uniprocessor         ")
+    print("=========================================")
+
+    bursts = (40, 25, 60, 10)
+    for algorithm in ('FCFS', 'RR', 'SJF'):
+        processes = _make_processes(bursts)
+        mm = MemoryManager(total_frames=6, replacement_algorithm='LRU')
+        single = SimulationEngine(CPUScheduler(algorithm, processes), mm, fault_latency=3, mode='TICK').run()
+
+        processes = _make_processes(bursts)
+        mm = MemoryManager(total_frames=6, replacement_algorithm='LRU')
+        multi = MultiCoreSimulationEngine(MultiCoreScheduler(algorithm, processes, num_cores=1), mm,
+                                          fault_latency=3).run()
+        print(f"  {algorithm:>4}: total={multi['total_time']}, selesai={multi['completion_times']}")
+        assert repr(single['statistics']) == repr(multi['statistics'])
+        assert single['completion_times'] == multi['completion_times']
+        assert single['timeline'] == multi['core_timelines'][0]
+        assert multi['migrations'] == 0 and multi['steals'] == 0
+    print("\n✅ Verifikasi 1 core BERHASIL.")
+
+
+def test_work_stealing_balances_load():
+    print("\n=========================================")
+    print("  [TEST 2] Work Stealing Antar Core      ")
+    print("=========================================")
+
+    # Penempatan awal: core 0 mendapat semua proses panjang, core 1 semua proses pendek
+    bursts = (10, 1, 10, 1, 10, 1)
+    results = {}
+    for work_stealing in (False, True):
+        processes = _make_processes(bursts)
+        scheduler = MultiCoreScheduler('FCFS', processes, num_cores=2, work_stealing=work_stealing)
+        engine = MultiCoreSimulationEngine(scheduler, MemoryManager(total_frames=8, replacement_algorithm='LRU'))
+        results[work_stealing] = engine.run()
+        r = results[work_stealing]
+        print(f"  stealing={work_stealing!s:>5}: total={r['total_time']}, utilisasi core="
+              f"{[f'{u:.0%}' for u in r['core_utilization']]}, steals={r['steals']}, migrasi={r['migrations']}")
+
+    assert results[False]['total_time'] == 30 and results[False]['steals'] == 0
+    assert results[True]['steals'] > 0
+    assert results[True]['total_time'] < results[False]['total_time']
+    assert min(results[True]['core_utilization']) > min(results[False]['core_utilization'])
+    for r in results.values():
+        assert len(r['completion_times']) == len(bursts)
+        assert sum(d for timeline in r['core_timelines'] for _, _, d in timeline) == sum(bursts)
+    print("\n✅ Verifikasi work stealing BERHASIL.")
+
+
+def test_hard_affinity():
+    print("\n=========================================")
+    print("  [TEST 3] Hard Affinity                 ")
+    print("=========================================")
+
+    processes = _make_processes((20, 20, 20, 5, 5, 5))
+    affinity = {"P0": [2], "P1": [2], "P2": [0, 1]}
+    scheduler = MultiCoreScheduler('RR', processes, num_cores=3, affinity=affinity)
+    results = MultiCoreSimulationEngine(scheduler, MemoryManager(total_frames=12, replacement_algorithm='LRU'),
+                                        fault_latency=2).run()
+    for core_id, timeline in enumerate(results['core_timelines']):
+        print(f"  Core {core_id}: {timeline}")
+        for process_id, _, _ in timeline:
+            assert core_id in affinity.get(process_id, range(3)), f"{process_id} berjalan di core terlarang!"
+    assert len(results['completion_times']) == 6
+    print("\n✅ Verifikasi affinity BERHASIL.")
+
+
+def test_mlfq_steal_keeps_level():
+    print("\n=========================================")
+    print("  [TEST 4] Work Stealing MLFQ            ")
+    print("=========================================")
+
+    processes = _make_processes((40, 40, 40))
+    scheduler = MultiCoreScheduler('MLFQ', [], num_cores=2)
+    victim, thief = scheduler.cores
+    # Semua proses sudah turun ke level terendah di core 0
+    for process in processes:
+        victim.policy._set_level(process, 2)
+        victim.add_process(process)
+
+    running = scheduler.select_next_processes()
+    stolen = running[1]
+    print(f"  Core 1 mencuri {stolen.process_id}: level={thief.policy.level_of(stolen)}, "
+          f"kuantum={thief.quantum_counter}")
+    assert scheduler.steals == 1 and stolen is processes[-1]
+    # Level dibawa ke core pencuri (bukan naik ke level 0) dan tidak tertinggal di core asal
+    assert thief.policy.level_of(stolen) == 2 and thief.quantum_counter == 12
+    assert stolen not in victim.policy._levels
+    assert victim.policy.level_of(running[0]) == 2
+    print("\n✅ Verifikasi work stealing MLFQ BERHASIL.")
+
+
+def test_migrations_and_per_core_tlb():
+    print("\n=========================================")
+    print("  [TEST 5] Migrasi vs TLB per Core       ")
+    print("=========================================")
+
+    results = {}
+    for soft_affinity in (True, False):
+        processes = _make_processes([400] * 6)
+        mm = MemoryManager(total_frames=24, replacement_algorithm='LRU')
+        mm.attach_cpu_tlbs([TLB(size=16, asid_tagging=True) for _ in range(4)])
+        scheduler = MultiCoreScheduler('RR', processes, num_cores=4, soft_affinity=soft_affinity)
+        r = MultiCoreSimulationEngine(scheduler, mm, fault_latency=4).run()
+        results[soft_affinity] = r
+        print(f"  soft_affinity={soft_affinity!s:>5}: total={r['total_time']}, migrasi={r['migrations']}, "
+              f"steals={r['steals']}, TLB hit ratio={r['statistics'].get_tlb_hit_ratio():.2%}")
+
+    # Tanpa soft affinity proses lebih sering berpindah core dan TLB-nya lebih "dingin"
+    assert results[False]['migrations'] > results[True]['migrations']
+    assert results[True]['statistics'].get_tlb_hit_ratio() > results[False]['statistics'].get_tlb_hit_ratio()
+
+    # Lebih banyak core -> throughput lebih tinggi untuk workload yang sama
+    totals = {}
+    for num_cores in (1, 2, 4):
+        processes = _make_processes([200] * 8)
+        scheduler = MultiCoreScheduler('RR', processes, num_cores=num_cores)
+        totals[num_cores] = MultiCoreSimulationEngine(
+            scheduler, MemoryManager(total_frames=32, replacement_algorithm='LRU'), fault_latency=2).run()['total_time']
+    print("  Total waktu per jumlah core:", totals)
+    assert totals[1] > totals[2] > totals[4]
+    print("\n✅ Verifikasi migrasi & TLB per core BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_single_core_matches_uniprocessor()
+    test_work_stealing_balances_load()
+    test_hard_affinity()
+    test_mlfq_steal_keeps_level()
+    test_migrations_and_per_core_tlb()
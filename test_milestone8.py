@@ -0,0 +1,155 @@
+# File: test_milestone8.py
+# Deskripsi: Script untuk menguji WorkingSetTracker, PFFController (deteksi
+# thrashing dan load control), serta suspend/resume pada CPUScheduler.
+
+import random
+
+from benchmark import compare_load_control
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from simulation_engine import SimulationEngine
+from working_set import PFFController, WorkingSetTracker
+
+
+def test_working_set_tracker_matches_brute_force():
+    print("\n=========================================")
+    print("  [TEST 1] Working Set Inkremental       ")
+    print("=========================================")
+
+    rng = random.Random(17)
+    window = 25
+    tracker = WorkingSetTracker(window)
+    history = {"P0": [], "P1": []}
+    for step in range(5000):
+        process_id = rng.choice(["P0", "P1"])
+        # Lokalitas bergeser setiap 500 langkah
+        page = rng.randrange(12) + (step // 500) * 3
+        tracker.record(process_id, page)
+        history[process_id].append(page)
+        expected = set(history[process_id][-window:])
+        assert tracker.working_set(process_id) == expected
+        assert tracker.total_size == sum(len(set(h[-window:])) for h in history.values())
+
+    print(f"  W(t, {window}): P0={tracker.size('P0')} halaman, P1={tracker.size('P1')} halaman, "
+          f"total={tracker.total_size}")
+    tracker.remove("P0")
+    assert tracker.total_size == tracker.size("P1")
+    print("\n✅ Verifikasi working set BERHASIL.")
+
+
+def test_scheduler_suspend_resume():
+    print("\n=========================================")
+    print("  [TEST 2] Suspend & Resume Penjadwal    ")
+    print("=========================================")
+
+    Process.reset_id_counter()
+    p0, p1, p2 = [Process(burst_time=4, process_size=4096) for _ in range(3)]
+    scheduler = CPUScheduler(algorithm='RR', process_list=[p0, p1, p2], time_quantum=2)
+
+    execution_order = []
+    for second in range(12):
+        if second == 1:
+            scheduler.suspend(p1)  # Masih di antrian siap
+        if second == 5:
+            scheduler.resume(p1)
+        current_p = scheduler.select_next_process()
+        if current_p is None:
+            break
+        execution_order.append(current_p.process_id)
+        current_p.burst_time_remaining -= 1
+        scheduler.tick()
+    print("  Urutan eksekusi:", execution_order)
+    assert execution_order == ['P0', 'P0', 'P2', 'P2', 'P0', 'P0', 'P2', 'P2', 'P1', 'P1', 'P1', 'P1']
+    assert not scheduler.suspended
+
+    # Menyuspend proses yang sedang berjalan langsung mengeluarkannya dari CPU
+    Process.reset_id_counter()
+    p0, p1 = [Process(burst_time=3, process_size=4096) for _ in range(2)]
+    scheduler = CPUScheduler(algorithm='FCFS', process_list=[p0, p1])
+    assert scheduler.select_next_process() is p0
+    scheduler.suspend(p0)
+    assert p0.status == 'suspended'
+    assert scheduler.select_next_process() is p1
+    scheduler.resume(p0)
+    p1.burst_time_remaining = 0
+    assert scheduler.select_next_process() is p0
+    print("\n✅ Verifikasi suspend/resume BERHASIL.")
+
+
+def _run_overcommitted(mode: str, load_control: bool) -> dict:
+    Process.reset_id_counter()
+    processes = [Process(burst_time=1500, process_size=4096 * 64, access_pattern='LOOP', seed=i,
+                         pattern_options={"loop_size": 8})
+                 for i in range(6)]
+    scheduler = CPUScheduler(algorithm='RR', process_list=processes)
+    mm = MemoryManager(total_frames=24, replacement_algorithm='LRU')
+    controller = PFFController(scheduler, mm, window=50, check_interval=50, load_control=load_control)
+    return SimulationEngine(scheduler, mm, fault_latency=10, mode=mode, load_controller=controller).run()
+
+
+def test_thrashing_detection_and_load_control():
+    print("\n=========================================")
+    print("  [TEST 3] Thrashing & Load Control PFF  ")
+    print("=========================================")
+
+    uncontrolled = _run_overcommitted('EVENT', load_control=False)
+    controlled = _run_overcommitted('EVENT', load_control=True)
+    for label, results in (("tanpa", uncontrolled), ("dengan", controlled)):
+        report = results['load_control']
+        print(f"  {label:>6} load control: total={results['total_time']}, {results['statistics']}, "
+              f"episode={report['thrashing_episodes']}, suspend={report['suspensions']}")
+
+    # Total working set 6 x 8 = 48 halaman > 24 frame: thrashing terdeteksi
+    assert uncontrolled['load_control']['thrashing_episodes']
+    assert uncontrolled['load_control']['suspensions'] == 0
+    assert uncontrolled['statistics'].get_hit_ratio() < 0.1
+    # Load control menyuspend proses sampai working set muat, lalu me-resume-nya
+    assert controlled['load_control']['suspensions'] > 0
+    assert controlled['load_control']['resumptions'] == controlled['load_control']['suspensions']
+    assert controlled['statistics'].get_hit_ratio() > 0.9
+    assert controlled['total_time'] < uncontrolled['total_time']
+    assert len(controlled['completion_times']) == 6
+    assert all(episode['end'] is not None for episode in controlled['load_control']['thrashing_episodes'])
+
+    # Mode TICK dan EVENT tetap identik dengan load controller
+    tick = _run_overcommitted('TICK', load_control=True)
+    assert tick.pop('statistics').snapshot() == controlled.pop('statistics').snapshot()
+    assert tick == controlled
+
+    comparison = compare_load_control()
+    print(f"  Throughput dipulihkan oleh load control: {comparison['recovered_throughput']:.2f}x")
+    assert comparison['recovered_throughput'] > 1.5
+    print("\n✅ Verifikasi load control BERHASIL.")
+
+
+def test_pff_allocations_drive_local_quotas():
+    print("\n=========================================")
+    print("  [TEST 4] Alokasi PFF = Kuota Lokal     ")
+    print("=========================================")
+
+    Process.reset_id_counter()
+    processes = [Process(burst_time=2000, process_size=4096 * 64, access_pattern='LOOP', seed=0,
+                         pattern_options={"loop_size": 4}),
+                 Process(burst_time=2000, process_size=4096 * 64, access_pattern='UNIFORM', seed=1)]
+    scheduler = CPUScheduler(algorithm='RR', process_list=processes)
+    mm = MemoryManager(total_frames=24, replacement_algorithm='LRU', replacement_scope='LOCAL')
+    controller = PFFController(scheduler, mm, window=50, check_interval=50, load_control=False)
+    engine = SimulationEngine(scheduler, mm, fault_latency=2, load_controller=controller)
+    engine.run(max_time=1000)
+
+    mm._rebalance_quotas()
+    print(f"  Alokasi PFF: {controller.allocations}, kuota lokal: {mm.frame_quotas}, "
+          f"resident: { {pid: len(frames) for pid, frames in mm.resident_frames.items()} }")
+    # Proses dengan fault rate tinggi mendapat frame lebih banyak, yang rendah dikurangi
+    assert controller.allocations["P1"] > 12 > controller.allocations["P0"]
+    assert mm.frame_quotas == {pid: controller.allocations[pid] for pid in mm.frame_quotas}
+    assert len(mm.resident_set("P1")) > len(mm.resident_set("P0"))
+    print("\n✅ Verifikasi alokasi PFF BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_working_set_tracker_matches_brute_force()
+    test_scheduler_suspend_resume()
+    test_thrashing_detection_and_load_control()
+    test_pff_allocations_drive_local_quotas()
@@ -0,0 +1,190 @@
+# File: test_milestone9.py
+# Deskripsi: Script untuk menguji indeks resident set per proses, pembebasan
+# frame secara bulk saat proses selesai, dan replacement lokal dengan kuota frame.
+
+import random
+import time
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+from replacement_policies import REPLACEMENT_POLICIES
+from simulation_engine import SimulationEngine
+from tlb import TLB
+
+
+def _make_processes(sizes, burst_time=50, access_pattern='UNIFORM') -> list[Process]:
+    Process.reset_id_counter()
+    return [Process(burst_time=burst_time, process_size=4096 * num_pages, access_pattern=access_pattern, seed=i)
+            for i, num_pages in enumerate(sizes)]
+
+
+def test_bulk_release_on_exit():
+    print("\n=========================================")
+    print("  [TEST 1] Pembebasan Frame Secara Bulk  ")
+    print("=========================================")
+
+    for algorithm in [name for name in REPLACEMENT_POLICIES if name != 'OPT']:
+        p0, p1 = _make_processes((10, 10))
+        tlb = TLB(size=16, asid_tagging=True)
+        mm = MemoryManager(total_frames=8, replacement_algorithm=algorithm, tlb=tlb)
+        mm.register_process(p0)
+        mm.register_process(p1)
+        rng = random.Random(3)
+        for _ in range(200):
+            process = rng.choice((p0, p1))
+            mm.access_page(process, rng.randrange(10), is_write=rng.random() < 0.3)
+
+        resident = mm.resident_set("P0")
+        # Indeks resident set sama dengan isi tabel frame
+        assert resident == {i for i, frame in enumerate(mm.physical_memory.frames)
+                            if frame is not None and frame["process_id"] == "P0"}
+        assert mm.release_process(p0) == len(resident)
+        assert mm.physical_memory.filled_count == 8 - len(resident)
+        assert all(entry[1] == 0 for entry in p0.page_table.values())
+        assert mm.resident_set("P0") == set() and "P0" not in mm.processes
+
+        # Frame yang dibebaskan dipakai ulang tanpa eviksi, dan policy tidak lagi memilihnya sebagai korban
+        evictions = sum(mm.access_page(p1, page).get("evicted_page_info") is not None for page in range(10))
+        assert evictions == 10 - 8
+        assert mm.resident_set("P1") == set(range(8))
+        assert all(tlb.lookup("P0", page) is None for page in range(10))
+        print(f"  {algorithm:>14}: {len(resident)} frame P0 dibebaskan, P1 menempati {len(mm.resident_set('P1'))} frame")
+
+    # FIFO: antrian tidak lagi berisi frame yang dibebaskan
+    p0, p1 = _make_processes((4, 4))
+    mm = MemoryManager(total_frames=6, replacement_algorithm='FIFO')
+    for page in range(3):
+        mm.access_page(p0, page)
+        mm.access_page(p1, page)
+    mm.release_process(p0)
+    assert list(mm.fifo_queue) == [1, 3, 5]
+    print("\n✅ Verifikasi pembebasan frame BERHASIL.")
+
+
+def test_local_replacement_quotas():
+    print("\n=========================================")
+    print("  [TEST 2] Replacement Lokal & Kuota     ")
+    print("=========================================")
+
+    processes = _make_processes((30, 10, 20))
+    mm = MemoryManager(total_frames=12, replacement_algorithm='LRU', replacement_scope='LOCAL',
+                       frame_allocation='PROPORTIONAL')
+    for process in processes:
+        mm.register_process(process)
+        mm.access_page(process, 0)
+    print("  Kuota proporsional:", mm.frame_quotas)
+    assert mm.frame_quotas == {"P0": 6, "P1": 2, "P2": 4}
+
+    for algorithm in REPLACEMENT_POLICIES:
+        processes = _make_processes((30, 10, 20), burst_time=300)
+        trace = []
+        for step in range(300):
+            for process in processes:
+                trace.append((process.process_id, process.get_next_page_to_access()))
+        mm = MemoryManager(total_frames=12, replacement_algorithm=algorithm, replacement_scope='LOCAL',
+                           reference_trace=trace)
+        for process in processes:
+            mm.register_process(process)
+        for process_id, page in trace:
+            result = mm.access_page(processes[int(process_id[1:])], page)
+            evicted = result.get("evicted_page_info")
+            # Kuota rata 4 frame: setelah memori penuh, setiap proses hanya mengganti halamannya sendiri
+            if evicted is not None:
+                assert evicted["process_id"] == process_id
+            assert len(mm.resident_set(process_id)) <= 4
+        assert mm.frame_quotas == {"P0": 4, "P1": 4, "P2": 4}
+        print(f"  {algorithm:>14}: resident set {[len(mm.resident_set(p.process_id)) for p in processes]}")
+
+    # Proses yang selesai menyerahkan kuotanya: proses lain tumbuh ke frame yang kosong
+    mm.release_process(processes[0])
+    for page in range(20):
+        mm.access_page(processes[2], page)
+    assert mm.frame_quotas == {"P1": 6, "P2": 6}
+    assert len(mm.resident_set("P2")) == 6
+    print("\n✅ Verifikasi replacement lokal BERHASIL.")
+
+
+def _run_short_lived_mix(reclaim_on_exit: bool | None, mode: str = 'EVENT', replacement_scope: str = 'GLOBAL') -> dict:
+    # Satu proses panjang dengan working set 12 halaman dan banyak proses pendek
+    Process.reset_id_counter()
+    processes = [Process(burst_time=1200, process_size=4096 * 12, access_pattern='LOOP', seed=0,
+                         pattern_options={"loop_size": 12})]
+    processes += [Process(burst_time=30, process_size=4096 * 8, access_pattern='UNIFORM', seed=i,
+                          arrival_time=i * 40)
+                  for i in range(1, 25)]
+    scheduler = CPUScheduler(algorithm='RR', process_list=processes)
+    mm = MemoryManager(total_frames=16, replacement_algorithm='FIFO', replacement_scope=replacement_scope)
+    if reclaim_on_exit is None:  # Default SimulationEngine
+        return SimulationEngine(scheduler, mm, fault_latency=2, mode=mode).run()
+    return SimulationEngine(scheduler, mm, fault_latency=2, mode=mode, reclaim_on_exit=reclaim_on_exit).run()
+
+
+def test_reclaim_reduces_faults():
+    print("\n=========================================")
+    print("  [TEST 3] Reclaim vs Frame Tertinggal   ")
+    print("=========================================")
+
+    lingering = _run_short_lived_mix(reclaim_on_exit=False)
+    reclaimed = _run_short_lived_mix(reclaim_on_exit=True)
+    local = _run_short_lived_mix(reclaim_on_exit=True, replacement_scope='LOCAL')
+    for label, results in (("tertinggal", lingering), ("reclaim", reclaimed), ("lokal", local)):
+        stats = results['statistics']
+        print(f"  {label:>10}: total={results['total_time']}, fault={stats.page_faults}, "
+              f"hit ratio={stats.get_hit_ratio():.2%}, P0={stats.get_process_stats('P0')}")
+    assert reclaimed['statistics'].page_faults < lingering['statistics'].page_faults
+    assert reclaimed['total_time'] <= lingering['total_time']
+    assert local['statistics'].page_faults < lingering['statistics'].page_faults
+    assert len(local['completion_times']) == 25
+    # Reclaim harus diminta eksplisit: default engine tetap membiarkan frame tertinggal
+    default = _run_short_lived_mix(reclaim_on_exit=None)
+    assert default.pop('statistics').snapshot() == lingering['statistics'].snapshot()
+    assert default == {key: value for key, value in lingering.items() if key != 'statistics'}
+
+    # Mode TICK dan EVENT tetap identik, juga dengan replacement lokal
+    for scope in ('GLOBAL', 'LOCAL'):
+        event = _run_short_lived_mix(True, 'EVENT', scope)
+        tick = _run_short_lived_mix(True, 'TICK', scope)
+        assert tick.pop('statistics').snapshot() == event.pop('statistics').snapshot()
+        assert tick == event
+    print("\n✅ Verifikasi reclaim BERHASIL.")
+
+
+def test_local_victim_selection_scales():
+    print("\n=========================================")
+    print("  [TEST 4] Korban Lokal Tanpa Memindai   ")
+    print("=========================================")
+
+    # Satu proses diam memegang separuh frame, proses lain terus mengalami fault.
+    # Korban lokal dipilih dari struktur per proses, jadi biaya fault tidak
+    # bergantung pada frame milik proses yang diam.
+    total_frames = 4096
+    for algorithm in REPLACEMENT_POLICIES:
+        elapsed = {}
+        for scope in ('GLOBAL', 'LOCAL'):
+            idle, streaming = _make_processes((total_frames, 4 * total_frames))
+            trace = [(idle.process_id, page) for page in range(total_frames // 2)]
+            trace += [(streaming.process_id, page % (4 * total_frames))
+                      for page in range(total_frames // 2, total_frames // 2 + 10000)]
+            mm = MemoryManager(total_frames=total_frames, replacement_algorithm=algorithm,
+                               replacement_scope=scope, reference_trace=trace)
+            mm.register_process(idle)
+            mm.register_process(streaming)
+            for process_id, page in trace[:total_frames // 2]:
+                mm.access(idle, page)
+            start = time.perf_counter()
+            for process_id, page in trace[total_frames // 2:]:
+                mm.access(streaming, page)
+            elapsed[scope] = time.perf_counter() - start
+            if scope == 'LOCAL':
+                assert len(mm.resident_set(idle.process_id)) == total_frames // 2
+        print(f"  {algorithm:>14}: GLOBAL {elapsed['GLOBAL'] * 1000:6.1f} ms, LOCAL {elapsed['LOCAL'] * 1000:6.1f} ms")
+        assert elapsed['LOCAL'] < 4 * elapsed['GLOBAL'] + 0.05
+    print("\n✅ Verifikasi biaya korban lokal BERHASIL.")
+
+
+if __name__ == "__main__":
+    test_bulk_release_on_exit()
+    test_local_replacement_quotas()
+    test_reclaim_reduces_faults()
+    test_local_victim_selection_scales()
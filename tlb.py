@@ -0,0 +1,102 @@
+# File: tlb.py
+# Deskripsi: Model Translation Lookaside Buffer (TLB) yang diletakkan di depan
+# lookup page table pada MemoryManager.
+# Mendukung ukuran dan asosiativitas yang bisa diatur, replacement LRU/RANDOM,
+# serta mode flush saat context switch atau penandaan ASID.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import random
+from collections import OrderedDict
+
+
+class TLB:
+    """
+    TLB set-associative. Setiap set adalah OrderedDict {kunci: nomor_frame}
+    yang diurutkan dari entri paling lama hingga paling baru dipakai.
+
+    Tanpa ASID, entri hanya berlaku untuk proses yang sedang berjalan sehingga
+    seluruh TLB di-flush setiap context switch. Dengan ASID, kunci entri
+    menyertakan process_id dan TLB tidak perlu di-flush.
+    """
+    def __init__(self, size: int = 64, associativity: int | None = None,
+                 replacement: str = 'LRU', asid_tagging: bool = False, seed: int | None = None):
+        """
+        Args:
+            size (int): Jumlah total entri TLB.
+            associativity (int | None): Jumlah entri per set. None = fully associative.
+            replacement (str): 'LRU' atau 'RANDOM'.
+            asid_tagging (bool): True = entri ditandai ASID (tanpa flush saat context switch).
+            seed (int | None): Seed untuk replacement RANDOM.
+        """
+        if replacement.upper() not in ['LRU', 'RANDOM']:
+            raise ValueError("Replacement TLB harus 'LRU' atau 'RANDOM'")
+        associativity = associativity or size
+        if size <= 0 or size % associativity != 0:
+            raise ValueError("Ukuran TLB harus kelipatan positif dari asosiativitas")
+
+        self.size = size
+        self.associativity = associativity
+        self.num_sets = size // associativity
+        self.replacement = replacement.upper()
+        self.asid_tagging = asid_tagging
+        self._sets = [OrderedDict() for _ in range(self.num_sets)]
+        self._rng = random.Random(seed)
+
+        # ASID (process_id) dari proses yang sedang memakai TLB
+        self.current_asid = None
+        self.context_switches = 0
+        self.flushes = 0
+
+    def _key(self, process_id: str, page_number: int):
+        return (process_id, page_number) if self.asid_tagging else page_number
+
+    def switch_context(self, process_id: str):
+        """Dipanggil saat proses yang berjalan berganti."""
+        if process_id == self.current_asid:
+            return
+        if self.current_asid is not None:
+            self.context_switches += 1
+            if not self.asid_tagging:
+                self.flush()
+        self.current_asid = process_id
+
+    def lookup(self, process_id: str, page_number: int) -> int | None:
+        """Mencari translasi halaman. Mengembalikan nomor frame atau None (TLB miss)."""
+        tlb_set = self._sets[page_number % self.num_sets]
+        key = self._key(process_id, page_number)
+        frame_number = tlb_set.get(key)
+        if frame_number is not None and self.replacement == 'LRU':
+            tlb_set.move_to_end(key)
+        return frame_number
+
+    def insert(self, process_id: str, page_number: int, frame_number: int):
+        """Menyimpan translasi baru, mengusir entri lain jika set sudah penuh."""
+        tlb_set = self._sets[page_number % self.num_sets]
+        key = self._key(process_id, page_number)
+        if key not in tlb_set and len(tlb_set) >= self.associativity:
+            if self.replacement == 'LRU':
+                tlb_set.popitem(last=False)
+            else:
+                del tlb_set[self._rng.choice(list(tlb_set))]
+        tlb_set[key] = frame_number
+
+    def invalidate(self, process_id: str, page_number: int):
+        """Menghapus translasi sebuah halaman (dipanggil saat halaman diusir)."""
+        if not self.asid_tagging and process_id != self.current_asid:
+            # Entri proses lain sudah hilang saat flush context switch
+            return
+        self._sets[page_number % self.num_sets].pop(self._key(process_id, page_number), None)
+
+    def flush(self):
+        """Mengosongkan seluruh TLB."""
+        for tlb_set in self._sets:
+            tlb_set.clear()
+        self.flushes += 1
+
+    def __len__(self) -> int:
+        return sum(len(tlb_set) for tlb_set in self._sets)
+
+    def __repr__(self) -> str:
+        mode = "ASID" if self.asid_tagging else "flush"
+        return (f"TLB(size={self.size}, ways={self.associativity}, sets={self.num_sets}, "
+                f"replacement={self.replacement}, mode={mode}, entries={len(self)})")
@@ -0,0 +1,181 @@
+# File: trace_analysis.py
+# Deskripsi: Analisis offline trace akses memori.
+# Menghitung kurva hit ratio LRU untuk SEMUA ukuran memori sekaligus dalam satu
+# lintasan trace (algoritma stack distance Mattson), serta hit ratio FIFO
+# untuk ukuran-ukuran tertentu.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+from array import array
+from collections import deque
+
+
+def build_next_use_index(trace) -> array:
+    """
+    Membangun indeks "next use": elemen ke-t adalah posisi akses berikutnya
+    ke kunci yang sama dengan trace[t], atau len(trace) jika tidak pernah
+    diakses lagi. Dihitung dalam satu lintasan mundur (O(n)).
+    """
+    trace = trace if isinstance(trace, list) else list(trace)
+    never = len(trace)
+    next_use = array('q', [never]) * len(trace)
+    upcoming = {}
+    for time in range(len(trace) - 1, -1, -1):
+        key = trace[time]
+        next_use[time] = upcoming.get(key, never)
+        upcoming[key] = time
+    return next_use
+
+
+def reference_trace_from_schedule(processes, execution_order) -> list[tuple[str, int]]:
+    """
+    Menyusun trace global (process_id, page_number) dari urutan eksekusi CPU.
+
+    Setiap elemen `execution_order` adalah process_id yang berjalan pada satu
+    detik simulasi, dan setiap detik proses tersebut mengakses halaman
+    berikutnya dari `page_access_sequence`-nya. Trace ini dipakai algoritma OPT
+    ketika beberapa proses berjalan bergantian di bawah CPUScheduler.
+    Urutan akses proses dibaca ulang tanpa mengubah state proses.
+    """
+    sequences = {p.process_id: iter(p.page_access_sequence) for p in processes}
+    return [(process_id, next(sequences[process_id])) for process_id in execution_order]
+
+
+class _FenwickTree:
+    """Binary Indexed Tree untuk prefix sum dengan update dan query O(log n)."""
+    def __init__(self, size: int):
+        self._size = size
+        self._tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int):
+        """Menambahkan delta pada posisi `index` (0-based)."""
+        tree = self._tree
+        index += 1
+        while index <= self._size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """Jumlah nilai pada posisi 0..index (inklusif)."""
+        tree = self._tree
+        total = 0
+        index += 1
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+
+class TraceAnalyzer:
+    """
+    Menganalisis sebuah trace akses memori.
+
+    Trace berisi kunci halaman, biasanya tuple (process_id, page_number) agar
+    halaman dari proses berbeda dibedakan (sama seperti replacement global pada
+    MemoryManager). Untuk trace satu proses, nomor halaman saja juga cukup.
+    """
+    def __init__(self, trace):
+        """
+        Args:
+            trace (Iterable): Urutan kunci halaman yang diakses.
+        """
+        self.trace = list(trace)
+        # histogram[d] = jumlah akses dengan stack distance d (1 = paling baru dipakai)
+        self.stack_distance_histogram = [0]
+        # Akses pertama ke sebuah halaman (jarak tak hingga)
+        self.cold_misses = 0
+        self._compute_stack_distances()
+
+    def _compute_stack_distances(self):
+        """
+        Menghitung stack distance setiap akses dengan algoritma Mattson.
+
+        Alih-alih memelihara stack LRU secara eksplisit (O(n) per akses), setiap
+        halaman ditandai pada posisi waktu akses terakhirnya di Fenwick tree.
+        Jumlah penanda setelah akses sebelumnya dari halaman yang sama adalah
+        jumlah halaman berbeda yang diakses di antaranya, sehingga biaya per
+        akses menjadi O(log n).
+        """
+        last_access = {}
+        markers = _FenwickTree(len(self.trace))
+        histogram = [0] * (len(self.trace) + 1)
+
+        for time, key in enumerate(self.trace):
+            previous = last_access.get(key)
+            if previous is None:
+                self.cold_misses += 1
+            else:
+                # Halaman berbeda yang diakses setelah `previous` (+1 untuk halaman ini)
+                distance = len(last_access) - markers.prefix_sum(previous) + 1
+                histogram[distance] += 1
+                markers.add(previous, -1)
+            markers.add(time, 1)
+            last_access[key] = time
+
+        # Potong histogram hingga jumlah halaman berbeda
+        self.distinct_pages = len(last_access)
+        self.stack_distance_histogram = histogram[:self.distinct_pages + 1]
+
+    def lru_hit_counts(self, max_frames: int | None = None) -> list[int]:
+        """
+        Jumlah hit LRU untuk setiap ukuran memori.
+
+        Returns:
+            list[int]: Elemen ke-c adalah jumlah hit dengan c frame (c = 0..max_frames).
+        """
+        if max_frames is None:
+            max_frames = self.distinct_pages
+        histogram = self.stack_distance_histogram
+        hits = [0] * (max_frames + 1)
+        running = 0
+        for frames in range(1, max_frames + 1):
+            if frames < len(histogram):
+                running += histogram[frames]
+            hits[frames] = running
+        return hits
+
+    def lru_hit_ratio_curve(self, max_frames: int | None = None) -> list[float]:
+        """
+        Kurva hit ratio LRU vs jumlah frame, dihitung dari satu lintasan trace.
+
+        Returns:
+            list[float]: Elemen ke-c adalah hit ratio dengan c frame (0.0 hingga 1.0).
+        """
+        total = len(self.trace)
+        if total == 0:
+            return [0.0] * ((max_frames or 0) + 1)
+        return [hits / total for hits in self.lru_hit_counts(max_frames)]
+
+    def fifo_hit_counts(self, frame_counts) -> dict[int, int]:
+        """
+        Jumlah hit FIFO untuk ukuran memori tertentu.
+
+        FIFO tidak memiliki sifat inklusi seperti LRU (lihat anomali Belady),
+        sehingga setiap ukuran disimulasikan terpisah dengan biaya O(panjang trace).
+        """
+        results = {}
+        for frames in frame_counts:
+            resident = set()
+            queue = deque()
+            hits = 0
+            for key in self.trace:
+                if key in resident:
+                    hits += 1
+                    continue
+                if frames <= 0:
+                    continue
+                if len(queue) >= frames:
+                    resident.discard(queue.popleft())
+                queue.append(key)
+                resident.add(key)
+            results[frames] = hits
+        return results
+
+    def fifo_hit_ratios(self, frame_counts) -> dict[int, float]:
+        """Hit ratio FIFO (0.0 hingga 1.0) untuk ukuran memori tertentu."""
+        total = len(self.trace)
+        return {frames: (hits / total if total else 0.0)
+                for frames, hits in self.fifo_hit_counts(frame_counts).items()}
+
+    def __repr__(self) -> str:
+        return (f"TraceAnalyzer(accesses={len(self.trace)}, distinct_pages={self.distinct_pages}, "
+                f"cold_misses={self.cold_misses})")
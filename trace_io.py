@@ -0,0 +1,289 @@
+# File: trace_io.py
+# Deskripsi: Format trace biner untuk merekam dan memutar ulang aliran akses
+# memori (process_id, halaman, tick, hasil). Record berukuran tetap ditulis
+# lewat buffer besar, dibaca kembali lewat mmap + memoryview per potongan, dan
+# dapat diimpor dari file JSONL/CSV.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+import csv
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import groupby
+from operator import and_
+
+from memory_manager import MemoryManager
+
+# Header: magic, versi, ukuran record, flags (cadangan), jumlah record, offset tabel nama proses
+TRACE_MAGIC = b"MOSTRACE"
+TRACE_VERSION = 1
+HEADER = struct.Struct('<8sHHIQQ')
+
+# Record: empat uint32 little-endian (tick, indeks proses, halaman, flags)
+RECORD = struct.Struct('<IIII')
+RECORD_WORDS = 4
+MAX_FIELD_VALUE = 0xFFFFFFFF
+
+# Bit pada kolom flags
+FLAG_HIT = 1
+FLAG_FAULT = 2
+FLAG_WRITE = 4
+
+
+class TraceWriter:
+    """
+    Menulis trace biner. Record dikemas langsung ke buffer bytearray berukuran
+    tetap (tanpa objek per record) dan ditulis ke file setiap kali buffer penuh.
+    Jumlah record dan tabel nama proses ditulis saat `close()`.
+    """
+    def __init__(self, path: str, buffer_records: int = 65536):
+        """
+        Args:
+            path (str): Lokasi file trace (ditimpa jika sudah ada).
+            buffer_records (int): Jumlah record yang ditampung sebelum ditulis ke file.
+        """
+        if buffer_records <= 0:
+            raise ValueError("Ukuran buffer trace harus lebih besar dari 0")
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(bytes(HEADER.size))  # Diisi ulang saat close()
+        self._buffer = bytearray(buffer_records * RECORD.size)
+        self._offset = 0
+        self._process_index = {}  # {process_id: indeks di tabel nama}
+        self.record_count = 0
+
+    def write(self, process_id: str, page_number: int, tick: int = 0, hit: bool | None = None,
+              is_write: bool = False):
+        """
+        Menambahkan satu record.
+
+        Args:
+            hit (bool | None): Hasil akses (True = HIT, False = FAULT, None = tidak diketahui).
+        """
+        index = self._process_index.get(process_id)
+        if index is None:
+            index = self._process_index[process_id] = len(self._process_index)
+        if not (0 <= tick <= MAX_FIELD_VALUE and 0 <= page_number <= MAX_FIELD_VALUE):
+            raise ValueError("Tick dan nomor halaman trace harus berada di rentang uint32")
+        flags = 0 if hit is None else FLAG_HIT if hit else FLAG_FAULT
+        if is_write:
+            flags |= FLAG_WRITE
+        if self._offset == len(self._buffer):
+            self._flush()
+        RECORD.pack_into(self._buffer, self._offset, tick, index, page_number, flags)
+        self._offset += RECORD.size
+        self.record_count += 1
+
+    def write_batch(self, process_id: str, page_numbers, start_tick: int = 0, status=None):
+        """
+        Menambahkan banyak akses satu proses pada tick berurutan, mis. hasil
+        `MemoryManager.access_many(..., record_status=True)` (status 1 = HIT, 0 = FAULT).
+        """
+        write = self.write
+        if status is None:
+            for offset, page_number in enumerate(page_numbers):
+                write(process_id, page_number, start_tick + offset)
+        else:
+            for offset, (page_number, hit) in enumerate(zip(page_numbers, status)):
+                write(process_id, page_number, start_tick + offset, hit=bool(hit))
+
+    def _flush(self):
+        if self._offset:
+            self._file.write(memoryview(self._buffer)[:self._offset])
+            self._offset = 0
+
+    def close(self):
+        """Menulis sisa buffer, tabel nama proses, dan header final."""
+        if self._file.closed:
+            return
+        self._flush()
+        names_offset = HEADER.size + self.record_count * RECORD.size
+        names = sorted(self._process_index, key=self._process_index.get)
+        self._file.write("\n".join(names).encode("utf-8"))
+        self._file.seek(0)
+        self._file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD.size, 0,
+                                     self.record_count, names_offset))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class TraceReader:
+    """
+    Membaca trace biner lewat mmap. Record tidak pernah dimuat seluruhnya:
+    iterasi dan replay bekerja per potongan `chunk_records` record, dan setiap
+    potongan dibaca sebagai memoryview uint32 langsung di atas halaman mmap.
+    """
+    def __init__(self, path: str, chunk_records: int = 65536):
+        """
+        Args:
+            path (str): Lokasi file trace.
+            chunk_records (int): Jumlah record per potongan saat iterasi/replay.
+        """
+        if chunk_records <= 0:
+            raise ValueError("Ukuran potongan trace harus lebih besar dari 0")
+        self.path = path
+        self.chunk_records = chunk_records
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError(f"File {path} bukan trace MicroOS (header tidak lengkap)")
+        magic, version, record_size, _, record_count, names_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != TRACE_MAGIC or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"File {path} bukan trace MicroOS")
+        if version != TRACE_VERSION:
+            self.close()
+            raise ValueError(f"Versi trace {version} tidak didukung (hanya versi {TRACE_VERSION})")
+        self.record_count = record_count
+        names = self._mmap[names_offset:].decode("utf-8")
+        self.process_ids = names.split("\n") if names else []
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def _chunks(self):
+        """Menghasilkan (jumlah record, memoryview uint32 datar) untuk setiap potongan."""
+        chunk_bytes = self.chunk_records * RECORD.size
+        end = HEADER.size + self.record_count * RECORD.size
+        with memoryview(self._mmap) as view:
+            for start in range(HEADER.size, end, chunk_bytes):
+                stop = min(start + chunk_bytes, end)
+                if sys.byteorder == 'little':
+                    with view[start:stop] as chunk, chunk.cast('I') as words:
+                        yield (stop - start) // RECORD.size, words
+                else:
+                    # Mesin big-endian: salin potongan lalu tukar urutan byte
+                    words = array('I')
+                    words.frombytes(view[start:stop])
+                    words.byteswap()
+                    yield (stop - start) // RECORD.size, words
+
+    def __iter__(self):
+        """Iterasi record sebagai tuple (process_id, halaman, tick, hit atau None, is_write)."""
+        process_ids = self.process_ids
+        for count, words in self._chunks():
+            for i in range(0, count * RECORD_WORDS, RECORD_WORDS):
+                flags = words[i + 3]
+                hit = True if flags & FLAG_HIT else False if flags & FLAG_FAULT else None
+                yield process_ids[words[i + 1]], words[i + 2], words[i], hit, bool(flags & FLAG_WRITE)
+
+    def reference_trace(self) -> list[tuple[str, int]]:
+        """Urutan (process_id, halaman) lengkap, mis. untuk reference_trace algoritma OPT."""
+        process_ids = self.process_ids
+        trace = []
+        for _, words in self._chunks():
+            trace.extend(zip(map(process_ids.__getitem__, words[1::RECORD_WORDS]), words[2::RECORD_WORDS]))
+        return trace
+
+    def replay(self, memory_manager: MemoryManager, processes: dict | None = None) -> dict:
+        """
+        Memutar ulang trace ke MemoryManager. Akses berurutan milik proses yang
+        sama dikirim sebagai satu panggilan `access_many`; akses tulis memakai
+        `access_page(is_write=True)` agar dirty bit tetap tercatat.
+
+        Args:
+            memory_manager (MemoryManager): Tujuan replay (policy apa pun).
+            processes (dict | None): {process_id: Process}. Default: proses yang
+                terdaftar di `memory_manager`.
+
+        Returns:
+            dict: {"accesses", "hits", "faults", "matches"}; "matches" adalah jumlah
+            akses yang hasilnya sama dengan hasil yang terekam di trace.
+        """
+        processes = memory_manager.processes if processes is None else processes
+        targets = []
+        for process_id in self.process_ids:
+            process = processes.get(process_id)
+            if process is None:
+                raise ValueError(f"Proses {process_id} pada trace tidak terdaftar di MemoryManager")
+            targets.append(process)
+
+        access_many = memory_manager.access_many
+        access_page = memory_manager.access_page
+        hits = faults = matches = 0
+        for _, words in self._chunks():
+            indexes = words[1::RECORD_WORDS]
+            pages = words[2::RECORD_WORDS]
+            flags = words[3::RECORD_WORDS]
+            position = 0
+            # Potongan dibagi menjadi run akses berurutan milik proses yang sama (groupby di level C)
+            for index, run in groupby(indexes):
+                end = position + len(list(run))
+                process = targets[index]
+                # Akses tulis memecah run agar dirty bit dicatat lewat access_page
+                writes = [] if max(flags[position:end]) < FLAG_WRITE else \
+                    [i for i in range(position, end) if flags[i] & FLAG_WRITE]
+                for stop in writes + [end]:
+                    if stop > position:
+                        result = access_many(process, pages[position:stop], record_status=True)
+                        hits += result["hits"]
+                        faults += result["faults"]
+                        # FLAG_FAULT >> status: FLAG_HIT untuk hit (1) dan FLAG_FAULT untuk fault (0)
+                        matches += sum(map(bool, map(and_, map(FLAG_FAULT.__rshift__, result["status"]),
+                                                     flags[position:stop])))
+                    if stop < end:
+                        hit = access_page(process, pages[stop], is_write=True)["status"] == "HIT"
+                        hits += hit
+                        faults += not hit
+                        matches += flags[stop] & (FLAG_FAULT >> hit) != 0
+                    position = stop + 1
+                position = end
+        return {"accesses": hits + faults, "hits": hits, "faults": faults, "matches": matches}
+
+    def close(self):
+        """Menutup mmap. Iterator yang masih aktif harus dihabiskan atau dibuang lebih dulu."""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def import_text_trace(source_path: str, trace_path: str, fmt: str | None = None) -> int:
+    """
+    Mengonversi trace teks (JSONL: satu objek per baris, atau CSV dengan header)
+    menjadi trace biner.
+
+    Kolom yang dikenali: "process_id" (atau "pid"), "page_number" (atau "page"),
+    "tick" (opsional, default nomor baris), "outcome" ("HIT"/"FAULT", opsional),
+    dan "is_write" (opsional).
+
+    Args:
+        fmt (str | None): 'JSONL' atau 'CSV'. Default: ditebak dari ekstensi file.
+
+    Returns:
+        int: Jumlah record yang ditulis.
+    """
+    fmt = (fmt or ('CSV' if source_path.lower().endswith('.csv') else 'JSONL')).upper()
+    if fmt not in ('JSONL', 'CSV'):
+        raise ValueError("Format trace teks harus 'JSONL' atau 'CSV'")
+
+    with open(source_path, newline='', encoding='utf-8') as source, TraceWriter(trace_path) as writer:
+        if fmt == 'CSV':
+            rows = csv.DictReader(source)
+        else:
+            rows = (json.loads(line) for line in source if line.strip())
+        for line_number, row in enumerate(rows):
+            process_id = row.get("process_id", row.get("pid"))
+            page_number = row.get("page_number", row.get("page"))
+            if process_id is None or page_number in (None, ""):
+                raise ValueError(f"Record {line_number} tidak memiliki process_id/page_number")
+            tick = row.get("tick")
+            outcome = str(row.get("outcome") or "").upper()
+            is_write = row.get("is_write") in (True, 1, "1", "true", "True")
+            writer.write(str(process_id), int(page_number), line_number if tick in (None, "") else int(tick),
+                         hit=True if outcome == "HIT" else False if outcome == "FAULT" else None,
+                         is_write=is_write)
+        return writer.record_count
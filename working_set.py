@@ -0,0 +1,241 @@
+# File: working_set.py
+# Deskripsi: Pelacakan working set (model Denning) dan pengendali beban berbasis
+# Page-Fault Frequency (PFF). Working set setiap proses diperbarui secara
+# inkremental per akses, dan pengendali memakai total working set untuk
+# mendeteksi thrashing serta menyuspend/me-resume proses lewat CPUScheduler.
+# Dikerjakan oleh: Tim Struktur Data (Backend)
+
+from array import array
+from collections import deque
+
+from core_models import Process
+from cpu_scheduler import CPUScheduler
+from memory_manager import MemoryManager
+
+
+class _ProcessWindow:
+    """Jendela Δ akses terakhir satu proses: ring halaman + jumlah kemunculan per halaman."""
+    __slots__ = ('ring', 'position', 'filled', 'counts')
+
+    def __init__(self, window: int):
+        self.ring = array('q', bytes(8 * window))
+        self.position = 0
+        self.filled = 0
+        self.counts = {}  # {halaman: jumlah kemunculan di dalam jendela}
+
+
+class WorkingSetTracker:
+    """
+    Working set W(t, Δ): himpunan halaman yang diakses proses dalam Δ akses
+    terakhirnya (waktu virtual proses).
+
+    Ring buffer menyimpan urutan Δ halaman terakhir, jadi halaman yang keluar
+    dari jendela diketahui langsung dari posisi ring tanpa memindai riwayat.
+    Setiap akses bernilai O(1): satu halaman masuk, paling banyak satu keluar.
+    Total ukuran working set semua proses juga dijaga secara inkremental.
+    """
+    def __init__(self, window: int = 100):
+        """
+        Args:
+            window (int): Ukuran jendela Δ (jumlah akses per proses).
+        """
+        if window <= 0:
+            raise ValueError("Ukuran jendela working set harus lebih besar dari 0")
+        self.window = window
+        self._windows = {}  # {process_id: _ProcessWindow}
+        self.total_size = 0
+
+    def record(self, process_id: str, page_number: int):
+        """Mencatat satu akses halaman oleh proses."""
+        state = self._windows.get(process_id)
+        if state is None:
+            state = self._windows[process_id] = _ProcessWindow(self.window)
+        counts = state.counts
+        position = state.position
+
+        if state.filled == self.window:
+            # Halaman tertua keluar dari jendela
+            expired = state.ring[position]
+            remaining = counts[expired] - 1
+            if remaining:
+                counts[expired] = remaining
+            else:
+                del counts[expired]
+                self.total_size -= 1
+        else:
+            state.filled += 1
+
+        state.ring[position] = page_number
+        state.position = position + 1 if position + 1 < self.window else 0
+        if page_number in counts:
+            counts[page_number] += 1
+        else:
+            counts[page_number] = 1
+            self.total_size += 1
+
+    def size(self, process_id: str) -> int:
+        """Ukuran working set proses (jumlah halaman berbeda di jendela)."""
+        state = self._windows.get(process_id)
+        return len(state.counts) if state is not None else 0
+
+    def working_set(self, process_id: str) -> set[int]:
+        """Salinan himpunan halaman working set proses."""
+        state = self._windows.get(process_id)
+        return set(state.counts) if state is not None else set()
+
+    def remove(self, process_id: str):
+        """Menghapus proses (mis. saat selesai) dari pelacakan."""
+        state = self._windows.pop(process_id, None)
+        if state is not None:
+            self.total_size -= len(state.counts)
+
+
+class PFFController:
+    """
+    Pengendali beban berbasis Page-Fault Frequency.
+
+    Setiap `check_interval` detik:
+    - Alokasi frame target tiap proses disesuaikan dari fault rate-nya selama
+      interval: di atas `upper_threshold` ditambah, di bawah `lower_threshold` dikurangi.
+      Pada replacement 'LOCAL', alokasi ini dipasang sebagai kuota frame MemoryManager.
+    - Jika total working set proses aktif melebihi `total_frames`, sistem dianggap
+      thrashing. Dengan `load_control`, proses dengan working set terbesar
+      disuspend sampai total working set muat kembali.
+    - Proses yang disuspend di-resume (urutan FIFO) begitu working set-nya muat,
+      atau jika tidak ada lagi proses aktif.
+    Episode thrashing (awal, akhir, puncak working set, fault rate) dicatat;
+    akhir None berarti episode masih berlangsung saat simulasi berhenti.
+    """
+    def __init__(self, scheduler: CPUScheduler, memory_manager: MemoryManager, window: int = 100,
+                 check_interval: int = 50, upper_threshold: float = 0.2, lower_threshold: float = 0.02,
+                 allocation_step: int = 1, load_control: bool = True):
+        """
+        Args:
+            scheduler (CPUScheduler): Penjadwal yang dipakai untuk suspend/resume.
+            memory_manager (MemoryManager): Sumber jumlah frame fisik.
+            window (int): Ukuran jendela working set Δ.
+            check_interval (int): Periode evaluasi (detik simulasi).
+            upper_threshold (float): Fault rate di atas nilai ini menambah alokasi frame.
+            lower_threshold (float): Fault rate di bawah nilai ini mengurangi alokasi frame.
+            allocation_step (int): Besar perubahan alokasi per evaluasi.
+            load_control (bool): False = hanya mendeteksi dan mencatat, tanpa suspend.
+        """
+        if check_interval <= 0:
+            raise ValueError("Interval evaluasi harus lebih besar dari 0")
+        if not 0 <= lower_threshold <= upper_threshold:
+            raise ValueError("Ambang PFF harus 0 <= lower_threshold <= upper_threshold")
+        self.scheduler = scheduler
+        self.memory_manager = memory_manager
+        self.total_frames = memory_manager.physical_memory.size
+        self.tracker = WorkingSetTracker(window)
+        self.check_interval = check_interval
+        self.upper_threshold = upper_threshold
+        self.lower_threshold = lower_threshold
+        self.allocation_step = allocation_step
+        self.load_control = load_control
+        self.next_check = check_interval
+
+        # Alokasi frame target per proses, awalnya dibagi rata
+        share = max(1, self.total_frames // max(1, len(scheduler.processes)))
+        self.allocations = {p.process_id: share for p in scheduler.processes}
+
+        # Akses dan fault selama interval berjalan: {process_id: [akses, fault]}
+        self._interval_counts = {}
+        self._suspend_order = deque()  # Proses yang disuspend, urutan FIFO untuk resume
+        self.suspensions = 0
+        self.resumptions = 0
+        self.thrashing_episodes = []  # {"start", "end", "peak_working_set", "fault_rate"}
+        self._open_episode = None
+
+    def on_access(self, process: Process, page_number: int, faulted: bool):
+        """Dipanggil SimulationEngine untuk setiap akses memori."""
+        self.tracker.record(process.process_id, page_number)
+        counts = self._interval_counts.get(process.process_id)
+        if counts is None:
+            counts = self._interval_counts[process.process_id] = [0, 0]
+        counts[0] += 1
+        counts[1] += faulted
+
+    def on_exit(self, process: Process):
+        """Dipanggil saat proses selesai: working set-nya tidak lagi dihitung."""
+        self.tracker.remove(process.process_id)
+
+    def _active_processes(self) -> list[Process]:
+        return [p for p in self.scheduler.processes
+                if p.status != 'terminated' and p not in self.scheduler.suspended
+                and p.arrival_time <= self.scheduler.current_time]
+
+    def active_working_set(self) -> int:
+        """Total working set proses yang aktif (tidak selesai dan tidak disuspend)."""
+        return sum(self.tracker.size(p.process_id) for p in self._active_processes())
+
+    def evaluate(self, now: int):
+        """Evaluasi periodik PFF, deteksi thrashing, dan load control."""
+        self.next_check = (now // self.check_interval + 1) * self.check_interval
+
+        # 1. Penyesuaian alokasi berdasarkan fault rate per proses
+        total_accesses = total_faults = 0
+        for process_id, (accesses, faults) in self._interval_counts.items():
+            total_accesses += accesses
+            total_faults += faults
+            fault_rate = faults / accesses
+            if fault_rate > self.upper_threshold:
+                self.allocations[process_id] = min(self.total_frames,
+                                                   self.allocations.get(process_id, 0) + self.allocation_step)
+            elif fault_rate < self.lower_threshold:
+                self.allocations[process_id] = max(1, self.allocations.get(process_id, 1) - self.allocation_step)
+        self._interval_counts = {}
+        if self.memory_manager.replacement_scope == 'LOCAL':
+            self.memory_manager.set_frame_quotas(self.allocations)
+        interval_fault_rate = total_faults / total_accesses if total_accesses else 0.0
+
+        # 2. Deteksi episode thrashing
+        demand = self.active_working_set()
+        if demand > self.total_frames:
+            if self._open_episode is None:
+                self._open_episode = {"start": now, "end": None, "peak_working_set": demand,
+                                      "fault_rate": interval_fault_rate}
+                self.thrashing_episodes.append(self._open_episode)
+            else:
+                self._open_episode["peak_working_set"] = max(self._open_episode["peak_working_set"], demand)
+                self._open_episode["fault_rate"] = max(self._open_episode["fault_rate"], interval_fault_rate)
+        elif self._open_episode is not None:
+            self._open_episode["end"] = now
+            self._open_episode = None
+
+        if not self.load_control:
+            return
+
+        # 3. Load control: suspend proses dengan working set terbesar selama permintaan berlebih
+        active = self._active_processes()
+        while demand > self.total_frames and len(active) > 1:
+            victim = max(active, key=lambda p: (self.tracker.size(p.process_id), p.pid))
+            active.remove(victim)
+            demand -= self.tracker.size(victim.process_id)
+            self.scheduler.suspend(victim)
+            self._suspend_order.append(victim)
+            self.suspensions += 1
+
+        # 4. Resume proses yang working set-nya muat (atau jika tidak ada proses aktif)
+        while self._suspend_order:
+            candidate = self._suspend_order[0]
+            candidate_size = self.tracker.size(candidate.process_id)
+            if active and demand + candidate_size > self.total_frames:
+                break
+            self._suspend_order.popleft()
+            self.scheduler.resume(candidate)
+            active.append(candidate)
+            demand += candidate_size
+            self.resumptions += 1
+
+    def has_suspended(self) -> bool:
+        return bool(self._suspend_order)
+
+    def report(self) -> dict:
+        """Ringkasan aktivitas pengendali."""
+        return {
+            "thrashing_episodes": [dict(episode) for episode in self.thrashing_episodes],
+            "suspensions": self.suspensions,
+            "resumptions": self.resumptions,
+            "allocations": dict(self.allocations),
+        }